@@ -24,11 +24,16 @@ __version__ = "0.24.0"
 
 
 async def get_github_client(github_app, account):
-    """Get GitHub Client by Account."""
-    github_app_installations = await github_app.get_installations()
-    target_github_app_installation = next(
-        (i for n, i in github_app_installations.items() if i._metadata.account["login"] == account),
-        None,
-    )
-
-    return target_github_app_installation.get_github_api_client()
+    """Get GitHub Client by Account.
+
+    The installation is looked up in the installation index, the client uses its cached access token.
+    """
+    from aicoe.sesheta.installations import get_installation_index
+
+    index = get_installation_index()
+
+    installation = await index.get(github_app, account)
+    if installation is None:
+        raise LookupError(f"the GitHub App is not installed into {account}")
+
+    return index.client(installation.id, installation.installation)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Everything needed to decide on the 'local/check' gate of a Pull Request, in one GraphQL query."""
+
+
+import logging
+import typing
+
+from aicoe.sesheta.actions.common import reviewers_for_paths
+from aicoe.sesheta.actions.label import is_do_not_merge_label
+from aicoe.sesheta.codeowners_cache import get_codeowners_cache
+from aicoe.sesheta.github_cache import get_installation_client
+from aicoe.sesheta.pr_store import parse_pull_request_url
+from aicoe.sesheta.status_index import get_commit_status_index
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECK_GATE_CONTEXT = "local/check"
+
+CHECK_GATE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      databaseId
+      number
+      title
+      url
+      author {
+        login
+      }
+      labels(first: 100) {
+        nodes {
+          name
+        }
+      }
+      reviewRequests(first: 100) {
+        nodes {
+          requestedReviewer {
+            ... on User {
+              login
+            }
+            ... on Team {
+              slug
+            }
+          }
+        }
+      }
+      files(first: 100) {
+        nodes {
+          path
+        }
+      }
+      headRefOid
+      commits(last: 1) {
+        nodes {
+          commit {
+            oid
+            status {
+              contexts {
+                context
+                state
+                createdAt
+              }
+            }
+          }
+        }
+      }
+    }
+    codeowners: object(expression: "HEAD:.github/CODEOWNERS") {
+      ... on Blob {
+        oid
+        text
+      }
+    }
+  }
+}
+"""
+
+
+class CheckGateError(Exception):
+    """The GraphQL query for the check gate failed."""
+
+
+class CheckGateState(typing.NamedTuple):
+    """The state of a Pull Request relevant to the 'local/check' gate."""
+
+    owner: str
+    repo: str
+    pull_request: dict
+    labels: typing.List[str]
+    requested_reviewers: typing.List[str]
+    changed_files: typing.List[str]
+    head_sha: str
+    statuses: typing.Dict[str, str]
+    codeowners: typing.Optional[str]
+    codeowners_sha: typing.Optional[str]
+
+    @property
+    def do_not_merge(self) -> bool:
+        """Check if the Pull Request has any of the DNM labels."""
+        return any(is_do_not_merge_label(label) for label in self.labels)
+
+    @property
+    def gate_passed(self) -> bool:
+        """Check if the head commit of the Pull Request has passed the 'local/check' gate.
+
+        The commit status index holds the latest of the state queried and the states of the webhooks.
+        """
+        state = get_commit_status_index().get(f"{self.owner}/{self.repo}", self.head_sha, CHECK_GATE_CONTEXT)
+        return (state or self.statuses.get(CHECK_GATE_CONTEXT)) == "success"
+
+    @property
+    def reviewers(self) -> typing.List[str]:
+        """Conclude on the Reviewers owning the files changed by the Pull Request, CODEOWNERS are parsed once per blob.
+
+        Only the first 100 files changed are taken into account.
+        """
+        codeowners = get_codeowners_cache().put(f"{self.owner}/{self.repo}", self.codeowners_sha, self.codeowners)
+        return reviewers_for_paths(self.owner, self.repo, codeowners, self.changed_files or (".",))
+
+
+def _to_check_gate_state(owner: str, repo: str, repository: dict) -> CheckGateState:
+    """Convert the query result, the Pull Request is shaped like the one of the REST API."""
+    pr = repository["pullRequest"]
+
+    requested_reviewers = []
+    for request in pr["reviewRequests"]["nodes"]:
+        reviewer = request.get("requestedReviewer") or {}
+        if reviewer.get("login"):
+            requested_reviewers.append(reviewer["login"])
+
+    contexts = []
+    for commit in pr["commits"]["nodes"]:
+        if commit["commit"]["oid"] == pr["headRefOid"] and commit["commit"]["status"] is not None:
+            contexts = commit["commit"]["status"]["contexts"]
+
+    get_commit_status_index().update_from_status_contexts(f"{owner}/{repo}", pr["headRefOid"], contexts)
+    statuses = {c["context"]: c["state"].lower() for c in contexts}
+
+    labels = [label["name"] for label in pr["labels"]["nodes"]]
+    changed_files = [changed_file["path"] for changed_file in (pr.get("files") or {}).get("nodes", [])]
+    blob = repository.get("codeowners") or {}
+
+    pull_request = {
+        "id": pr["databaseId"],
+        "number": pr["number"],
+        "title": pr["title"],
+        "html_url": pr["url"],
+        "user": {"login": (pr.get("author") or {}).get("login")},
+        "labels": [{"name": label} for label in labels],
+        "requested_reviewers": [{"login": login} for login in requested_reviewers],
+        "head": {"sha": pr["headRefOid"]},
+    }
+
+    return CheckGateState(
+        owner,
+        repo,
+        pull_request,
+        labels,
+        requested_reviewers,
+        changed_files,
+        pr["headRefOid"],
+        statuses,
+        blob.get("text"),
+        blob.get("oid"),
+    )
+
+
+async def get_check_gate_state(pr_url: str, github_api=None) -> CheckGateState:
+    """Get everything needed to decide on the check gate of the Pull Request in one round-trip."""
+    owner, repo, number = parse_pull_request_url(pr_url)
+
+    if github_api is None:
+        github_api = get_installation_client()
+
+    # the GraphQL endpoint is POSTed to like any other, so that the client's token is used
+    response = await github_api.post(
+        "/graphql",
+        data={"query": CHECK_GATE_QUERY, "variables": {"owner": owner, "name": repo, "number": number}},
+    )
+
+    if response.get("errors") or not (response.get("data") or {}).get("repository"):
+        raise CheckGateError(f"querying the check gate of {pr_url} failed: {response.get('errors')}")
+
+    repository = response["data"]["repository"]
+    if repository.get("pullRequest") is None:
+        raise CheckGateError(f"{pr_url} not found")
+
+    return _to_check_gate_state(owner, repo, repository)
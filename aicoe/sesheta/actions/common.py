@@ -20,21 +20,20 @@
 
 
 import asyncio
-import os
 import logging
 import typing
-import base64
 
 import gidgethub
-import aiohttp
 
 from functools import wraps
 
-from octomachinery.github.api.tokens import GitHubOAuthToken
-from octomachinery.github.api.raw_client import RawGitHubAPI
 from octomachinery.app.runtime.context import RUNTIME_CONTEXT
 from codeowners import CodeOwners
 
+from aicoe.sesheta.codeowners_cache import get_codeowners_cache
+from aicoe.sesheta.github_cache import get_installation_client
+from aicoe.sesheta.github_pool import get_github_pool
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,103 +56,115 @@ def unpack(s):
     return " ".join(map(str, s))  # map(), just for kicks
 
 
-async def conclude_reviewer_list(owner: str = None, repo: str = None) -> typing.List[str]:
-    """Conclude on a set of Reviewers (their GitHub user id) that could be assigned to a Pull Request."""
+def reviewers_for_paths(
+    owner: str, repo: str, codeowners: typing.Optional[CodeOwners], paths: typing.Iterable[str] = (".",),
+) -> typing.List[str]:
+    """Conclude on the Reviewers owning any of the paths, or some sane defaults if the repository has no CODEOWNERS."""
     reviewers = []
-    github_api = None
 
+    if codeowners is not None:
+        for path in paths:
+            for owner in codeowners.of(path):
+                reviewer = owner[1][1:]  # remove the @
+                if reviewer not in reviewers:
+                    reviewers.append(reviewer)
+
+        return reviewers
+
+    if owner.lower() == "thoth-station":
+        reviewers.append("fridex")
+        reviewers.append("pacospace")
+    if "prometheus" in repo.lower():
+        reviewers.append("4n4nd")
+        reviewers.append("MichaelClifford")
+    if "log-" in repo.lower():
+        reviewers.append("zmhassan")
+        reviewers.append("4n4nd")
+
+    return reviewers
+
+
+async def get_changed_files(pr_url: str, github_api=None) -> typing.List[str]:
+    """Get the paths of the files changed by the Pull Request, the first 100 like the check gate query does."""
+    if github_api is None:
+        github_api = get_installation_client()
+
+    files = await github_api.getitem(f"{pr_url}/files?per_page=100")
+
+    return [changed_file["filename"] for changed_file in files]
+
+
+async def conclude_reviewer_list(
+    owner: str = None, repo: str = None, paths: typing.Iterable[str] = (".",),
+) -> typing.List[str]:
+    """Conclude on a set of Reviewers (their GitHub user id) that could be assigned to a Pull Request.
+
+    The CODEOWNERS of the repository are taken from the cache, and only downloaded if it does not know them.
+    """
     if owner is None or repo is None:
         return None
 
     try:
-        github_api = RUNTIME_CONTEXT.app_installation_client
+        github_api = get_installation_client()
     except Exception:
-        access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
-        github_api = RawGitHubAPI(access_token, user_agent="sesheta-actions")
+        github_api = get_github_pool().client()
 
     try:
-        codeowners = await github_api.getitem(f"/repos/{owner}/{repo}/contents/.github/CODEOWNERS")
-        codeowners_content = base64.b64decode(codeowners["content"]).decode("utf-8")
-
-        code_owner = CodeOwners(codeowners_content)
-        for owner in code_owner.of("."):
-            reviewers.append(owner[1][1:])  # remove the @
-
-    except gidgethub.HTTPException as http_exception:  # if there is no CODEOWNERS, lets have some sane defaults
-        if http_exception.status_code == 404:
-            if owner.lower() == "thoth-station":
-                reviewers.append("fridex")
-                reviewers.append("pacospace")
-            if "prometheus" in repo.lower():
-                reviewers.append("4n4nd")
-                reviewers.append("MichaelClifford")
-            if "log-" in repo.lower():
-                reviewers.append("zmhassan")
-                reviewers.append("4n4nd")
-        else:
-            _LOGGER.error(http_exception)
-            return None
-
-    except Exception as err:  # on any other Error, we can not generate a reviewers list
+        codeowners = await get_codeowners_cache().fetch(owner, repo, github_api)
+    except Exception as err:  # on any Error, we can not generate a reviewers list
         _LOGGER.error(str(err))
         return None
 
+    reviewers = reviewers_for_paths(owner, repo, codeowners, paths)
     _LOGGER.debug(f"final reviewers: '{reviewers}'")
 
     return reviewers
 
 
-async def get_master_head_sha(owner: str, repo: str) -> str:
+async def get_master_head_sha(owner: str, repo: str, github_api=None) -> str:
     """Get the SHA of the HEAD of the master."""
-    # TODO refactor this to a class? global variable?
-    access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
+    if github_api is None:
+        github_api = get_github_pool().client()
 
-    async with aiohttp.ClientSession() as client:
-        github_api = RawGitHubAPI(access_token, session=client, user_agent="sesheta-actions")
-        commits = await github_api.getitem(f"/repos/{owner}/{repo}/commits")
+    commits = await github_api.getitem(f"/repos/{owner}/{repo}/commits")
 
-        _LOGGER.debug(f"HEAD commit of {owner}/{repo}: {commits[0]['sha']}")
+    _LOGGER.debug(f"HEAD commit of {owner}/{repo}: {commits[0]['sha']}")
 
-        return commits[0]["sha"]  # FIXME could raise IndexError
+    return commits[0]["sha"]  # FIXME could raise IndexError
 
 
-async def get_pull_request(owner: str, repo: str, pull_request: int) -> dict:
+async def get_pull_request(owner: str, repo: str, pull_request: int, github_api=None) -> dict:
     """Get PR from owner/repo."""
-    access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
-
-    async with aiohttp.ClientSession() as client:
-        github_api = RawGitHubAPI(access_token, session=client, user_agent="sesheta-actions")
+    if github_api is None:
+        github_api = get_github_pool().client()
 
-        _LOGGER.debug(f"getting {owner}/{repo}: PR {pull_request}")
+    _LOGGER.debug(f"getting {owner}/{repo}: PR {pull_request}")
 
-        pr = await github_api.getitem(f"/repos/{owner}/{repo}/pulls/{pull_request}")  # TODO exception handling
+    pr = await github_api.getitem(f"/repos/{owner}/{repo}/pulls/{pull_request}")  # TODO exception handling
 
-        _LOGGER.debug(f"got {owner}/{repo}: PR {pull_request}: {pr}")
+    _LOGGER.debug(f"got {owner}/{repo}: PR {pull_request}: {pr}")
 
-        return pr
+    return pr
 
 
-async def trigger_update_branch(owner: str, repo: str, pull_request: int) -> bool:
+async def trigger_update_branch(owner: str, repo: str, pull_request: int, github_api=None) -> bool:
     """Trigger /update-branch API on Pull Request."""
-    access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
+    if github_api is None:
+        github_api = get_github_pool().client()
 
-    async with aiohttp.ClientSession() as client:
-        github_api = RawGitHubAPI(access_token, session=client, user_agent="sesheta")
-
-        try:
-            if github_api.is_initialized:
-                triggered = await github_api.put(
-                    f"/repos/{owner}/{repo}/pulls/{pull_request}/update-branch", preview_api_version="lydian", data=b"",
-                )
-
-            _LOGGER.debug(f"rebasing Pull Request {pull_request} in {owner}/{repo} triggered: {triggered}")
+    try:
+        triggered = await github_api.put(
+            f"/repos/{owner}/{repo}/pulls/{pull_request}/update-branch", preview_api_version="lydian", data=b"",
+        )
+
+        _LOGGER.debug(f"rebasing Pull Request {pull_request} in {owner}/{repo} triggered: {triggered}")
+        return True
+    except gidgethub.BadRequest as bad_request:
+        _LOGGER.error(f"{bad_request}: on /repos/{owner}/{repo}/pulls/{pull_request}/update-branch")
+        return False
+    except gidgethub.HTTPException as http_exception:
+        if http_exception.status_code == 202:
             return True
-        except gidgethub.BadRequest as bad_request:
-            _LOGGER.error(f"{bad_request}: on /repos/{owner}/{repo}/pulls/{pull_request}/update-branch")
+        else:
+            _LOGGER.error(http_exception)
             return False
-        except gidgethub.HTTPException as http_exception:
-            if http_exception.status_code == 202:
-                return True
-            else:
-                _LOGGER.error(http_exception)
-                return False
@@ -19,18 +19,20 @@
 """Sesheta's actions."""
 
 
-import os
 import logging
+import typing
 
 from datetime import datetime
 
-import aiohttp
 import gidgethub
 
-from octomachinery.github.api.tokens import GitHubOAuthToken
-from octomachinery.github.api.raw_client import RawGitHubAPI
 from octomachinery.app.runtime.context import RUNTIME_CONTEXT
 
+from aicoe.sesheta.actions.snapshot import get_pull_request_snapshot
+from aicoe.sesheta.github_cache import get_installation_client
+from aicoe.sesheta.github_pool import get_github_pool
+from aicoe.sesheta.pr_store import parse_pull_request_url
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +69,29 @@ DEFAULT_LABELS = [
     {"name": "test/flake", "color": "f3ccff", "description": "A test flake."},
 ]
 
+LABEL_IDS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      id
+    }
+    labels(first: 100, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        id
+        name
+      }
+    }
+  }
+}
+"""
+
+# the node ids of the labels by lower-cased name, per repository
+_LABEL_IDS = {}
+
 DEFAULT_MILESTONES_THOTH = [
     {"title": "v0.6.0", "description": "Tracking Milestone for v0.6.0", "due_on": "2020-05-29T19:00:00Z"},
     {"title": "v0.7.0", "description": "Security Indicator Aggregation", "due_on": "2020-06-30T23:00:00Z"},
@@ -88,97 +113,241 @@ DEFAULT_MILESTONES_THOTH = [
 ]
 
 
-async def create_or_update_milestone(slug: str, title: str, description: str, state: str = "open", due_on: str = None):
+async def create_or_update_milestone(
+    slug: str, title: str, description: str, state: str = "open", due_on: str = None, github_api=None,
+):
     """Create or update the Milestone in the given repository."""
-    access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
-
-    async with aiohttp.ClientSession() as client:
-        github_api = RawGitHubAPI(access_token, session=client, user_agent="sesheta-actions")
+    if github_api is None:
+        github_api = get_github_pool().client()
 
-        # prepare a milestone
-        milestone_data = {"title": title, "description": description, "state": state}
+    # prepare a milestone
+    milestone_data = {"title": title, "description": description, "state": state}
 
-        if due_on is not None:
-            milestone_data["due_on"] = due_on
+    if due_on is not None:
+        milestone_data["due_on"] = due_on
 
-            due_on_datetime = datetime.strptime(due_on, "%Y-%m-%dT%H:%M:%SZ")
+        due_on_datetime = datetime.strptime(due_on, "%Y-%m-%dT%H:%M:%SZ")
 
-            if due_on_datetime < datetime.utcnow():
-                _LOGGER.info(f"Milestone '{title}' has a due date in the past... skipping!")
-                return
+        if due_on_datetime < datetime.utcnow():
+            _LOGGER.info(f"Milestone '{title}' has a due date in the past... skipping!")
+            return
 
-        try:
-            # and see if it exists
-            _LOGGER.debug("checking %s for %s", slug, title)
+    try:
+        # and see if it exists
+        _LOGGER.debug("checking %s for %s", slug, title)
 
-            async for milestone in github_api.getiter(f"/repos/{slug}/milestones"):
-                _LOGGER.debug("found %s: %s", slug, milestone)
+        async for milestone in github_api.getiter(f"/repos/{slug}/milestones"):
+            _LOGGER.debug("found %s: %s", slug, milestone)
 
-                if (milestone["title"] == title) and (
-                    (milestone["due_on"] != due_on) or (milestone["description"] != description)
-                ):
-                    _LOGGER.debug("updating %s: %s", slug, milestone_data)
-                    del milestone_data["title"]
-                    await github_api.patch(f"/repos/{slug}/milestones/{milestone['number']}", data=milestone_data)
+            if (milestone["title"] == title) and (
+                (milestone["due_on"] != due_on) or (milestone["description"] != description)
+            ):
+                _LOGGER.debug("updating %s: %s", slug, milestone_data)
+                del milestone_data["title"]
+                await github_api.patch(f"/repos/{slug}/milestones/{milestone['number']}", data=milestone_data)
 
-                    return
+                return
 
-            _LOGGER.debug("creating %s: %s", slug, milestone_data)
-            await github_api.post(f"/repos/{slug}/milestones", data=milestone_data)
+        _LOGGER.debug("creating %s: %s", slug, milestone_data)
+        await github_api.post(f"/repos/{slug}/milestones", data=milestone_data)
 
-        except gidgethub.BadRequest as bad:
-            _LOGGER.error(f"Milestone '{title}', Repo: '{slug}': {bad}")
+    except gidgethub.BadRequest as bad:
+        _LOGGER.error(f"Milestone '{title}', Repo: '{slug}': {bad}")
 
-        return
+    return
 
 
-async def create_or_update_label(slug: str, name: str, color: str = "") -> str:
+async def create_or_update_label(slug: str, name: str, color: str = "", github_api=None) -> str:
     """Create or update the label in the given repository."""
-    access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
+    if github_api is None:
+        github_api = get_github_pool().client()
+
+    try:
+        _LOGGER.debug("get item...")
+        label = await github_api.getitem(f"/repos/{slug}/labels/{name}", preview_api_version="symmetra")
 
-    async with aiohttp.ClientSession() as client:
-        github_api = RawGitHubAPI(access_token, session=client, user_agent="sesheta-actions")
+        if label["color"] != color:
+            _LOGGER.debug("patching item color...")
+            await github_api.patch(
+                f"/repos/{slug}/labels/{name}",
+                preview_api_version="symmetra",
+                data={"new_name": name, "color": color},
+            )
+
+    except gidgethub.BadRequest as bad:
+        _LOGGER.error(f"Label '{name}', Repo: '{slug}': {bad}")
 
         try:
-            _LOGGER.debug("get item...")
-            label = await github_api.getitem(f"/repos/{slug}/labels/{name}", preview_api_version="symmetra")
-
-            if label["color"] != color:
-                _LOGGER.debug("patching item color...")
-                await github_api.patch(
-                    f"/repos/{slug}/labels/{name}",
-                    preview_api_version="symmetra",
-                    data={"new_name": name, "color": color},
-                )
-
-        except gidgethub.BadRequest as bad:
-            _LOGGER.error(f"Label '{name}', Repo: '{slug}': {bad}")
-
-            try:
-                resp = await github_api.post(
-                    f"/repos/{slug}/labels",
-                    preview_api_version="symmetra",
-                    data={"name": name, "color": color},
-                )
-            except gidgethub.BadRequest as created:
-                _LOGGER.info(
-                    f"Label '{name}', Repo: '{slug}': created",
-                )  # TODO maybe this should be a little more robust?
-        return
+            resp = await github_api.post(
+                f"/repos/{slug}/labels",
+                preview_api_version="symmetra",
+                data={"name": name, "color": color},
+            )
+        except gidgethub.BadRequest as created:
+            _LOGGER.info(
+                f"Label '{name}', Repo: '{slug}': created",
+            )  # TODO maybe this should be a little more robust?
+    return
+
+
+class LabelReconcileError(Exception):
+    """The GraphQL query for the labels of a repository failed."""
+
+
+def is_do_not_merge_label(name: str) -> bool:
+    """Check if the label keeps a Pull Request from being merged."""
+    return name.startswith("do-not-merge") or name.startswith("work-in-progress")
 
 
 async def do_not_merge(pr_url: str) -> bool:
     """Check if the given Pull Request has any of the DNM labels."""
     try:
-        github_api = RUNTIME_CONTEXT.app_installation_client
-
-        pr = await github_api.getitem(pr_url)
+        pr = await get_pull_request_snapshot(pr_url)
 
         for label in pr["labels"]:
-            if label["name"].startswith("do-not-merge") or label["name"].startswith("work-in-progress"):
+            if is_do_not_merge_label(label["name"]):
                 return True
 
     except Exception as err:
         _LOGGER.error(str(err))
 
     return False
+
+
+def diff_labels(
+    current: typing.Iterable[str], add: typing.Iterable[str] = (), remove: typing.Iterable[str] = (),
+) -> typing.Optional[typing.Tuple[typing.List[str], typing.List[str]]]:
+    """Compute the labels to actually add and remove, None if that does not change anything."""
+    current = list(current)
+    removed = [label for label in current if label in remove]
+    added = []
+    for label in add:
+        if label not in current and label not in added:
+            added.append(label)
+
+    if not added and not removed:
+        return None
+
+    return added, removed
+
+
+async def _label_ids(
+    github_api, owner: str, repo: str, number: int, names: typing.Iterable[str], node_id: typing.Optional[str],
+) -> typing.Tuple[typing.Optional[str], typing.Dict[str, str]]:
+    """Get the node ids of the Pull Request and of the labels, labels of the repository are resolved once.
+
+    Labels which do not exist in the repository yet are created.
+    """
+    label_ids = _LABEL_IDS.setdefault(f"{owner}/{repo}".lower(), {})
+    after = None
+
+    while node_id is None or any(name.lower() not in label_ids for name in names):
+        response = await github_api.post(
+            "/graphql",
+            data={
+                "query": LABEL_IDS_QUERY,
+                "variables": {"owner": owner, "name": repo, "number": number, "after": after},
+            },
+        )
+
+        if response.get("errors") or not (response.get("data") or {}).get("repository"):
+            raise LabelReconcileError(f"resolving the labels of {owner}/{repo} failed: {response.get('errors')}")
+
+        repository = response["data"]["repository"]
+        node_id = node_id or (repository.get("pullRequest") or {}).get("id")
+
+        labels = repository["labels"]
+        label_ids.update({label["name"].lower(): label["id"] for label in labels["nodes"]})
+
+        if not labels["pageInfo"]["hasNextPage"]:
+            break
+
+        after = labels["pageInfo"]["endCursor"]
+
+    for name in names:
+        if name.lower() not in label_ids:
+            _LOGGER.info(f"creating label '{name}' in {owner}/{repo}")
+            created = await github_api.post(
+                f"/repos/{owner}/{repo}/labels", preview_api_version="symmetra", data={"name": name, "color": "ededed"},
+            )
+            label_ids[name.lower()] = created["node_id"]
+
+    return node_id, label_ids
+
+
+def _reconcile_labels_mutation(added: typing.List[str], removed: typing.List[str]) -> str:
+    """Build one mutation adding and removing labels, the last one returns the resulting labels."""
+    variables = ["$labelable: ID!"]
+    fields = []
+
+    if removed:
+        variables.append("$remove: [ID!]!")
+        fields.append("removed: removeLabelsFromLabelable(input: {labelableId: $labelable, labelIds: $remove})")
+    if added:
+        variables.append("$add: [ID!]!")
+        fields.append("added: addLabelsToLabelable(input: {labelableId: $labelable, labelIds: $add})")
+
+    selections = ["{ clientMutationId }"] * (len(fields) - 1)
+    selections.append("{ labelable { labels(first: 100) { nodes { name } } } }")
+
+    return (
+        f"mutation({', '.join(variables)}) {{\n"
+        + "".join(f"  {field} {selection}\n" for field, selection in zip(fields, selections))
+        + "}"
+    )
+
+
+async def reconcile_labels(
+    pull_request: dict, add: typing.Iterable[str] = (), remove: typing.Iterable[str] = (), github_api=None,
+) -> bool:
+    """Add and remove labels of the Pull Request in one request, return True if the labels have changed.
+
+    The diff is computed against the labels of ``pull_request``, so that labels which are there already
+    are not added again and labels which are not there are not removed. The changes are applied by one
+    GraphQL mutation adding and removing only those labels, so that labels added by someone else in the
+    meantime are kept. The node ids of the labels of a repository are resolved once, by an additional
+    query. The labels of ``pull_request`` are updated.
+    """
+    diff = diff_labels([label["name"] for label in pull_request["labels"]], add, remove)
+    if diff is None:
+        _LOGGER.debug(f"labels of {pull_request['html_url']} are up to date")
+        return False
+
+    added, removed = diff
+
+    if github_api is None:
+        github_api = get_installation_client()
+
+    owner, repo, number = parse_pull_request_url(pull_request["html_url"])
+    _LOGGER.debug(f"adding labels {added} to and removing labels {removed} from {pull_request['html_url']}")
+
+    try:
+        node_id, label_ids = await _label_ids(
+            github_api, owner, repo, number, added + removed, pull_request.get("node_id"),
+        )
+
+        response = await github_api.post(
+            "/graphql",
+            data={
+                "query": _reconcile_labels_mutation(added, removed),
+                "variables": {
+                    "labelable": node_id,
+                    **({"add": [label_ids[label.lower()] for label in added]} if added else {}),
+                    **({"remove": [label_ids[label.lower()] for label in removed]} if removed else {}),
+                },
+            },
+        )
+    except (LabelReconcileError, gidgethub.BadRequest) as err:
+        _LOGGER.error(f"updating labels of {pull_request['html_url']} failed: {err}")
+        return False
+
+    if response.get("errors") or not response.get("data"):
+        _LOGGER.error(f"updating labels of {pull_request['html_url']} failed: {response.get('errors')}")
+        # a label may have been deleted or renamed, resolve them again next time
+        _LABEL_IDS.pop(f"{owner}/{repo}".lower(), None)
+        return False
+
+    result = response["data"]["added" if added else "removed"]
+    pull_request["labels"] = result["labelable"]["labels"]["nodes"]
+
+    return True
@@ -21,27 +21,31 @@
 
 import logging
 
-from datetime import datetime
 from typing import Optional
-import gidgethub
 
 from octomachinery.github.api.tokens import GitHubOAuthToken
 from octomachinery.github.api.raw_client import RawGitHubAPI
 from octomachinery.app.runtime.context import RUNTIME_CONTEXT
 
 from aicoe.sesheta.actions.common import get_master_head_sha, get_pull_request, trigger_update_branch
+from aicoe.sesheta.actions.check_gate import CHECK_GATE_CONTEXT
+from aicoe.sesheta.actions.label import NEEDS_REBASE_LABEL_NAME, reconcile_labels
+from aicoe.sesheta.actions.snapshot import get_pull_request_snapshot
+from aicoe.sesheta.check_runs import get_check_run_manager
+from aicoe.sesheta.github_cache import get_installation_client
+from aicoe.sesheta.recheck import get_mergeability_rechecker
+from aicoe.sesheta.status_index import FINAL_STATES, get_commit_status_index
+from aicoe.sesheta.title_rules import WIP_MARKERS, classify_title
 from aicoe.sesheta.utils import eligible_release_pullrequest, get_release_issue
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def merge_master_into_pullrequest(
-    owner: str, repo: str, pull_request: int, token: str = None, dry_run: bool = False,
-) -> bool:
-    """Merge the master branch into the Pull Request."""
-    triggered = True
-
+async def _merge_master_into_pullrequest_once(
+    owner: str, repo: str, pull_request: int, dry_run: bool = False,
+) -> Optional[bool]:
+    """Merge the master branch into the Pull Request, return None if GitHub does not know if it is rebaseable yet."""
     head_sha = await get_master_head_sha(owner, repo)
     _r = await get_pull_request(owner, repo, pull_request)
 
@@ -50,25 +54,49 @@ async def merge_master_into_pullrequest(
     rebaseable = _r["rebaseable"]
     base_sha = _r["base"]["sha"]
 
-    # TODO if rebaseable is None, we need to come back in a few seconds, github has not finished a background task
+    if rebaseable is None:
+        _LOGGER.debug(f"GitHub has not computed if Pull Request {pull_request} in {owner}/{repo} is rebaseable yet")
+        return None
+
     if rebaseable and (base_sha != head_sha):
         _LOGGER.info(
             f"rebasing Pull Request {pull_request} in {owner}/{repo} into master"
             f", head sha = {head_sha} and pull requests's base sha = {base_sha}",
         )
         if not dry_run:
-            triggered = await trigger_update_branch(owner, repo, pull_request)
+            return await trigger_update_branch(owner, repo, pull_request)
 
-        else:
-            _LOGGER.info("just a dry-run...")
+        _LOGGER.info("just a dry-run...")
     else:
         _LOGGER.info(f"not triggering a rebase, head sha = {head_sha} and pull requests's base sha = {base_sha}")
 
-    return triggered
+    return True
 
 
-async def merge_master_into_pullrequest2(owner: str, repo: str, pull_request: int):
-    """Merge the master branch into the Pull Request."""
+async def merge_master_into_pullrequest(
+    owner: str, repo: str, pull_request: int, token: str = None, dry_run: bool = False,
+) -> bool:
+    """Merge the master branch into the Pull Request.
+
+    If GitHub has not computed if the Pull Request is rebaseable yet, it is re-checked with backoff. Return
+    False if the re-check gave up, or could not be scheduled.
+    """
+    triggered = await _merge_master_into_pullrequest_once(owner, repo, pull_request, dry_run=dry_run)
+
+    if triggered is None:
+        triggered = await get_mergeability_rechecker().schedule(
+            ("merge_master", f"{owner}/{repo}".lower(), pull_request),
+            lambda: _merge_master_into_pullrequest_once(owner, repo, pull_request, dry_run=dry_run),
+        )
+
+        if triggered is None:
+            _LOGGER.error(f"GitHub did not compute if Pull Request {pull_request} in {owner}/{repo} is rebaseable")
+
+    return bool(triggered)
+
+
+async def _update_branch_once(owner: str, repo: str, pull_request: int) -> Optional[bool]:
+    """Update the Pull Request's branch, return None if GitHub does not know if it is rebaseable yet."""
     github_api = RUNTIME_CONTEXT.app_installation_client
     head_sha = await get_master_head_sha(owner, repo)
     _r = await get_pull_request(owner, repo, pull_request)
@@ -78,7 +106,9 @@ async def merge_master_into_pullrequest2(owner: str, repo: str, pull_request: in
 
     _LOGGER.debug(f"head: {head_sha}, base: {base_sha}, rebaseable: {rebaseable}")
 
-    # TODO if rebaseable is None, we need to come back in a few seconds, github has not finished a background task
+    if rebaseable is None:
+        return None
+
     if rebaseable and (base_sha != head_sha):
         _LOGGER.debug(
             f"rebasing Pull Request {pull_request} in {owner}/{repo} into master"
@@ -88,119 +118,92 @@ async def merge_master_into_pullrequest2(owner: str, repo: str, pull_request: in
         await github_api.put(
             f"/repos/{owner}/{repo}/pulls/{pull_request}/update-branch", preview_api_version="lydian", data=b"",
         )
-    else:
-        _LOGGER.debug(f"not triggering a rebase, head sha = {head_sha} and pull requests's base sha = {base_sha}")
+        return True
+
+    _LOGGER.debug(f"not triggering a rebase, head sha = {head_sha} and pull requests's base sha = {base_sha}")
+    return False
+
+
+async def merge_master_into_pullrequest2(owner: str, repo: str, pull_request: int):
+    """Merge the master branch into the Pull Request.
+
+    If GitHub has not computed if the Pull Request is rebaseable yet, it is re-checked in the background.
+    """
+    if await _update_branch_once(owner, repo, pull_request) is None:
+        get_mergeability_rechecker().schedule(
+            ("update_branch", f"{owner}/{repo}".lower(), pull_request),
+            lambda: _update_branch_once(owner, repo, pull_request),
+        )
 
 
 async def needs_size_label(_pull_request: dict = None) -> bool:
     """Add size label to the pull request."""
-    github_api = RUNTIME_CONTEXT.app_installation_client
-    issue_url = _pull_request["issue_url"]
-    pull_request = await github_api.getitem(_pull_request["url"])
+    pull_request = await get_pull_request_snapshot(_pull_request["url"], require=("additions", "deletions"))
 
     needs_size_actual = await is_mergeable(pull_request)
     size_label = calculate_pr_size(pull_request)
     has_size_label = get_pr_size_label(pull_request)
     _LOGGER.debug(f"calculated the size of {pull_request['html_url']} to be: {size_label}")
 
-    if needs_size_actual and not has_size_label:
-        _LOGGER.debug(f"adding '{size_label}' label to {pull_request['html_url']}")
+    if needs_size_actual and size_label is not None and has_size_label != size_label:
+        _LOGGER.debug(f"replacing size label '{has_size_label}' by '{size_label}' on {pull_request['html_url']}")
 
-        try:
-            await github_api.post(f"{issue_url}/labels", preview_api_version="symmetra", data={"labels": [size_label]})
-            return True
-        except gidgethub.BadRequest as err:
-            if err.status_code != 202:
-                _LOGGER.error(str(err))
-    elif needs_size_actual and has_size_label != size_label:
-        _LOGGER.debug(f"removing pervious size label '{has_size_label}' from {pull_request['html_url']}")
-
-        try:
-            has_size_label = has_size_label.replace("/", "%2F")
-            await github_api.delete(f"{issue_url}/labels/{has_size_label}", preview_api_version="symmetra")
-        except gidgethub.BadRequest as err:
-            _LOGGER.info(str(err))
-
-        _LOGGER.debug(f"adding '{size_label}' label to {pull_request['html_url']}")
-
-        try:
-            await github_api.post(f"{issue_url}/labels", preview_api_version="symmetra", data={"labels": [size_label]})
-            return True
-        except gidgethub.BadRequest as err:
-            if err.status_code != 202:
-                _LOGGER.error(str(err))
-    else:
+        return await reconcile_labels(pull_request, add=[size_label], remove=[has_size_label] if has_size_label else [])
 
-        return False
+    return False
 
 
 async def needs_approved_label(_pull_request: dict = None) -> bool:
     """Add a 'approved' label if review approved."""
-    github_api = RUNTIME_CONTEXT.app_installation_client
-    issue_url = _pull_request["issue_url"]
-    pull_request = await github_api.getitem(_pull_request["url"])
+    pull_request = await get_pull_request_snapshot(_pull_request["url"])
 
     _LOGGER.debug(f"checking if {pull_request['html_url']} needs a approved label")
 
-    needs_approved_actual = await is_mergeable(pull_request)
-    has_approved_label = has_label(pull_request, "approved")
-
-    if needs_approved_actual and not has_approved_label:
-        _LOGGER.debug(f"adding 'approved' label to {pull_request['html_url']}")
-
-        try:
-            await github_api.post(f"{issue_url}/labels", preview_api_version="symmetra", data={"labels": ["approved"]})
-            return True
-        except gidgethub.BadRequest as err:
-            if err.status_code != 202:
-                _LOGGER.error(str(err))
-    else:
+    if await is_mergeable(pull_request):
+        return await reconcile_labels(pull_request, add=["approved"])
 
-        return False
+    return False
 
 
-async def needs_rebase_label(_pull_request: dict = None) -> bool:
-    """Add a 'needs-rebase' labels if required."""
-    github_api = RUNTIME_CONTEXT.app_installation_client
-    issue_url = _pull_request["issue_url"]
-    pull_request = await github_api.getitem(_pull_request["url"])
+async def _reconcile_rebase_label(pull_request_url: str) -> Optional[bool]:
+    """Add or remove the 'needs-rebase' label, return None if GitHub does not know if it is mergeable yet."""
+    pull_request = await get_pull_request_snapshot(pull_request_url, require=("mergeable",))
 
     _LOGGER.debug(f"checking if {pull_request['html_url']} needs a rebase label")
 
-    needs_rebase_actual = await is_rebaseable(pull_request)
-    has_rebase_label = has_label(pull_request, "do-not-merge/needs-rebase")
+    if pull_request["mergeable"] is None and not pull_request["merged"]:
+        return None
 
-    if needs_rebase_actual and not has_rebase_label:
-        _LOGGER.debug(f"adding 'needs-rebase' label to {pull_request['html_url']}")
+    if await is_rebaseable(pull_request):
+        return await reconcile_labels(pull_request, add=[NEEDS_REBASE_LABEL_NAME])
 
-        try:
-            await github_api.post(
-                f"{issue_url}/labels", preview_api_version="symmetra", data={"labels": ["do-not-merge/needs-rebase"]},
-            )
-            return True
-        except gidgethub.BadRequest as err:
-            if err.status_code != 202:
-                _LOGGER.error(str(err))
+    await reconcile_labels(pull_request, remove=[NEEDS_REBASE_LABEL_NAME])
 
-    elif not needs_rebase_actual and has_rebase_label:
-        _LOGGER.debug(f"removing 'needs-rebase' label from {pull_request['html_url']}")
+    return False
 
-        try:
-            await github_api.delete(f"{issue_url}/labels/do-not-merge%2Fneeds-rebase", preview_api_version="symmetra")
-        except gidgethub.BadRequest as err:
-            _LOGGER.info(str(err))
 
-        return False
+async def needs_rebase_label(_pull_request: dict = None) -> bool:
+    """Add a 'needs-rebase' labels if required.
 
-    else:
+    If GitHub has not computed if the Pull Request is mergeable yet, the label is managed in the background.
+    """
+    added = await _reconcile_rebase_label(_pull_request["url"])
 
+    if added is None:
+        get_mergeability_rechecker().schedule(
+            ("rebase_label", _pull_request["url"]), lambda: _reconcile_rebase_label(_pull_request["url"]),
+        )
         return False
 
+    return added
+
 
 async def manage_label_and_check(github_api=None, pull_request: dict = None):
-    """Mange the WIP label and check for this Pull Request."""
-    check_runs_updates_uri = None
+    """Mange the WIP label and check for this Pull Request.
 
+    The check run is reported once the label has been managed, in its final state, and only if its
+    conclusion changed for the head commit.
+    """
     if pull_request is None:
         return
 
@@ -214,122 +217,73 @@ async def manage_label_and_check(github_api=None, pull_request: dict = None):
     if pr_head_sha is None:
         pr_head_sha = pull_request["head"]["sha"]
 
-    repo_url = pull_request["base"]["repo"]["url"]
-    issue_url = pull_request["issue_url"]
-
-    check_runs_base_uri = f"{repo_url}/check-runs"
-
-    _LOGGER.debug(f"manage_label_and_check: check_runs base uri: {check_runs_base_uri}, PR head sha: {pr_head_sha}")
-
-    issue_labels_response = await github_api.getitem(f"{issue_url}/labels", preview_api_version="symmetra")
-
-    try:
-        resp = await github_api.post(
-            check_runs_base_uri,
-            preview_api_version="antiope",
-            data={
-                "name": check_run_name,
-                "head_sha": pr_head_sha,
-                "status": "queued",
-                "started_at": f"{datetime.utcnow().isoformat()}Z",
-            },
-        )
-
-        check_runs_updates_uri = f'{check_runs_base_uri}/{resp["id"]:d}'
-    except gidgethub.BadRequest as err:
-        _LOGGER.error(f"status_code={err.status_code}, {str(err)}")
-
-    if check_runs_updates_uri is not None:
-        try:
-            resp = await github_api.patch(
-                check_runs_updates_uri,
-                preview_api_version="antiope",
-                data={"name": check_run_name, "status": "in_progress"},
-            )
-        except gidgethub.BadRequest as err:
-            _LOGGER.error(f"status_code={err.status_code}, {str(err)}")
+    _LOGGER.debug(f"manage_label_and_check: working on {pull_request['html_url']}, PR head sha: {pr_head_sha}")
 
     pr_title = pull_request["title"].lower()
-    wip_markers = ("wip", "🚧", "dnm", "work in progress", "work-in-progress", "do not merge", "do-not-merge", "draft")
+    wip_markers = WIP_MARKERS
 
-    is_wip_pr = any(m in pr_title for m in wip_markers)
+    is_wip_pr = "work_in_progress" in classify_title(pull_request["title"])
 
     if is_wip_pr:
-        try:
-            await github_api.post(
-                f"{issue_url}/labels",
-                preview_api_version="symmetra",
-                data={"labels": ["do-not-merge/work-in-progress"]},
-            )
-        except gidgethub.BadRequest as err:
-            if err.status_code != 202:
-                _LOGGER.error(err)
+        await reconcile_labels(pull_request, add=["do-not-merge/work-in-progress"], github_api=github_api)
     else:
-        try:
-            await github_api.delete(
-                f"{issue_url}/labels/do-not-merge%2Fwork-in-progress", preview_api_version="symmetra",
-            )
-        except gidgethub.BadRequest as err:
-            if err.status_code == 404:  # This is ok, label was not present......
-                pass
-            elif err.status_code != 200:
-                _LOGGER.error(err)
-
-    if check_runs_updates_uri is not None:
-        await github_api.patch(
-            check_runs_updates_uri,
-            preview_api_version="antiope",
-            data={
-                "name": check_run_name,
-                "status": "completed",
-                "conclusion": "success" if not is_wip_pr else "neutral",
-                "completed_at": f"{datetime.utcnow().isoformat()}Z",
-                "output": {
-                    "title": "🤖 This PR is NOT work-in-progress: Good to go",
-                    "text": "Debug info:\n"
-                    f"is_wip_pr={is_wip_pr!s}\n"
-                    f"pr_title={pr_title!s}\n"
-                    f"wip_markers={wip_markers!r}",
-                    "summary": "This change is no longer work-in-progress.",
-                }
-                if not is_wip_pr
-                else {
-                    "title": "🤖 This PR is work-in-progress: It is incomplete",
-                    "text": "Debug info:\n"
-                    f"is_wip_pr={is_wip_pr!s}\n"
-                    f"pr_title={pr_title!s}\n"
-                    f"wip_markers={wip_markers!r}",
-                    "summary": "🚧 Please do not merge this PR as it is still work-in-progress.",
-                },
-            },
-        )
+        await reconcile_labels(pull_request, remove=["do-not-merge/work-in-progress"], github_api=github_api)
+
+    await get_check_run_manager().report(
+        github_api,
+        pull_request["base"]["repo"]["url"],
+        pull_request["base"]["repo"]["full_name"],
+        pr_head_sha,
+        check_run_name,
+        "success" if not is_wip_pr else "neutral",
+        {
+            "title": "🤖 This PR is NOT work-in-progress: Good to go",
+            "text": "Debug info:\n"
+            f"is_wip_pr={is_wip_pr!s}\n"
+            f"pr_title={pr_title!s}\n"
+            f"wip_markers={wip_markers!r}",
+            "summary": "This change is no longer work-in-progress.",
+        }
+        if not is_wip_pr
+        else {
+            "title": "🤖 This PR is work-in-progress: It is incomplete",
+            "text": "Debug info:\n"
+            f"is_wip_pr={is_wip_pr!s}\n"
+            f"pr_title={pr_title!s}\n"
+            f"wip_markers={wip_markers!r}",
+            "summary": "🚧 Please do not merge this PR as it is still work-in-progress.",
+        },
+    )
 
 
 async def local_check_gate_passed(pr_url: str) -> bool:
-    """Check if the Pull Request has passed the 'local/check' gate successfully."""
-    gate_pass_status = None
+    """Check if the Pull Request has passed the 'local/check' gate successfully.
+
+    The state is looked up in the commit status index, the combined status of the head commit is
+    only fetched if the index does not know a final state.
+    """
+    index = get_commit_status_index()
+    state = None
 
     try:
-        github_api = RUNTIME_CONTEXT.app_installation_client
+        pr = await get_pull_request_snapshot(pr_url)
+        repo = pr["base"]["repo"]["full_name"]
+        head_sha = pr["head"]["sha"]
 
-        pr = await github_api.getitem(pr_url)
+        state = index.get(repo, head_sha, CHECK_GATE_CONTEXT)
 
-        async for commit in github_api.getiter(f"{pr_url}/commits"):
-            # let's get the HEAD ref of the PR
-            if commit["sha"] == pr["head"]["sha"]:
-                statuses = await github_api.getitem(f"{commit['url']}/statuses")
+        if state not in FINAL_STATES:
+            github_api = get_installation_client()
+            combined_status = await github_api.getitem(f"{pr['base']['repo']['url']}/commits/{head_sha}/status")
 
-                # according to https://developer.github.com/v3/repos/statuses/#list-statuses-for-a-specific-ref
-                # the first of list is the latest status
-                gate_pass_status = statuses[0]  # FIXME except KeyError
+            # only final states are recorded, the index may know a later one
+            index.update_from_combined_status(repo, combined_status)
+            polled = {s["context"]: s["state"] for s in combined_status.get("statuses", [])}.get(CHECK_GATE_CONTEXT)
+            state = index.get(repo, head_sha, CHECK_GATE_CONTEXT) if polled in FINAL_STATES else polled
     except Exception as err:
         _LOGGER.error(str(err))
 
-    if gate_pass_status is not None:
-        if (gate_pass_status["context"] == "local/check") and (gate_pass_status["state"] == "success"):
-            return True
-
-    return False
+    return state == "success"
 
 
 async def is_rebaseable(pull_request: dict = None) -> bool:
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Update the branches of all open Pull Requests behind the default branch, after a push to it.
+
+The open Pull Requests are found using one paginated GraphQL query. Those which are mergeable and
+based on an older commit are updated concurrently, approved ones and ones which passed the gate first.
+GitHub recomputes if they are mergeable after the push, those it does not know yet are re-checked
+with backoff, and updated once they are mergeable.
+"""
+
+
+import asyncio
+import os
+import logging
+import typing
+
+from aicoe.sesheta.actions.check_gate import CHECK_GATE_CONTEXT
+from aicoe.sesheta.actions.common import trigger_update_branch
+from aicoe.sesheta.github_cache import get_installation_client
+from aicoe.sesheta.recheck import get_mergeability_rechecker
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+REBASE_SWEEP_CONCURRENCY = int(os.getenv("SESHETA_REBASE_SWEEP_CONCURRENCY", 4))  # pragma: no cover
+
+REBASE_CANDIDATES_QUERY = """
+query($owner: String!, $name: String!, $base: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, baseRefName: $base, first: 100, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        number
+        url
+        mergeable
+        reviewDecision
+        baseRefOid
+        headRefOid
+        labels(first: 100) {
+          nodes {
+            name
+          }
+        }
+        commits(last: 1) {
+          nodes {
+            commit {
+              oid
+              status {
+                contexts {
+                  context
+                  state
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class RebaseSweepError(Exception):
+    """The GraphQL query for the open Pull Requests failed."""
+
+
+class RebaseCandidate(typing.NamedTuple):
+    """An open Pull Request which could be updated with its base branch."""
+
+    number: int
+    html_url: str
+    mergeable: typing.Optional[bool]
+    base_sha: str
+    approved: bool
+    gate_passed: bool
+
+    @property
+    def priority(self) -> int:
+        """Get the priority of the update, lower first: approved and passed the gate, either, or neither."""
+        return 2 - self.approved - self.gate_passed
+
+
+def _to_rebase_candidate(pr: dict) -> RebaseCandidate:
+    """Convert a Pull Request of the query result."""
+    labels = [label["name"] for label in pr["labels"]["nodes"]]
+
+    statuses = {}
+    for commit in pr["commits"]["nodes"]:
+        if commit["commit"]["oid"] == pr["headRefOid"] and commit["commit"]["status"] is not None:
+            statuses = {c["context"]: c["state"].lower() for c in commit["commit"]["status"]["contexts"]}
+
+    return RebaseCandidate(
+        number=pr["number"],
+        html_url=pr["url"],
+        mergeable={"MERGEABLE": True, "CONFLICTING": False}.get(pr["mergeable"]),
+        base_sha=pr["baseRefOid"],
+        approved=pr.get("reviewDecision") == "APPROVED" or "approved" in labels,
+        gate_passed=statuses.get(CHECK_GATE_CONTEXT) == "success",
+    )
+
+
+async def get_rebase_candidates(owner: str, repo: str, base_ref: str, github_api=None) -> typing.List[RebaseCandidate]:
+    """Get all open Pull Requests against the base branch, a page of 100 per request."""
+    if github_api is None:
+        github_api = get_installation_client()
+
+    candidates = []
+    after = None
+
+    while True:
+        response = await github_api.post(
+            "/graphql",
+            data={
+                "query": REBASE_CANDIDATES_QUERY,
+                "variables": {"owner": owner, "name": repo, "base": base_ref, "after": after},
+            },
+        )
+
+        if response.get("errors") or not (response.get("data") or {}).get("repository"):
+            errors = response.get("errors")
+            raise RebaseSweepError(f"querying the open Pull Requests of {owner}/{repo} failed: {errors}")
+
+        pull_requests = response["data"]["repository"]["pullRequests"]
+        candidates.extend(_to_rebase_candidate(pr) for pr in pull_requests["nodes"])
+
+        if not pull_requests["pageInfo"]["hasNextPage"]:
+            return candidates
+
+        after = pull_requests["pageInfo"]["endCursor"]
+
+
+async def _update_branches(
+    owner: str, repo: str, candidates: typing.List[RebaseCandidate], github_api, concurrency: int,
+) -> typing.List[int]:
+    """Update the branches of the Pull Requests, at most ``concurrency`` at a time and in order of their priority."""
+    candidates = sorted(candidates, key=lambda c: (c.priority, c.number))
+
+    # the semaphore is acquired in order, so that updates are started by priority
+    slots = asyncio.Semaphore(concurrency)
+
+    async def update(candidate: RebaseCandidate) -> bool:
+        async with slots:
+            _LOGGER.debug(f"updating {candidate.html_url}, priority {candidate.priority}")
+            return await trigger_update_branch(owner, repo, candidate.number, github_api=github_api)
+
+    triggered = await asyncio.gather(*[update(c) for c in candidates])
+
+    return [c.number for c, t in zip(candidates, triggered) if t]
+
+
+async def sweep_rebases(
+    owner: str, repo: str, base_ref: str, head_sha: str, github_api=None, concurrency: int = REBASE_SWEEP_CONCURRENCY,
+) -> typing.List[int]:
+    """Update the branches of the open Pull Requests which are behind ``head_sha`` of the base branch.
+
+    At most ``concurrency`` updates are triggered at a time, in order of their priority. Pull Requests
+    with conflicts are left alone. Pull Requests of which GitHub does not know yet if they are mergeable
+    are re-checked in the background by querying them again, and updated once they are mergeable. Return
+    the numbers of the Pull Requests updated right away. The query and the updates use ``github_api``,
+    the client of the installation by default.
+    """
+    if github_api is None:
+        github_api = get_installation_client()
+
+    candidates = await get_rebase_candidates(owner, repo, base_ref, github_api=github_api)
+    candidates = [c for c in candidates if c.base_sha != head_sha]
+
+    _LOGGER.info(f"updating {len(candidates)} Pull Requests of {owner}/{repo} with {base_ref} at {head_sha}")
+
+    updated = await _update_branches(owner, repo, [c for c in candidates if c.mergeable], github_api, concurrency)
+    metrics.REBASE_SWEEP_UPDATED.observe(len(updated))
+
+    unknown = {c.number for c in candidates if c.mergeable is None}
+    if unknown:
+        _LOGGER.debug(f"re-checking Pull Requests {sorted(unknown)} of {owner}/{repo}, their mergeability is unknown")
+        rechecked = []
+
+        async def recheck() -> typing.Optional[typing.List[int]]:
+            candidates = await get_rebase_candidates(owner, repo, base_ref, github_api=github_api)
+            candidates = [c for c in candidates if c.number in unknown and c.base_sha != head_sha]
+
+            rechecked.extend(
+                await _update_branches(owner, repo, [c for c in candidates if c.mergeable], github_api, concurrency),
+            )
+
+            # Pull Requests which have been closed or updated meanwhile are not re-checked either
+            unknown.intersection_update(c.number for c in candidates if c.mergeable is None)
+
+            return None if unknown else rechecked
+
+        get_mergeability_rechecker().schedule(("rebase_sweep", f"{owner}/{repo}".lower(), base_ref), recheck)
+
+    return updated
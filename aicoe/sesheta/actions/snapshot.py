@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A snapshot of the Pull Request, shared by all actions working on the same webhook delivery.
+
+The first action asking for a Pull Request gets it from the webhook payload, if the payload carries
+all fields the action needs, from the Pull Request store, or from the GitHub API. All other actions of
+the same delivery reuse it.
+"""
+
+
+import logging
+import typing
+
+from collections import OrderedDict
+
+from octomachinery.app.runtime.context import RUNTIME_CONTEXT
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.github_cache import get_installation_client
+from aicoe.sesheta.pr_store import get_pull_request_store
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# number of webhook deliveries we keep snapshots for, deliveries are handled concurrently
+MAX_DELIVERIES = 256
+
+_SNAPSHOTS: "OrderedDict[str, typing.Dict[str, dict]]" = OrderedDict()
+
+
+def _current_event() -> typing.Optional[typing.Any]:
+    """Get the GitHub event currently being handled, if any."""
+    try:
+        return RUNTIME_CONTEXT.github_event
+    except (LookupError, AttributeError):
+        return None
+
+
+def _delivery_snapshots(event) -> typing.Optional[typing.Dict[str, dict]]:
+    """Get the snapshots taken for the delivery of the event, None if there is no delivery."""
+    delivery_id = getattr(event, "delivery_id", None)
+    if delivery_id is None:
+        return None
+
+    key = str(delivery_id)
+    if key in _SNAPSHOTS:
+        _SNAPSHOTS.move_to_end(key)
+    else:
+        _SNAPSHOTS[key] = {}
+
+        while len(_SNAPSHOTS) > MAX_DELIVERIES:
+            _SNAPSHOTS.popitem(last=False)
+
+    return _SNAPSHOTS[key]
+
+
+def _from_payload(event, pr_url: str, require: typing.Iterable[str]) -> typing.Optional[dict]:
+    """Get the Pull Request from the webhook payload, if it is the one asked for and has all required fields."""
+    pull_request = getattr(event, "payload", {}).get("pull_request")
+
+    if not isinstance(pull_request, dict) or pull_request.get("url") != pr_url:
+        return None
+
+    if any(pull_request.get(field) is None for field in require):
+        return None
+
+    return pull_request
+
+
+async def get_pull_request_snapshot(pr_url: str, require: typing.Iterable[str] = ()) -> dict:
+    """Get the Pull Request at the (API) URL, at most once per webhook delivery.
+
+    ``require`` names fields which must not be None, e.g. ``mergeable`` which GitHub computes in the
+    background and which is often missing in webhook payloads. A snapshot lacking one of them is refreshed.
+    """
+    event = _current_event()
+    snapshots = _delivery_snapshots(event) if event is not None else None
+
+    if snapshots is not None:
+        pull_request = snapshots.get(pr_url)
+        if pull_request is not None and all(pull_request.get(field) is not None for field in require):
+            metrics.GITHUB_PULL_REQUEST_FETCHES.labels(source="snapshot").inc()
+            return pull_request
+
+        pull_request = _from_payload(event, pr_url, require)
+        if pull_request is not None:
+            metrics.GITHUB_PULL_REQUEST_FETCHES.labels(source="payload").inc()
+            snapshots[pr_url] = pull_request
+            return pull_request
+
+    store = get_pull_request_store()
+    pull_request = await store.get_by_url(pr_url)
+
+    if pull_request is not None and all(pull_request.get(field) is not None for field in require):
+        metrics.GITHUB_PULL_REQUEST_FETCHES.labels(source="store").inc()
+    else:
+        github_api = get_installation_client()
+        pull_request = await github_api.getitem(pr_url)
+        metrics.GITHUB_PULL_REQUEST_FETCHES.labels(source="api").inc()
+        _LOGGER.debug(f"fetched {pr_url} from the GitHub API")
+
+        installation = getattr(event, "payload", {}).get("installation") or {}
+        await store.put(pull_request, installation.get("id"))
+
+    if snapshots is not None:
+        snapshots[pr_url] = pull_request
+
+    return pull_request
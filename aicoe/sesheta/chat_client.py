@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A long-lived Google Chat API client."""
+
+
+import os
+import logging
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+from httplib2 import Http
+from apiclient.discovery import build
+from oauth2client.service_account import ServiceAccountCredentials
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CHAT_SCOPES = ["https://www.googleapis.com/auth/chat.bot"]
+CHAT_CREDENTIALS_FILE = os.getenv(
+    "SESHETA_CHAT_CREDENTIALS_FILE", "/opt/app-root/etc/gcloud/sesheta-chatbot.json",
+)  # pragma: no cover
+CHAT_API_ENDPOINT = os.getenv("SESHETA_CHAT_API_ENDPOINT", None)  # pragma: no cover
+
+_CHAT_CLIENTS = {}
+_CHAT_CLIENT_LOCK = threading.Lock()
+
+
+class GoogleChatClient:
+    """A Google Chat API client, loading the credentials and the discovery document only once.
+
+    The OAuth token is refreshed shortly before it expires. Each thread gets its own authorized
+    (keep-alive) HTTP connection, as httplib2 is not thread-safe. Without a credentials file the
+    client is not authorized, which is only useful together with a local ``api_endpoint``.
+    """
+
+    def __init__(
+        self, credentials_file: str = CHAT_CREDENTIALS_FILE, refresh_margin: int = 300, api_endpoint: str = None,
+    ):
+        """Load the service account credentials and build the chat service."""
+        self._credentials = None
+        if credentials_file is not None:
+            self._credentials = ServiceAccountCredentials.from_json_keyfile_name(credentials_file, CHAT_SCOPES)
+
+        self._refresh_margin = timedelta(seconds=refresh_margin)
+        self._token_lock = threading.Lock()
+        self._token_http = Http()
+        self._local = threading.local()
+
+        client_options = {"api_endpoint": api_endpoint} if api_endpoint is not None else None
+
+        self._ensure_token()
+        self._service = build("chat", "v1", http=self._http(), cache_discovery=False, client_options=client_options)
+
+        _LOGGER.debug(f"Google Chat client initialized using {credentials_file}, endpoint: {api_endpoint}")
+
+    def _ensure_token(self) -> None:
+        """Refresh the OAuth token if it is missing or about to expire."""
+        if self._credentials is None:
+            return
+
+        with self._token_lock:
+            expiry = self._credentials.token_expiry
+
+            if (
+                self._credentials.access_token is None
+                or expiry is None
+                or expiry - datetime.utcnow() < self._refresh_margin
+            ):
+                _LOGGER.debug("refreshing Google Chat OAuth token")
+                self._credentials.refresh(self._token_http)
+
+    def _http(self) -> Http:
+        """Get the authorized HTTP connection of the current thread."""
+        http = getattr(self._local, "http", None)
+
+        if http is None:
+            http = Http()
+            if self._credentials is not None:
+                http = self._credentials.authorize(http)
+
+            self._local.http = http
+
+        return http
+
+    def _execute(self, method: str, request) -> dict:
+        """Execute the API request using the current thread's connection."""
+        self._ensure_token()
+
+        started = time.monotonic()
+        try:
+            return request.execute(http=self._http())
+        finally:
+            metrics.CHAT_API_LATENCY.labels(method=method).observe(time.monotonic() - started)
+
+    def create_message(self, space: str, body: dict, thread_key: str = None) -> dict:
+        """Create a message in the given space."""
+        return self._execute(
+            "create_message", self._service.spaces().messages().create(parent=space, body=body, threadKey=thread_key),
+        )
+
+    def list_members(self, space: str, page_token: str = None) -> dict:
+        """List the members of the given space."""
+        return self._execute(
+            "list_members", self._service.spaces().members().list(parent=space, pageToken=page_token),
+        )
+
+
+def get_chat_client(
+    credentials_file: str = CHAT_CREDENTIALS_FILE, api_endpoint: str = CHAT_API_ENDPOINT,
+) -> GoogleChatClient:
+    """Get the process-wide Google Chat client for the credentials file and API endpoint."""
+    key = (credentials_file, api_endpoint)
+
+    with _CHAT_CLIENT_LOCK:
+        if key not in _CHAT_CLIENTS:
+            _CHAT_CLIENTS[key] = GoogleChatClient(credentials_file, api_endpoint=api_endpoint)
+
+    return _CHAT_CLIENTS[key]
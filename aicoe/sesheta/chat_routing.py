@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Route chat notifications to Google Chat spaces, using rules loaded from a configuration file.
+
+A rule matches the GitHub organization, the repository (both glob patterns) and the kind of the
+notification, the first matching rule determines the space. Spaces may refer to environment
+variables, e.g. ``${SESHETA_THOTH_DEVOPS_SPACE}``:
+
+    rules:
+      - org: thoth-station
+        space: ${SESHETA_THOTH_DEVOPS_SPACE}
+      - org: AICoE
+        repo: "*-bot"
+        kind: new_issue
+        space: spaces/AAAA
+"""
+
+
+import os
+import functools
+import logging
+import re
+import threading
+import time
+import typing
+
+from urllib.parse import urlparse
+
+import yaml
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CHAT_ROUTING_CONFIG = os.getenv("SESHETA_CHAT_ROUTING_CONFIG", None)  # pragma: no cover
+
+# these rules resemble the hard-coded routing Sesheta used before
+DEFAULT_RULES = [
+    {"org": "thoth-station", "space": "${SESHETA_THOTH_DEVOPS_SPACE}"},
+    {"repo": "*sefkhet-abwy*", "space": "${SESHETA_THOTH_DEVOPS_SPACE}"},
+    {"repo": "*sesheta*", "space": "${SESHETA_THOTH_DEVOPS_SPACE}"},
+    {"repo": "*srcopsmetrics*", "space": "${SESHETA_THOTH_DEVOPS_SPACE}"},
+    {"org": "AICoE", "space": "${SESHETA_AIOPS_DEVOPS_SPACE}"},
+]
+
+_ENV_VARIABLE = re.compile(r"\$\{(\w+)\}")
+_ROUTER = None
+_ROUTER_LOCK = threading.Lock()
+
+
+def _expand_space(space: typing.Optional[str]) -> typing.Optional[str]:
+    """Replace references to environment variables, an empty space means no space."""
+    if space is None:
+        return None
+
+    space = _ENV_VARIABLE.sub(lambda m: os.environ.get(m.group(1), ""), space).strip()
+
+    return space or None
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob pattern into a regular expression, wildcards do not cross '/' or '#'."""
+    return "".join("[^/#]*" if c == "*" else "[^/#]" if c == "?" else re.escape(c) for c in pattern)
+
+
+def parse_repository(data: str) -> (str, str):
+    """Get the organization and repository name from a GitHub (API) URL, or an organization name."""
+    if "://" not in data:
+        org, _, repo = data.strip("/").partition("/")
+        return org, repo
+
+    path = urlparse(data).path.strip("/").split("/")
+    if path and path[0] == "repos":
+        path = path[1:]
+
+    org = path[0] if len(path) > 0 else ""
+    repo = path[1] if len(path) > 1 else ""
+
+    return org, repo
+
+
+class ChatRoutingConfigError(Exception):
+    """The chat routing configuration is not a mapping with a list of rules."""
+
+
+class ChatRouter:
+    """Route notifications to spaces, all rules are compiled into one regular expression."""
+
+    def __init__(self, rules: typing.List[dict], cache_size: int = 1024):
+        """Compile the rules."""
+        self.rules = rules
+        self._spaces = []
+        patterns = []
+
+        for index, rule in enumerate(rules):
+            org = _glob_to_regex(rule.get("org", "*"))
+            repo = _glob_to_regex(rule.get("repo", "*"))
+            kind = _glob_to_regex(rule.get("kind", "*"))
+
+            patterns.append(f"(?P<r{index}>{org}/{repo}#{kind})")
+            self._spaces.append(_expand_space(rule.get("space")))
+
+        self._matcher = re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+        self._route = functools.lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, full_name: str, kind: str) -> typing.Optional[str]:
+        """Find the space of the first rule matching the repository and kind."""
+        if self._matcher is None:
+            return None
+
+        match = self._matcher.fullmatch(f"{full_name}#{kind}")
+        if match is None:
+            return None
+
+        return self._spaces[int(match.lastgroup[1:])]
+
+    def route(self, data: str, kind: str = "plain") -> typing.Optional[str]:
+        """Return the space for a GitHub URL (or organization name) and kind of notification."""
+        org, repo = parse_repository(data)
+
+        return self._route(f"{org}/{repo}", (kind or "plain").lower())
+
+    @classmethod
+    def from_file(cls, path: str) -> "ChatRouter":
+        """Load the rules from a YAML file."""
+        with open(path) as config_file:
+            config = yaml.safe_load(config_file) or {}
+
+        if not isinstance(config, dict):
+            raise ChatRoutingConfigError(f"expected a mapping, got {type(config).__name__}")
+
+        rules = config.get("rules") or []
+        if not isinstance(rules, list) or not all(isinstance(rule, dict) for rule in rules):
+            raise ChatRoutingConfigError("expected 'rules' to be a list of mappings")
+
+        return cls(rules)
+
+
+class ReloadingChatRouter:
+    """A chat router reloading its rules if the configuration file changed."""
+
+    def __init__(self, path: str = None, check_interval: float = 1.0):
+        """Load the rules from the file, or use the default rules if there is no file."""
+        self.path = path
+        self.check_interval = check_interval
+        self._mtime = None
+        self._checked_at = 0.0
+        self._router = ChatRouter(DEFAULT_RULES)
+        self._lock = threading.Lock()
+
+        self._reload_if_changed()
+
+    def _reload_if_changed(self) -> None:
+        """Reload the rules if the modification time of the configuration file changed."""
+        if self.path is None:
+            return
+
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as exc:
+            if self._mtime is None:
+                _LOGGER.warning(f"cannot read chat routing config {self.path}: {exc}, using default rules")
+                self._mtime = -1
+            return
+
+        if mtime == self._mtime:
+            return
+
+        try:
+            self._router = ChatRouter.from_file(self.path)
+            _LOGGER.info(f"loaded {len(self._router.rules)} chat routing rules from {self.path}")
+        except (OSError, yaml.YAMLError, re.error, ChatRoutingConfigError) as exc:
+            _LOGGER.error(f"cannot load chat routing config {self.path}: {exc}, keeping the current rules")
+
+        self._mtime = mtime
+
+    def route(self, data: str, kind: str = "plain") -> typing.Optional[str]:
+        """Return the space for a GitHub URL (or organization name) and kind of notification."""
+        now = time.monotonic()
+
+        if now - self._checked_at >= self.check_interval:
+            with self._lock:
+                self._checked_at = now
+                self._reload_if_changed()
+
+        return self._router.route(data, kind)
+
+
+def get_chat_router() -> ReloadingChatRouter:
+    """Get the process-wide chat router, configured by ``SESHETA_CHAT_ROUTING_CONFIG``."""
+    global _ROUTER
+
+    with _ROUTER_LOCK:
+        if _ROUTER is None:
+            _ROUTER = ReloadingChatRouter(CHAT_ROUTING_CONFIG)
+
+    return _ROUTER
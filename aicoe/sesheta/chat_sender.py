@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Rate-limited, retrying sender of Google Chat messages."""
+
+
+import os
+import logging
+import random
+import threading
+import time
+
+from googleapiclient.errors import HttpError
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.chat_client import GoogleChatClient, get_chat_client
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CHAT_RATE_LIMIT = float(os.getenv("SESHETA_CHAT_RATE_LIMIT", 1.0))  # pragma: no cover
+CHAT_RATE_BURST = int(os.getenv("SESHETA_CHAT_RATE_BURST", 5))  # pragma: no cover
+CHAT_MAX_RETRIES = int(os.getenv("SESHETA_CHAT_MAX_RETRIES", 5))  # pragma: no cover
+
+RETRYABLE_STATUS_CODES = [429, 500, 502, 503, 504]
+
+_CHAT_SENDER = None
+_CHAT_SENDER_LOCK = threading.Lock()
+
+
+class ChatSendError(Exception):
+    """A message could not be sent to Google Chat."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        """Initialize the error, ``retryable`` is False if sending the message again will fail again."""
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class TokenBucket:
+    """A thread-safe token bucket, refilled with ``rate`` tokens per second up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Return the time spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # reserve the token, the bucket may go negative: waiters queue up in order of arrival
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+
+class CircuitBreaker:
+    """Stop calling a failing service for ``reset_timeout`` seconds after ``failure_threshold`` failures.
+
+    After the timeout a single trial call is let through (half-open), its outcome closes or
+    re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """Initialize a closed circuit."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check if a call may be made."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit if there were too many."""
+        with self._lock:
+            self._failures += 1
+
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class ChatSender:
+    """Send messages to Google Chat with a token bucket and a circuit breaker per space.
+
+    Requests failing with 429, 5xx or a connection error are retried with jittered exponential backoff,
+    only these failures count towards opening the circuit.
+    """
+
+    def __init__(
+        self,
+        client: GoogleChatClient = None,
+        rate: float = CHAT_RATE_LIMIT,
+        burst: int = CHAT_RATE_BURST,
+        max_retries: int = CHAT_MAX_RETRIES,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+    ):
+        """Initialize the sender, if no client is given the process-wide Google Chat client is used."""
+        self._client = client
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._buckets = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> GoogleChatClient:
+        """Get the Google Chat client."""
+        if self._client is None:
+            self._client = get_chat_client()
+
+        return self._client
+
+    def _bucket_and_breaker(self, space: str) -> (TokenBucket, CircuitBreaker):
+        """Get the token bucket and circuit breaker of the space."""
+        with self._lock:
+            if space not in self._buckets:
+                self._buckets[space] = TokenBucket(self.rate, self.burst)
+                self._breakers[space] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+
+            return self._buckets[space], self._breakers[space]
+
+    def _backoff(self, attempt: int, retry_after: str = None) -> float:
+        """Compute the delay before the next attempt: full jitter, or what the server asked for."""
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def send(self, space: str, body: dict, thread_key: str = None) -> dict:
+        """Send the message to the space, raise ChatSendError if it could not be delivered."""
+        bucket, breaker = self._bucket_and_breaker(space)
+
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                metrics.CHAT_SEND_FAILURES.labels(reason="circuit_open").inc()
+                raise ChatSendError(f"circuit breaker for {space} is open")
+
+            bucket.acquire()
+
+            try:
+                response = self.client.create_message(space, body, thread_key)
+                breaker.record_success()
+                metrics.CHAT_MESSAGES_SENT.labels(space=space).inc()
+                return response
+            except HttpError as exc:
+                if exc.resp.status not in RETRYABLE_STATUS_CODES:
+                    # the service is up and rejected the message, this does not count towards the breaker
+                    breaker.record_success()
+                    metrics.CHAT_SEND_FAILURES.labels(reason=str(exc.resp.status)).inc()
+                    raise ChatSendError(f"sending to {space} failed: {exc}", retryable=False) from exc
+
+                breaker.record_failure()
+                delay = self._backoff(attempt, exc.resp.get("retry-after"))
+                last_error = exc
+            except (ConnectionError, OSError) as exc:
+                breaker.record_failure()
+                delay = self._backoff(attempt)
+                last_error = exc
+
+            if attempt < self.max_retries:
+                _LOGGER.debug(f"sending to {space} failed ({last_error}), retrying in {delay:.2f}s")
+                metrics.CHAT_SEND_RETRIES.inc()
+                time.sleep(delay)
+
+        metrics.CHAT_SEND_FAILURES.labels(reason="retries_exhausted").inc()
+        raise ChatSendError(f"sending to {space} failed after {self.max_retries} retries: {last_error}")
+
+
+def get_chat_sender() -> ChatSender:
+    """Get the process-wide Google Chat sender."""
+    global _CHAT_SENDER
+
+    with _CHAT_SENDER_LOCK:
+        if _CHAT_SENDER is None:
+            _CHAT_SENDER = ChatSender()
+
+    return _CHAT_SENDER
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Report the results of Sesheta's checks as check runs, with as few GitHub API calls as possible.
+
+A result is reported in its final state right away: one POST creating a completed check run. The
+check runs created are kept in an index per (repository, head SHA, name), so that a later result
+for the same commit updates the existing check run, and is not sent at all if neither its conclusion
+nor its output has changed. The index is seeded from the ``check_run`` webhooks of our check runs as
+well, so that check runs created before a restart are updated and not created again.
+"""
+
+
+import os
+import logging
+import threading
+import typing
+
+from collections import OrderedDict
+from datetime import datetime
+
+import gidgethub
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECK_RUN_INDEX_MAX_LEN = int(os.getenv("SESHETA_CHECK_RUN_INDEX_MAX_LEN", 4096))  # pragma: no cover
+GITHUB_APP_ID = os.getenv("GITHUB_APP_IDENTIFIER", None)  # pragma: no cover
+
+_CHECK_RUN_MANAGER = None
+_CHECK_RUN_MANAGER_LOCK = threading.Lock()
+
+
+OUTPUT_FIELDS = ("title", "summary", "text")
+
+
+class CheckRun(typing.NamedTuple):
+    """A check run we created, and the conclusion and output it has been completed with."""
+
+    id: int
+    conclusion: str
+    output: typing.Tuple[typing.Optional[str], ...]
+
+
+def output_key(output: typing.Optional[dict]) -> typing.Tuple[typing.Optional[str], ...]:
+    """Get the fields of the output of a check run which are compared, missing ones are None."""
+    output = output or {}
+    return tuple(output.get(field) or None for field in OUTPUT_FIELDS)
+
+
+class CheckRunManager:
+    """Create and update completed check runs, remembering the ones created."""
+
+    def __init__(self, max_len: int = CHECK_RUN_INDEX_MAX_LEN, app_id: typing.Optional[int] = GITHUB_APP_ID):
+        """Initialize the manager with an empty index of at most ``max_len`` check runs of the App ``app_id``."""
+        self.max_len = max_len
+        self.app_id = int(app_id) if app_id is not None else None
+        self._check_runs = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of check runs in the index."""
+        return len(self._check_runs)
+
+    def get(self, repo: str, head_sha: str, name: str) -> typing.Optional[CheckRun]:
+        """Get the check run created for the commit, None if there is none."""
+        return self._check_runs.get((repo.lower(), head_sha, name))
+
+    def _remember(self, repo: str, head_sha: str, name: str, check_run: CheckRun) -> None:
+        """Remember the check run, evicting the least recently reported ones."""
+        key = (repo.lower(), head_sha, name)
+
+        self._check_runs[key] = check_run
+        self._check_runs.move_to_end(key)
+
+        while len(self._check_runs) > self.max_len:
+            self._check_runs.popitem(last=False)
+
+    async def report(
+        self, github_api, repo_url: str, repo: str, head_sha: str, name: str, conclusion: str, output: dict,
+    ) -> typing.Optional[CheckRun]:
+        """Report a completed check run for the commit, creating it or updating the existing one.
+
+        ``repo_url`` is the API URL of the repository, ``repo`` its full name. Nothing is sent if the
+        check run has been completed with the same conclusion and output already.
+        """
+        existing = self.get(repo, head_sha, name)
+
+        if existing is not None and existing.conclusion == conclusion and existing.output == output_key(output):
+            _LOGGER.debug(f"check run {name} on {repo}@{head_sha} is {conclusion} with the same output already")
+            metrics.CHECK_RUN_REQUESTS.labels(action="skipped").inc()
+            return existing
+
+        now = f"{datetime.utcnow().isoformat()}Z"
+        data = {"name": name, "status": "completed", "conclusion": conclusion, "completed_at": now, "output": output}
+
+        try:
+            if existing is None:
+                response = await github_api.post(
+                    f"{repo_url}/check-runs",
+                    preview_api_version="antiope",
+                    data=dict(data, head_sha=head_sha, started_at=now),
+                )
+                metrics.CHECK_RUN_REQUESTS.labels(action="created").inc()
+            else:
+                response = await github_api.patch(
+                    f"{repo_url}/check-runs/{existing.id:d}", preview_api_version="antiope", data=data,
+                )
+                metrics.CHECK_RUN_REQUESTS.labels(action="updated").inc()
+        except gidgethub.BadRequest as err:
+            _LOGGER.error(f"reporting check run {name} on {repo}@{head_sha} failed: {err}")
+            return None
+
+        check_run = CheckRun(response["id"], conclusion, output_key(output))
+        self._remember(repo, head_sha, name, check_run)
+
+        return check_run
+
+    def update_from_check_run_event(self, payload: dict) -> None:
+        """Record the check run of a ``check_run`` webhook, if it has been created by our App.
+
+        Check runs created by other Apps are ignored, as we can not update them. Check runs which are
+        not completed yet are recorded without a conclusion, so that the next result updates them.
+        """
+        check_run = payload["check_run"]
+
+        if self.app_id is not None and (check_run.get("app") or {}).get("id") != self.app_id:
+            return
+
+        self._remember(
+            payload["repository"]["full_name"],
+            check_run["head_sha"],
+            check_run["name"],
+            CheckRun(check_run["id"], check_run.get("conclusion"), output_key(check_run.get("output"))),
+        )
+
+
+def get_check_run_manager() -> CheckRunManager:
+    """Get the process-wide check run manager."""
+    global _CHECK_RUN_MANAGER
+
+    with _CHECK_RUN_MANAGER_LOCK:
+        if _CHECK_RUN_MANAGER is None:
+            _CHECK_RUN_MANAGER = CheckRunManager()
+
+    return _CHECK_RUN_MANAGER
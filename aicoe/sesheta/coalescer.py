@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Coalesce chat notifications sent to the same thread within a short window."""
+
+
+import asyncio
+import logging
+import typing
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.dispatcher import Notification
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def merge_notifications(notifications: typing.List[Notification]) -> Notification:
+    """Merge notifications of one thread into one, with the kind and URL of the first one."""
+    if len(notifications) > 1:
+        _LOGGER.debug(f"merging {len(notifications)} notifications for thread {notifications[0].thread_key}")
+        metrics.CHAT_COALESCED_MESSAGES.inc(len(notifications) - 1)
+
+    return notifications[0]._replace(message="\n".join(n.message for n in notifications))
+
+
+class NotificationCoalescer:
+    """Hold notifications per thread for a window and merge them into one message.
+
+    The merged message is sent with the kind and URL of the first notification of the thread.
+    """
+
+    def __init__(self, emit: typing.Callable[[Notification], typing.Any], window: float = 3.0):
+        """Initialize the coalescer, ``emit`` is called with the merged notification."""
+        self._emit = emit
+        self._window = window
+        self._pending = {}
+
+    @property
+    def pending(self) -> int:
+        """Return the number of notifications currently held back."""
+        return sum(len(notifications) for notifications in self._pending.values())
+
+    def add(self, notification: Notification) -> None:
+        """Add a notification, it will be emitted once the window of its thread has passed."""
+        if self._window <= 0:
+            self._emit(notification)
+            return
+
+        key = notification.thread_key
+
+        if key not in self._pending:
+            self._pending[key] = []
+            asyncio.get_running_loop().call_later(self._window, self.flush, key)
+
+        self._pending[key].append(notification)
+
+    def flush(self, key: str) -> None:
+        """Merge and emit all notifications held back for the given thread."""
+        notifications = self._pending.pop(key, [])
+
+        if not notifications:
+            return
+
+        self._emit(merge_notifications(notifications))
+
+    def flush_all(self) -> None:
+        """Emit all notifications held back, e.g. on shutdown."""
+        for key in list(self._pending):
+            self.flush(key)
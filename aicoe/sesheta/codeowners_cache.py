@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A cache of the parsed CODEOWNERS file per repository, keyed by the SHA of its blob.
+
+A CODEOWNERS file is parsed once per blob, repositories without one are remembered as well. The
+entry of a repository is dropped when a push to its default branch changes the file.
+"""
+
+
+import base64
+import os
+import logging
+import threading
+import typing
+
+from collections import OrderedDict
+
+import gidgethub
+
+from codeowners import CodeOwners
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CODEOWNERS_CACHE_MAX_LEN = int(os.getenv("SESHETA_CODEOWNERS_CACHE_MAX_LEN", 1024))  # pragma: no cover
+
+CODEOWNERS_PATH = ".github/CODEOWNERS"
+
+# GitHub lists at most 20 commits in a push webhook, the files changed by the others are unknown
+_PUSH_MAX_COMMITS = 20
+
+_CODEOWNERS_CACHE = None
+_CODEOWNERS_CACHE_LOCK = threading.Lock()
+
+
+class CodeOwnersEntry(typing.NamedTuple):
+    """The parsed CODEOWNERS of a repository and the SHA of its blob, both None if there is none."""
+
+    sha: typing.Optional[str]
+    codeowners: typing.Optional[CodeOwners]
+
+
+class CodeOwnersCache:
+    """An LRU of the parsed CODEOWNERS of repositories."""
+
+    def __init__(self, max_len: int = CODEOWNERS_CACHE_MAX_LEN):
+        """Initialize an empty cache of at most ``max_len`` repositories."""
+        self.max_len = max_len
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of repositories in the cache."""
+        return len(self._entries)
+
+    def get(self, repo: str) -> typing.Optional[CodeOwnersEntry]:
+        """Get the entry of the repository, None if it is not known."""
+        entry = self._entries.get(repo.lower())
+
+        if entry is None:
+            metrics.CODEOWNERS_CACHE_LOOKUPS.labels(result="miss").inc()
+            return None
+
+        self._entries.move_to_end(repo.lower())
+        metrics.CODEOWNERS_CACHE_LOOKUPS.labels(result="hit" if entry.sha is not None else "negative_hit").inc()
+
+        return entry
+
+    def put(self, repo: str, sha: typing.Optional[str], content: typing.Optional[str]) -> typing.Optional[CodeOwners]:
+        """Remember the CODEOWNERS blob of the repository, it is parsed only if its SHA has changed.
+
+        A ``sha`` of None remembers that the repository has no CODEOWNERS.
+        """
+        key = repo.lower()
+        entry = self._entries.get(key)
+
+        if entry is None or entry.sha != sha:
+            entry = CodeOwnersEntry(sha, CodeOwners(content) if sha is not None else None)
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_len:
+            self._entries.popitem(last=False)
+
+        metrics.CODEOWNERS_CACHE_SIZE.set(len(self._entries))
+
+        return entry.codeowners
+
+    def invalidate(self, repo: str) -> None:
+        """Forget the CODEOWNERS of the repository."""
+        if self._entries.pop(repo.lower(), None) is not None:
+            _LOGGER.debug(f"forgot the CODEOWNERS of {repo}")
+            metrics.CODEOWNERS_CACHE_SIZE.set(len(self._entries))
+
+    def apply_push_event(self, payload: dict) -> None:
+        """Forget the CODEOWNERS of the repository if a ``push`` to its default branch may have changed it."""
+        repository = payload["repository"]
+        if payload["ref"] != f"refs/heads/{repository['default_branch']}":
+            return
+
+        commits = payload.get("commits") or []
+        changed = payload.get("forced") or len(commits) >= _PUSH_MAX_COMMITS
+
+        for commit in commits:
+            for files in ["added", "modified", "removed"]:
+                changed = changed or CODEOWNERS_PATH in commit.get(files, [])
+
+        if changed:
+            self.invalidate(repository["full_name"])
+
+    async def fetch(self, owner: str, repo: str, github_api) -> typing.Optional[CodeOwners]:
+        """Get the parsed CODEOWNERS of the repository, it is downloaded if it is not in the cache."""
+        entry = self.get(f"{owner}/{repo}")
+        if entry is not None:
+            return entry.codeowners
+
+        try:
+            blob = await github_api.getitem(f"/repos/{owner}/{repo}/contents/{CODEOWNERS_PATH}")
+        except gidgethub.HTTPException as http_exception:
+            if http_exception.status_code != 404:
+                raise
+
+            return self.put(f"{owner}/{repo}", None, None)
+
+        return self.put(f"{owner}/{repo}", blob["sha"], base64.b64decode(blob["content"]).decode("utf-8"))
+
+
+def get_codeowners_cache() -> CodeOwnersCache:
+    """Get the process-wide CODEOWNERS cache."""
+    global _CODEOWNERS_CACHE
+
+    with _CODEOWNERS_CACHE_LOCK:
+        if _CODEOWNERS_CACHE is None:
+            _CODEOWNERS_CACHE = CodeOwnersCache()
+
+    return _CODEOWNERS_CACHE
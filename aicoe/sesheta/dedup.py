@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Bounded stores to deduplicate notifications, in-memory or shared via SQLite."""
+
+
+import abc
+import asyncio
+import os
+import logging
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+DEDUP_BACKEND = os.getenv("SESHETA_NOTIFICATION_DEDUP_BACKEND", "memory")  # pragma: no cover
+DEDUP_PATH = os.getenv("SESHETA_NOTIFICATION_DEDUP_PATH", "/tmp/sesheta-notifications.sqlite")  # pragma: no cover
+DEDUP_MAX_LEN = int(os.getenv("SESHETA_NOTIFICATION_DEDUP_MAX_LEN", 10000))  # pragma: no cover
+DEDUP_MAX_AGE = float(os.getenv("SESHETA_NOTIFICATION_DEDUP_MAX_AGE", 10))  # pragma: no cover
+
+
+class DedupStore(abc.ABC):
+    """Base class of the dedup stores, remembering keys for ``max_age`` seconds.
+
+    Stores doing blocking I/O set ``blocking``, their lookups run in the default executor so that
+    they do not stall the event loop.
+    """
+
+    backend = None
+    blocking = False
+
+    def __init__(self, max_len: int = DEDUP_MAX_LEN, max_age: float = DEDUP_MAX_AGE):
+        """Initialize the store, it will hold at most ``max_len`` keys."""
+        self.max_len = max_len
+        self.max_age = max_age
+
+    @abc.abstractmethod
+    def _check_and_add(self, key: str, now: float) -> bool:
+        """Return True if the key is known, remember it otherwise."""
+
+    async def seen(self, key: str) -> bool:
+        """Check if the key has been seen within ``max_age``, and remember it if not."""
+        if self.blocking:
+            hit = await asyncio.get_running_loop().run_in_executor(None, self._check_and_add, key, time.time())
+        else:
+            hit = self._check_and_add(key, time.time())
+
+        if hit:
+            metrics.NOTIFICATION_DEDUP_HITS.labels(backend=self.backend).inc()
+        else:
+            metrics.NOTIFICATION_DEDUP_MISSES.labels(backend=self.backend).inc()
+
+        return hit
+
+    def _evicted(self, reason: str, count: int = 1) -> None:
+        """Count keys removed from the store, either because they expired or the store was full."""
+        if count > 0:
+            metrics.NOTIFICATION_DEDUP_EVICTIONS.labels(backend=self.backend, reason=reason).inc(count)
+
+
+class MemoryDedupStore(DedupStore):
+    """An in-process LRU store with a TTL per key."""
+
+    backend = "memory"
+
+    def __init__(self, max_len: int = DEDUP_MAX_LEN, max_age: float = DEDUP_MAX_AGE):
+        """Initialize the store."""
+        super().__init__(max_len, max_age)
+        self._keys = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of keys in the store."""
+        return len(self._keys)
+
+    def _check_and_add(self, key: str, now: float) -> bool:
+        """Return True if the key is known, remember it otherwise."""
+        expires_at = self._keys.get(key)
+
+        if expires_at is not None:
+            if expires_at > now:
+                self._keys.move_to_end(key)
+                return True
+
+            del self._keys[key]
+            self._evicted("expired")
+
+        self._keys[key] = now + self.max_age
+
+        while len(self._keys) > self.max_len:
+            _, oldest_expires_at = self._keys.popitem(last=False)
+            self._evicted("expired" if oldest_expires_at <= now else "capacity")
+
+        return False
+
+
+class SQLiteDedupStore(DedupStore):
+    """A store in a SQLite database, it can be shared by several processes (replicas) on the same volume."""
+
+    backend = "sqlite"
+    blocking = True
+
+    def __init__(self, path: str = DEDUP_PATH, max_len: int = DEDUP_MAX_LEN, max_age: float = DEDUP_MAX_AGE):
+        """Open (and create) the database."""
+        super().__init__(max_len, max_age)
+        self.path = path
+
+        # the connection is used from the executor's threads, one at a time
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS notifications (key TEXT PRIMARY KEY, expires_at REAL, last_seen REAL)",
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS notifications_expires_at ON notifications (expires_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS notifications_last_seen ON notifications (last_seen)")
+
+        _LOGGER.debug(f"using SQLite dedup store at {path}")
+
+    def __len__(self) -> int:
+        """Return the number of keys in the store."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM notifications").fetchone()[0]
+
+    def _check_and_add(self, key: str, now: float) -> bool:
+        """Return True if the key is known, remember it otherwise."""
+        with self._lock:
+            return self._check_and_add_locked(key, now)
+
+    def _check_and_add_locked(self, key: str, now: float) -> bool:
+        """Return True if the key is known, remember it otherwise, holding the connection's lock."""
+        self._db.execute("BEGIN IMMEDIATE")
+
+        try:
+            expired = self._db.execute("DELETE FROM notifications WHERE expires_at <= ?", (now,)).rowcount
+            self._evicted("expired", expired)
+
+            updated = self._db.execute("UPDATE notifications SET last_seen = ? WHERE key = ?", (now, key)).rowcount
+            if updated:
+                self._db.execute("COMMIT")
+                return True
+
+            self._db.execute(
+                "INSERT INTO notifications (key, expires_at, last_seen) VALUES (?, ?, ?)",
+                (key, now + self.max_age, now),
+            )
+
+            overflow = self._db.execute("SELECT COUNT(*) FROM notifications").fetchone()[0] - self.max_len
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM notifications WHERE key IN "
+                    "(SELECT key FROM notifications ORDER BY last_seen LIMIT ?)",
+                    (overflow,),
+                )
+                self._evicted("capacity", overflow)
+
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+        return False
+
+
+def get_dedup_store(backend: str = DEDUP_BACKEND) -> DedupStore:
+    """Create the dedup store configured by ``SESHETA_NOTIFICATION_DEDUP_*``."""
+    if backend == "sqlite":
+        return SQLiteDedupStore()
+
+    if backend != "memory":
+        _LOGGER.warning(f"unknown dedup backend '{backend}', using an in-memory store")
+
+    return MemoryDedupStore()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Non-blocking dispatcher for Google Chat notifications."""
+
+
+import asyncio
+import logging
+import time
+import typing
+
+from concurrent.futures import ThreadPoolExecutor
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Notification(typing.NamedTuple):
+    """A message to be sent to a Google Chat space."""
+
+    kind: str
+    message: str
+    thread_key: str
+    url: str
+
+
+class NotificationDispatcher:
+    """Deliver notifications using a bounded pool of background workers.
+
+    Webhook handlers enqueue a notification and return right away, the (blocking) delivery is
+    done by the workers in a thread pool, so that the event loop is never stalled by Google Chat.
+    """
+
+    def __init__(
+        self, deliver: typing.Callable[[str, str, str, str], None], workers: int = 4, max_queue_size: int = 1000,
+    ):
+        """Initialize the dispatcher, workers are started lazily on the first enqueue."""
+        self._deliver = deliver
+        self._workers = workers
+        self._queue = None
+        self._loop = None
+        self._max_queue_size = max_queue_size
+        self._tasks = []
+        self._executor = None
+
+        metrics.CHAT_QUEUE_DEPTH.set_function(lambda: self.qsize)
+
+    @property
+    def qsize(self) -> int:
+        """Return the number of notifications waiting to be delivered."""
+        if self._queue is None:
+            return 0
+
+        return self._queue.qsize()
+
+    def _start(self) -> None:
+        """Start the background workers on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="chat-notification")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+
+        _LOGGER.debug(f"started {self._workers} chat notification workers")
+
+    def enqueue(self, notification: Notification) -> bool:
+        """Schedule the notification for delivery, must be called from within a running event loop.
+
+        The workers are bound to the event loop of the first call, until the dispatcher is closed.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._loop is None:
+            self._start()
+        elif self._loop is not loop:
+            raise RuntimeError("the notification dispatcher is bound to another event loop, close it first")
+
+        try:
+            self._queue.put_nowait((time.monotonic(), notification))
+        except asyncio.QueueFull:
+            _LOGGER.warning(f"chat notification queue is full, dropping notification for {notification.thread_key}")
+            metrics.CHAT_NOTIFICATIONS_DROPPED.labels(reason="queue_full").inc()
+            return False
+
+        return True
+
+    async def deliver(self, notification: Notification) -> None:
+        """Deliver one notification in the thread pool, without blocking the event loop."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="chat-notification")
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._deliver, *notification)
+
+    async def _worker(self) -> None:
+        """Take notifications from the queue and deliver them, until cancelled."""
+        while True:
+            enqueued_at, notification = await self._queue.get()
+
+            try:
+                await self.deliver(notification)
+                metrics.CHAT_DELIVERY_LATENCY.observe(time.monotonic() - enqueued_at)
+            except Exception as exc:
+                _LOGGER.error(f"failed to deliver chat notification for {notification.thread_key}: {exc}")
+                metrics.CHAT_NOTIFICATIONS_DROPPED.labels(reason="delivery_failed").inc()
+            finally:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        """Wait for all queued notifications to be delivered and stop the workers."""
+        if self._queue is not None:
+            await self._queue.join()
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
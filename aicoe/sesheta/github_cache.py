@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A cache of GitHub API responses, used to make conditional requests.
+
+gidgethub sends ``If-None-Match``/``If-Modified-Since`` for every GET it finds in its cache, and
+answers from the cache if GitHub responds with 304 Not Modified, which does not count against the
+rate limit. The cache is keyed by namespace (the installation or token) and URL, so that responses
+are never shared between installations with different permissions.
+"""
+
+
+import os
+import json
+import logging
+import sqlite3
+import threading
+import time
+import typing
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from octomachinery.app.runtime.context import RUNTIME_CONTEXT
+from octomachinery.github.api.raw_client import RawGitHubAPI
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+GITHUB_CACHE_MAX_ENTRIES = int(os.getenv("SESHETA_GITHUB_CACHE_MAX_ENTRIES", 2048))  # pragma: no cover
+GITHUB_CACHE_PATH = os.getenv("SESHETA_GITHUB_CACHE_PATH", None)  # pragma: no cover
+
+# (etag, last_modified, data, more) as stored by gidgethub
+CacheEntry = typing.Tuple[typing.Optional[str], typing.Optional[str], typing.Any, typing.Optional[str]]
+
+_RESPONSE_CACHE = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+class ResponseCache:
+    """An LRU of GitHub API responses per namespace and URL, optionally persisted in a SQLite database."""
+
+    def __init__(self, max_entries: int = GITHUB_CACHE_MAX_ENTRIES, path: str = None):
+        """Initialize the cache, with a ``path`` the responses survive a restart."""
+        self.max_entries = max_entries
+        self.path = path
+        self._entries = OrderedDict()
+        self._db = None
+
+        if path is not None:
+            self._db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(namespace TEXT, url TEXT, entry TEXT, used_at REAL, PRIMARY KEY (namespace, url))",
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+
+            _LOGGER.debug(f"persisting GitHub API responses in {path}")
+
+    def __len__(self) -> int:
+        """Return the number of responses held in memory."""
+        return len(self._entries)
+
+    def get(self, namespace: str, url: str) -> typing.Optional[CacheEntry]:
+        """Get the cached response of the URL."""
+        key = (namespace, url)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        if self._db is None:
+            return None
+
+        row = self._db.execute(
+            "SELECT entry FROM responses WHERE namespace = ? AND url = ?", (namespace, url),
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry = tuple(json.loads(row[0]))
+        self._remember(key, entry)
+
+        return entry
+
+    def set(self, namespace: str, url: str, entry: CacheEntry) -> None:
+        """Cache the response of the URL, evicting the least recently used response if the cache is full."""
+        self._remember((namespace, url), entry)
+
+        if self._db is None:
+            return
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (namespace, url, entry, used_at) VALUES (?, ?, ?, ?)",
+            (namespace, url, json.dumps(entry), time.time()),
+        )
+
+        overflow = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE rowid IN (SELECT rowid FROM responses ORDER BY used_at LIMIT ?)",
+                (overflow,),
+            )
+
+    def delete(self, namespace: str, url: str) -> None:
+        """Forget the response of the URL."""
+        self._entries.pop((namespace, url), None)
+
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses WHERE namespace = ? AND url = ?", (namespace, url))
+
+    def _remember(self, key: typing.Tuple[str, str], entry: CacheEntry) -> None:
+        """Hold the response in memory."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def urls(self, namespace: str) -> typing.Iterator[str]:
+        """Iterate over the URLs of the namespace held in memory."""
+        return iter([url for key_namespace, url in list(self._entries) if key_namespace == namespace])
+
+    def view(self, namespace: str) -> "ResponseCacheView":
+        """Get the mapping of URLs to responses of one namespace, as used by gidgethub."""
+        return ResponseCacheView(self, namespace)
+
+
+class ResponseCacheView(MutableMapping):
+    """The responses of one namespace, counting cache hits and misses."""
+
+    def __init__(self, cache: ResponseCache, namespace: str):
+        """Initialize the view."""
+        self.cache = cache
+        self.namespace = namespace
+
+    def __getitem__(self, url: str) -> CacheEntry:
+        """Get the cached response, a hit means gidgethub sends a conditional request."""
+        entry = self.cache.get(self.namespace, url)
+
+        if entry is None:
+            metrics.GITHUB_CACHE_REQUESTS.labels(result="miss").inc()
+            raise KeyError(url)
+
+        metrics.GITHUB_CACHE_REQUESTS.labels(result="hit").inc()
+        return entry
+
+    def __setitem__(self, url: str, entry: CacheEntry) -> None:
+        """Cache a response."""
+        self.cache.set(self.namespace, url, entry)
+
+    def __delitem__(self, url: str) -> None:
+        """Forget a response."""
+        self.cache.delete(self.namespace, url)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate over the URLs held in memory."""
+        return self.cache.urls(self.namespace)
+
+    def __len__(self) -> int:
+        """Return the number of responses held in memory."""
+        return sum(1 for _ in self)
+
+
+class CachingGitHubAPI(RawGitHubAPI):
+    """A GitHub API client making conditional GET requests, using the process-wide response cache."""
+
+    def __init__(self, token, *, namespace: str = "default", cache: ResponseCache = None, **kwargs):
+        """Initialize the client, responses are cached in the given namespace."""
+        if cache is None:
+            cache = get_response_cache()
+
+        kwargs.pop("cache", None)
+        super().__init__(token, cache=cache.view(namespace), **kwargs)
+
+    async def _request(self, method: str, url: str, headers: typing.Mapping[str, str], body: bytes = b""):
+        """Make the request, counting responses served from the cache."""
+        response = await super()._request(method, url, headers, body)
+
+        if response[0] == 304:
+            metrics.GITHUB_CACHE_REQUESTS.labels(result="not_modified").inc()
+
+        return response
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache, configured by ``SESHETA_GITHUB_CACHE_*``."""
+    global _RESPONSE_CACHE
+
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None:
+            _RESPONSE_CACHE = ResponseCache(GITHUB_CACHE_MAX_ENTRIES, GITHUB_CACHE_PATH)
+
+    return _RESPONSE_CACHE
+
+
+def get_installation_client() -> RawGitHubAPI:
+    """Get a caching client for the GitHub App installation of the event being handled.
+
+    The client uses the access token cached in the installation index and the pooled HTTP session.
+    Outside of an installation, e.g. in a GitHub Action, the client from the runtime context is used as is.
+    """
+    # imported here, the installation index uses the caching client
+    from aicoe.sesheta.installations import get_installation_index
+
+    try:
+        installation = RUNTIME_CONTEXT.app_installation
+        installation_id = RUNTIME_CONTEXT.github_event.payload["installation"]["id"]
+    except (LookupError, AttributeError, TypeError):
+        installation = None
+
+    if installation is None:
+        return RUNTIME_CONTEXT.app_installation_client
+
+    return get_installation_index().client(installation_id, installation)
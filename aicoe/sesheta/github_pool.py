@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A shared pool of HTTP connections to the GitHub API, for the command line tools and action helpers.
+
+All helpers using the ``GITHUB_ACCESS_TOKEN`` share one ``aiohttp.ClientSession`` per event loop, so
+that connections are kept alive between requests, DNS lookups are cached, and TLS handshakes are
+done once per connection instead of once per call. The pool is configured by ``SESHETA_GITHUB_POOL_*``.
+"""
+
+
+import asyncio
+import os
+import logging
+import threading
+import typing
+
+import aiohttp
+
+from octomachinery.github.api.tokens import GitHubOAuthToken
+
+from aicoe.sesheta.github_cache import CachingGitHubAPI
+
+
+_LOGGER = logging.getLogger(__name__)
+
+GITHUB_API_URL = os.getenv("SESHETA_GITHUB_API_URL", "https://api.github.com")  # pragma: no cover
+GITHUB_POOL_LIMIT = int(os.getenv("SESHETA_GITHUB_POOL_LIMIT", 100))  # pragma: no cover
+GITHUB_POOL_LIMIT_PER_HOST = int(os.getenv("SESHETA_GITHUB_POOL_LIMIT_PER_HOST", 20))  # pragma: no cover
+GITHUB_POOL_DNS_TTL = int(os.getenv("SESHETA_GITHUB_POOL_DNS_TTL", 300))  # pragma: no cover
+GITHUB_POOL_KEEPALIVE_TIMEOUT = float(os.getenv("SESHETA_GITHUB_POOL_KEEPALIVE_TIMEOUT", 30))  # pragma: no cover
+
+_GITHUB_POOL = None
+_GITHUB_POOL_LOCK = threading.Lock()
+
+TokenFactory = typing.Callable[[], typing.Awaitable[GitHubOAuthToken]]
+
+
+class GitHubClientPool:
+    """One keep-alive ``aiohttp.ClientSession`` per event loop, and GitHub API clients using it."""
+
+    def __init__(
+        self,
+        base_url: str = GITHUB_API_URL,
+        limit: int = GITHUB_POOL_LIMIT,
+        limit_per_host: int = GITHUB_POOL_LIMIT_PER_HOST,
+        dns_ttl: int = GITHUB_POOL_DNS_TTL,
+        keepalive_timeout: float = GITHUB_POOL_KEEPALIVE_TIMEOUT,
+        user_agent: str = "sesheta-actions",
+    ):
+        """Initialize the pool, the session is created on first use."""
+        self.base_url = base_url
+        self.user_agent = user_agent
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+
+        self._loop = None
+        self._session = None
+
+    def session(self) -> aiohttp.ClientSession:
+        """Get the session of the running event loop, creating it if there is none (yet)."""
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+
+            _LOGGER.debug(f"created a GitHub API session, at most {self.limit_per_host} connections per host")
+
+        return self._session
+
+    def client(self, token: typing.Union[str, TokenFactory, None] = None, namespace: str = None) -> CachingGitHubAPI:
+        """Get a client using the shared session, for ``GITHUB_ACCESS_TOKEN`` by default.
+
+        The token may be a coroutine function returning the current token, e.g. of a GitHub App installation.
+        Responses are cached in the given namespace, which defaults to the one of the access token.
+        """
+        if token is None:
+            token = os.environ["GITHUB_ACCESS_TOKEN"]
+
+        if isinstance(token, str):
+            token = GitHubOAuthToken(token)
+
+        return CachingGitHubAPI(
+            token,
+            namespace=namespace or "access-token",
+            session=self.session(),
+            user_agent=self.user_agent,
+            base_url=self.base_url,
+        )
+
+    async def close(self) -> None:
+        """Close the session, a new one is created on next use."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+        self._loop = None
+
+
+def get_github_pool() -> GitHubClientPool:
+    """Get the process-wide GitHub client pool."""
+    global _GITHUB_POOL
+
+    with _GITHUB_POOL_LOCK:
+        if _GITHUB_POOL is None:
+            _GITHUB_POOL = GitHubClientPool()
+
+    return _GITHUB_POOL
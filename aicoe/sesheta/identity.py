@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A directory mapping GitHub logins to real names and Google Chat user IDs."""
+
+
+import asyncio
+import os
+import logging
+import time
+import typing
+import unicodedata
+
+from aiographql.client import GraphQLClient, GraphQLRequest, GraphQLResponse
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.chat_client import get_chat_client
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_GITHUB_ORG_MEMBERS_QUERY = """
+query($org: String!, $after: String) {
+  organization(login: $org) {
+    membersWithRole(first: 100, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      edges {
+        node {
+          name
+          login
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class Identity(typing.NamedTuple):
+    """A person known to Sesheta."""
+
+    login: str
+    name: str
+    chat_user_id: typing.Optional[str]
+
+
+async def get_github_members(org: str = "thoth-station") -> dict:
+    """Get all GitHub org members (login to name), following the pagination."""
+    client = GraphQLClient(
+        endpoint="https://api.github.com/graphql",
+        headers={"Authorization": f"Bearer {os.environ['GITHUB_TOKEN']}"},
+    )
+    members = dict()
+    after = None
+
+    while True:
+        resp: GraphQLResponse = await client.query(
+            request=GraphQLRequest(query=_GITHUB_ORG_MEMBERS_QUERY, variables={"org": org, "after": after}),
+        )
+        _LOGGER.debug(resp.data)
+
+        members_with_role = resp.data["organization"]["membersWithRole"]
+        for member in members_with_role["edges"]:
+            members[member["node"]["login"].lower()] = member["node"]["name"]
+
+        if not members_with_role["pageInfo"]["hasNextPage"]:
+            break
+
+        after = members_with_role["pageInfo"]["endCursor"]
+
+    _LOGGER.debug(members)
+
+    return members
+
+
+def get_chat_members(space: str) -> dict:
+    """Get all members of a Google Chat space (display name to user ID), this will block."""
+    members = dict()
+    page_token = None
+
+    while True:
+        response = get_chat_client().list_members(space, page_token=page_token)
+
+        for membership in response.get("memberships", []):
+            member = membership.get("member", {})
+            if member.get("displayName") and member.get("name"):
+                members[member["displayName"]] = member["name"].replace("users/", "")
+
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+    return members
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for matching GitHub and Google Chat display names: no accents, case or punctuation."""
+    decomposed = unicodedata.normalize("NFKD", name)
+
+    return "".join(c for c in decomposed if c.isalnum()).lower()
+
+
+class IdentityDirectory:
+    """An in-memory index from GitHub login to real name and Google Chat user ID.
+
+    Lookups never touch the network: once the index is older than ``ttl`` seconds, a lookup
+    schedules a refresh from the GitHub org members and the Google Chat space members in the
+    background, and the current index is used until the refresh is done.
+
+    GitHub and Google Chat share no identifier, so a login is joined to a Chat user ID by the
+    normalized real name on GitHub and display name in Chat. A login without a public name, or with
+    a name differing from the Chat display name (e.g. a nickname), gets no Chat user ID unless it is
+    seeded via ``chat_user_ids``. Chat members sharing a normalized display name are ambiguous and
+    not mapped at all, rather than mentioning the wrong person.
+    """
+
+    def __init__(
+        self,
+        github_orgs: typing.List[str],
+        chat_spaces: typing.List[str],
+        realnames: dict = None,
+        chat_user_ids: dict = None,
+        ttl: float = 3600,
+        retry_interval: float = 300,
+    ):
+        """Initialize the directory, ``realnames`` and ``chat_user_ids`` are used as a seed."""
+        self.github_orgs = github_orgs
+        self.chat_spaces = [space for space in chat_spaces if space]
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+
+        self._realnames = {login.lower(): name for login, name in (realnames or {}).items()}
+        self._chat_user_ids = chat_user_ids or {}
+        self._index = self._build_index({}, {})
+        self._updated_at = None
+        self._refresh_task = None
+
+    def _build_index(self, github_members: dict, chat_members: dict) -> typing.Dict[str, Identity]:
+        """Join GitHub logins to Google Chat user IDs using the (normalized) real names."""
+        names = dict(self._realnames)
+        names.update({login: name for login, name in github_members.items() if name})
+
+        chat_user_ids = {normalize_name(name): user_id for name, user_id in self._chat_user_ids.items()}
+
+        ambiguous = set()
+        live_user_ids = dict()
+        for name, user_id in chat_members.items():
+            key = normalize_name(name)
+            if live_user_ids.get(key, user_id) != user_id:
+                ambiguous.add(key)
+            live_user_ids[key] = user_id
+
+        for key in ambiguous:
+            _LOGGER.warning(f"several Google Chat members are named '{key}', not mapping them to a GitHub login")
+            live_user_ids[key] = None
+
+        chat_user_ids.update(live_user_ids)
+
+        return {
+            login: Identity(login, name, chat_user_ids.get(normalize_name(name))) for login, name in names.items()
+        }
+
+    async def refresh(self) -> None:
+        """Sync the GitHub org members and Google Chat space members, and swap in the new index."""
+        github_members = dict()
+        chat_members = dict()
+
+        try:
+            if os.getenv("GITHUB_TOKEN"):
+                for members in await asyncio.gather(*(get_github_members(org) for org in self.github_orgs)):
+                    github_members.update(members)
+
+            loop = asyncio.get_running_loop()
+            for members in await asyncio.gather(
+                *(loop.run_in_executor(None, get_chat_members, space) for space in self.chat_spaces),
+            ):
+                chat_members.update(members)
+        except Exception as exc:
+            _LOGGER.error(f"failed to refresh the identity directory: {exc}")
+            self._updated_at = time.monotonic() - self.ttl + self.retry_interval
+            return
+
+        self._index = self._build_index(github_members, chat_members)
+        self._updated_at = time.monotonic()
+        metrics.IDENTITY_DIRECTORY_SIZE.set(len(self._index))
+
+        _LOGGER.info(
+            f"identity directory refreshed: {len(self._index)} logins, "
+            f"{sum(1 for i in self._index.values() if i.chat_user_id)} with a Google Chat user ID",
+        )
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh if the index is stale and we run within an event loop."""
+        if self._updated_at is not None and time.monotonic() - self._updated_at < self.ttl:
+            return
+
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        try:
+            self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+        except RuntimeError:
+            pass  # no event loop, e.g. a command line tool, keep using the seed
+
+    def lookup(self, login: str) -> typing.Optional[Identity]:
+        """Look up the identity of a GitHub login."""
+        self._schedule_refresh()
+
+        return self._index.get(login.lower())
+
+    def realname(self, login: str) -> str:
+        """Get the real name of a GitHub login, or the login if unknown."""
+        identity = self.lookup(login)
+
+        return identity.name if identity is not None else login
+
+    def chat_user_id(self, login: str) -> typing.Optional[str]:
+        """Get the Google Chat user ID of a GitHub login."""
+        identity = self.lookup(login)
+
+        return identity.chat_user_id if identity is not None else None
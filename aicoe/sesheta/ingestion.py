@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""The ingestion stage in front of the webhook handlers: drop redeliveries and debounce event storms.
+
+GitHub redelivers webhooks with the same ``X-GitHub-Delivery``, these are dropped. Bursts of events
+of the same action family on one Pull Request (e.g. a series of ``synchronize`` events) are debounced:
+an event is held back for ``SESHETA_DEBOUNCE_WINDOW`` seconds and dropped if a later event of the same
+family arrived meanwhile, as its payload carries the later state of the Pull Request. Each action is a
+family of its own, as different handlers react to different actions: a ``labeled`` event must not
+drop the ``synchronize`` event before it.
+"""
+
+
+import asyncio
+import os
+import logging
+import typing
+
+from collections import OrderedDict
+
+from octomachinery.app.routing.routers import ConcurrentRouter
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.scheduler import EventScheduler, get_event_scheduler, scheduling_key
+
+
+_LOGGER = logging.getLogger(__name__)
+
+DEBOUNCE_WINDOW = float(os.getenv("SESHETA_DEBOUNCE_WINDOW", 2.0))  # pragma: no cover
+DELIVERY_LOG_MAX_LEN = int(os.getenv("SESHETA_DELIVERY_LOG_MAX_LEN", 10000))  # pragma: no cover
+
+# actions of the pull_request event which only change the state of a Pull Request, the latest state of
+# each action wins
+_PULL_REQUEST_UPDATE_ACTIONS = ["synchronize", "edited", "labeled", "unlabeled"]
+
+
+def action_family(event_name: str, payload: dict) -> typing.Optional[str]:
+    """Get the action family of an event which may be debounced, None if each event has to be processed."""
+    action = payload.get("action")
+
+    if event_name == "pull_request" and action in _PULL_REQUEST_UPDATE_ACTIONS:
+        return f"pull_request_{action}"
+
+    if event_name == "issue_comment" and action == "created" and "pull_request" in payload.get("issue", {}):
+        if payload.get("comment", {}).get("body", "").startswith("Build succeeded."):
+            return "check_gate"
+
+    return None
+
+
+def debounce_key(event_name: str, payload: dict) -> typing.Optional[typing.Tuple[str, int, str]]:
+    """Get the (repository, Pull Request, action family) an event is debounced by, None if it is not."""
+    family = action_family(event_name, payload)
+    if family is None:
+        return None
+
+    number = payload.get("number") or payload.get("issue", {}).get("number")
+    repository = payload.get("repository", {}).get("full_name")
+    if number is None or repository is None:
+        return None
+
+    return (repository.lower(), number, family)
+
+
+class Arrival(typing.NamedTuple):
+    """An event which arrived: its debounce key (None if it is not debounced), generation and deadline."""
+
+    key: typing.Optional[typing.Tuple[str, int, str]]
+    generation: int
+    deadline: float
+
+
+class IngestionStage:
+    """Decide which webhook deliveries are processed."""
+
+    def __init__(self, window: float = DEBOUNCE_WINDOW, max_deliveries: int = DELIVERY_LOG_MAX_LEN):
+        """Initialize the stage, a ``window`` of 0 turns debouncing off."""
+        self.window = window
+        self.max_deliveries = max_deliveries
+        self._deliveries = OrderedDict()
+        self._latest = {}
+
+    def _seen(self, delivery_id) -> bool:
+        """Check if the delivery has been seen, and remember it if not."""
+        if delivery_id is None:
+            return False
+
+        delivery_id = str(delivery_id)
+        if delivery_id in self._deliveries:
+            self._deliveries.move_to_end(delivery_id)
+            return True
+
+        self._deliveries[delivery_id] = None
+        while len(self._deliveries) > self.max_deliveries:
+            self._deliveries.popitem(last=False)
+
+        return False
+
+    def arrive(self, event) -> typing.Optional[Arrival]:
+        """Record the arrival of the event, return None if it is a redelivery which is dropped."""
+        if self._seen(getattr(event, "delivery_id", None)):
+            _LOGGER.debug(f"dropping redelivery {event.delivery_id} of {event.name}")
+            metrics.WEBHOOK_DELIVERIES.labels(event=event.name, result="duplicate").inc()
+            return None
+
+        key = debounce_key(event.name, event.payload)
+        if key is None or self.window <= 0:
+            return Arrival(None, 0, 0.0)
+
+        generation = self._latest.get(key, 0) + 1
+        self._latest[key] = generation
+
+        return Arrival(key, generation, asyncio.get_running_loop().time() + self.window)
+
+    async def settle(self, event, arrival: Arrival) -> bool:
+        """Check if the arrived event should be processed, a debounced one is held back until its window passed."""
+        if arrival.key is None:
+            metrics.WEBHOOK_DELIVERIES.labels(event=event.name, result="processed").inc()
+            return True
+
+        await asyncio.sleep(max(0.0, arrival.deadline - asyncio.get_running_loop().time()))
+
+        if self._latest.get(arrival.key) != arrival.generation:
+            _LOGGER.debug(f"dropping {event.name} of {arrival.key}, a later event arrived within {self.window}s")
+            metrics.WEBHOOK_DELIVERIES.labels(event=event.name, result="debounced").inc()
+            return False
+
+        del self._latest[arrival.key]
+        metrics.WEBHOOK_DELIVERIES.labels(event=event.name, result="processed").inc()
+
+        return True
+
+    async def admit(self, event) -> bool:
+        """Check if the event should be processed, debounced events are held back for the window."""
+        arrival = self.arrive(event)
+
+        return arrival is not None and await self.settle(event, arrival)
+
+
+class IngestionRouter(ConcurrentRouter):
+    """A router dispatching the events admitted by the ingestion stage, via the event scheduler.
+
+    It takes over the routes of the given routers, so it has to be created after all handlers have been
+    registered.
+    """
+
+    def __init__(
+        self,
+        *other_routers,
+        stage: typing.Optional[IngestionStage] = None,
+        scheduler: typing.Optional[EventScheduler] = None,
+    ):
+        """Initialize the router with the routes of ``other_routers``."""
+        super().__init__(*other_routers)
+        self.stage = stage if stage is not None else IngestionStage()
+        self.scheduler = scheduler if scheduler is not None else get_event_scheduler()
+
+    async def dispatch(self, event, *args, **kwargs) -> None:
+        """Invoke the handlers of the event if it is admitted, in order with the other events of its Pull Request.
+
+        The event takes its place in the order on arrival, it is debounced once it is its turn: a debounced
+        event held back does not let a later event of its Pull Request overtake it.
+        """
+        arrival = self.stage.arrive(event)
+        if arrival is None:
+            return
+
+        dispatch = super().dispatch
+
+        async def job():
+            if await self.stage.settle(event, arrival):
+                await dispatch(event, *args, **kwargs)
+
+        await self.scheduler.run(scheduling_key(event.name, event.payload), job)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""An index of the installations of the GitHub App by account login, with cached access tokens.
+
+The installations are listed once, and kept up to date by ``installation`` webhooks. The access token
+of an installation is requested when it is first used, and refreshed in the background shortly before
+it expires, so that getting a client for an account does not need any GitHub API call. Only tokens
+which have been used since they were requested are refreshed, so that installations which are not
+used do not request any tokens.
+"""
+
+
+import asyncio
+import os
+import logging
+import threading
+import typing
+
+from datetime import datetime, timezone
+
+from octomachinery.github.api.tokens import GitHubOAuthToken
+from octomachinery.github.entities.app_installation import GitHubAppInstallation
+from octomachinery.github.models import GitHubAppInstallation as GitHubAppInstallationModel
+from octomachinery.utils.asynctools import dict_to_kwargs_cb
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.github_cache import CachingGitHubAPI
+from aicoe.sesheta.github_pool import get_github_pool
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# refresh access tokens this many seconds before they expire
+INSTALLATION_TOKEN_REFRESH_MARGIN = float(
+    os.getenv("SESHETA_INSTALLATION_TOKEN_REFRESH_MARGIN", 300),
+)  # pragma: no cover
+
+_INSTALLATION_INDEX = None
+_INSTALLATION_INDEX_LOCK = threading.Lock()
+
+
+class Installation(typing.NamedTuple):
+    """An installation of the GitHub App into an account."""
+
+    id: int
+    login: str
+    installation: GitHubAppInstallation
+
+
+class InstallationIndex:
+    """The installations of a GitHub App by account login, and their access tokens."""
+
+    def __init__(self, refresh_margin: float = INSTALLATION_TOKEN_REFRESH_MARGIN):
+        """Initialize an empty index, it is loaded on the first lookup."""
+        self.refresh_margin = refresh_margin
+        self.github_app = None
+
+        self._installations = {}
+        self._tokens = {}
+        self._token_locks = {}
+        self._used = set()
+        self._refresher = None
+        self._load_lock = None
+
+        metrics.INSTALLATION_INDEX_SIZE.set_function(lambda: len(self._installations))
+
+    def __len__(self) -> int:
+        """Return the number of installations in the index."""
+        return len(self._installations)
+
+    async def _add(self, github_app, payload: dict) -> None:
+        """Index the installation of an API response or webhook by the login of its account."""
+        metadata = await dict_to_kwargs_cb(GitHubAppInstallationModel)(payload)
+        login = metadata.account["login"]
+
+        self._installations[login.lower()] = Installation(
+            metadata.id, login, GitHubAppInstallation(metadata, github_app),
+        )
+
+    def _remove(self, login: str) -> None:
+        """Forget the installation of the account, and its access token."""
+        installation = self._installations.pop(login.lower(), None)
+        if installation is None:
+            return
+
+        self._tokens.pop(installation.id, None)
+        self._token_locks.pop(installation.id, None)
+        self._used.discard(installation.id)
+
+    async def load(self, github_app) -> None:
+        """List the installations of the GitHub App, once."""
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+
+        async with self._load_lock:
+            if self.github_app is github_app:
+                return
+
+            self._installations = {}
+            async for payload in github_app.api_client.getiter("/app/installations", preview_api_version="machine-man"):
+                await self._add(github_app, payload)
+
+            self.github_app = github_app
+            _LOGGER.info(f"indexed {len(self._installations)} installations")
+
+    async def get(self, github_app, account: str) -> typing.Optional[Installation]:
+        """Get the installation into the account, None if the GitHub App is not installed there."""
+        if self.github_app is not github_app:
+            await self.load(github_app)
+
+        installation = self._installations.get(account.lower())
+        metrics.INSTALLATION_INDEX_LOOKUPS.labels(result="hit" if installation is not None else "miss").inc()
+
+        return installation
+
+    @staticmethod
+    def _expires_in(token) -> float:
+        """Get the seconds until the access token expires."""
+        return (token.expires_at - datetime.now(timezone.utc)).total_seconds()
+
+    async def token(self, installation_id: int, installation: GitHubAppInstallation) -> GitHubOAuthToken:
+        """Get the access token of the installation, it is only requested if there is no valid one.
+
+        Tokens are refreshed in the background, a token is requested here on the first use of the
+        installation or if it has expired nevertheless. Concurrent requests wait for one token.
+        """
+        entry = self._tokens.get(installation_id)
+
+        if entry is None or self._expires_in(entry[0]) <= 0:
+            entry = await self._request_token(installation_id, installation, expired=entry)
+
+        self._used.add(installation_id)
+        return GitHubOAuthToken(entry[0].token)
+
+    async def _request_token(
+        self, installation_id: int, installation: GitHubAppInstallation, expired: typing.Optional[tuple] = None,
+    ) -> tuple:
+        """Request a new access token, unless another one has been requested meanwhile."""
+        lock = self._token_locks.setdefault(installation_id, asyncio.Lock())
+
+        async with lock:
+            entry = self._tokens.get(installation_id)
+
+            if entry is None or entry is expired:
+                entry = (await installation.get_token(), installation)
+                self._tokens[installation_id] = entry
+                self._used.discard(installation_id)
+                metrics.INSTALLATION_TOKEN_REQUESTS.inc()
+
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.ensure_future(self._refresh_tokens())
+
+        return entry
+
+    async def _refresh_tokens(self) -> None:
+        """Refresh the access tokens within the refresh margin of their expiry, until there is none left.
+
+        Tokens which have not been used since they were requested are dropped instead.
+        """
+        while self._tokens:
+            expires_in = min(self._expires_in(token) for token, _ in self._tokens.values())
+            await asyncio.sleep(max(expires_in - self.refresh_margin, 0))
+
+            for installation_id, entry in list(self._tokens.items()):
+                if self._tokens.get(installation_id) is not entry or self._expires_in(entry[0]) > self.refresh_margin:
+                    continue
+
+                if installation_id not in self._used:
+                    _LOGGER.debug(f"installation {installation_id} has not been used, not refreshing its access token")
+                    self._tokens.pop(installation_id, None)
+                    continue
+
+                try:
+                    await self._request_token(installation_id, entry[1], expired=entry)
+                except Exception as exc:  # pylint: disable=broad-except
+                    _LOGGER.warning(f"refreshing the access token of installation {installation_id} failed: {exc}")
+                    self._tokens.pop(installation_id, None)
+
+    async def close(self) -> None:
+        """Stop refreshing the access tokens."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            await asyncio.gather(self._refresher, return_exceptions=True)
+            self._refresher = None
+
+    def client(self, installation_id: int, installation: GitHubAppInstallation) -> CachingGitHubAPI:
+        """Get a caching client for the installation, using its cached access token and the pooled session."""
+
+        async def token() -> GitHubOAuthToken:
+            return await self.token(installation_id, installation)
+
+        return get_github_pool().client(token, namespace=f"installation/{installation_id}")
+
+    async def apply_installation_event(self, payload: dict) -> None:
+        """Update the index from an ``installation`` webhook, if it has been loaded already."""
+        if self.github_app is None:
+            return
+
+        login = payload["installation"]["account"]["login"]
+
+        if payload["action"] in ["deleted", "suspend"]:
+            _LOGGER.info(f"removing the installation into {login} from the index")
+            self._remove(login)
+        elif payload["action"] in ["created", "unsuspend", "new_permissions_accepted"]:
+            _LOGGER.info(f"adding the installation into {login} to the index")
+            self._remove(login)
+
+            await self._add(self.github_app, payload["installation"])
+
+
+def get_installation_index() -> InstallationIndex:
+    """Get the process-wide installation index."""
+    global _INSTALLATION_INDEX
+
+    with _INSTALLATION_INDEX_LOCK:
+        if _INSTALLATION_INDEX is None:
+            _INSTALLATION_INDEX = InstallationIndex()
+
+    return _INSTALLATION_INDEX
@@ -27,6 +27,7 @@ from thoth.common import init_logging
 from aicoe.sesheta import __version__
 from aicoe.sesheta.actions.common import cocommand
 from aicoe.sesheta.actions.pull_request import merge_master_into_pullrequest
+from aicoe.sesheta.github_pool import get_github_pool
 
 
 init_logging(logging_env_var_start="SEFKHET__ABWY_LOG_")
@@ -74,9 +75,12 @@ async def cli(
 
     # TODO check if owner, repo, pull_request is not None or 0
 
-    triggered = await merge_master_into_pullrequest(
-        owner, repo, pull_request, token=github_access_token, dry_run=dry_run,
-    )
+    try:
+        triggered = await merge_master_into_pullrequest(
+            owner, repo, pull_request, token=github_access_token, dry_run=dry_run,
+        )
+    finally:
+        await get_github_pool().close()
 
     if not triggered:
         raise Exception("Pull Request update has not been triggered")
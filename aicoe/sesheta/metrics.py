@@ -24,11 +24,152 @@ import os
 import logging
 
 
-from prometheus_client import Histogram
+from prometheus_client import Counter, Gauge, Histogram, Summary
 
 
 _LOGGER = logging.getLogger(__name__)
 
+METRICS_PORT = int(os.getenv("SESHETA_METRICS_PORT", 8000))  # pragma: no cover
+
 
 # Premotheus metrics to be collected
 REQ_TIME = Histogram("req_time_seconds", "time spent in requests")
+
+# Google Chat notifications
+CHAT_NOTIFICATIONS = Counter("chat_notifications_total", "number of chat notifications by kind", ["kind"])
+CHAT_NOTIFICATIONS_DROPPED = Counter(
+    "chat_notifications_dropped_total", "number of chat notifications which have not been delivered", ["reason"],
+)
+CHAT_QUEUE_DEPTH = Gauge("chat_notification_queue_depth", "number of chat notifications waiting to be delivered")
+CHAT_OUTBOX_PENDING = Gauge("chat_notification_outbox_pending", "number of chat notifications in the outbox")
+CHAT_DELIVERY_LATENCY = Histogram(
+    "chat_notification_delivery_seconds", "time from enqueueing a chat notification until it has been delivered",
+)
+CHAT_API_LATENCY = Histogram("chat_api_request_seconds", "time spent in Google Chat API requests", ["method"])
+CHAT_MESSAGES_SENT = Counter("chat_messages_sent_total", "number of messages sent to Google Chat", ["space"])
+CHAT_SEND_RETRIES = Counter("chat_send_retries_total", "number of retried Google Chat API requests")
+CHAT_SEND_FAILURES = Counter(
+    "chat_send_failures_total", "number of chat messages which could not be sent", ["reason"],
+)
+CHAT_COALESCED_MESSAGES = Counter(
+    "chat_notification_coalesced_total", "number of chat notifications merged into another notification",
+)
+
+# deduplication of notifications
+NOTIFICATION_DEDUP_HITS = Counter(
+    "notification_dedup_hits_total", "number of notifications suppressed as duplicates", ["backend"],
+)
+NOTIFICATION_DEDUP_MISSES = Counter(
+    "notification_dedup_misses_total", "number of notifications not seen before", ["backend"],
+)
+NOTIFICATION_DEDUP_EVICTIONS = Counter(
+    "notification_dedup_evictions_total", "number of keys removed from the dedup store", ["backend", "reason"],
+)
+
+# ingestion of webhooks
+WEBHOOK_DELIVERIES = Counter(
+    "webhook_deliveries_total",
+    "number of webhook deliveries by result: processed, duplicate (redelivery) or debounced",
+    ["event", "result"],
+)
+WEBHOOK_QUEUE_DEPTH = Gauge("webhook_queue_depth", "number of acknowledged webhook events waiting to be processed")
+WEBHOOK_IN_FLIGHT = Gauge("webhook_in_flight", "number of acknowledged webhook events being processed")
+WEBHOOK_ACK_LATENCY = Histogram(
+    "webhook_ack_seconds", "time from receiving a webhook delivery until it has been acknowledged",
+)
+WEBHOOK_PROCESSING_LATENCY = Histogram(
+    "webhook_processing_seconds",
+    "time from receiving a webhook delivery until its handlers have been run",
+    ["event"],
+)
+
+# scheduling of webhook events
+EVENT_SCHEDULER_QUEUE_LENGTH = Gauge(
+    "event_scheduler_queue_length",
+    "number of events queued or running per Pull Request",
+    ["repository", "pull_request"],
+)
+EVENT_SCHEDULER_IN_FLIGHT = Gauge("event_scheduler_in_flight", "number of events being processed")
+EVENT_SCHEDULER_WAIT_TIME = Histogram(
+    "event_scheduler_wait_seconds", "time events waited for their turn before being processed",
+)
+EVENT_SCHEDULER_BACKPRESSURE_WAITS = Counter(
+    "event_scheduler_backpressure_waits_total", "number of events which had to wait for room in the scheduler",
+)
+
+# GitHub API usage
+GITHUB_PULL_REQUEST_FETCHES = Counter(
+    "github_pull_request_fetches_total",
+    "number of times actions asked for a Pull Request, by where it came from",
+    ["source"],
+)
+GITHUB_CACHE_REQUESTS = Counter(
+    "github_cache_requests_total",
+    "number of GitHub API GET requests by cache result: miss, hit (conditional request) or not_modified (304)",
+    ["result"],
+)
+CHECK_RUN_REQUESTS = Counter(
+    "check_run_requests_total",
+    "number of check runs reported by action: created, updated or skipped (conclusion unchanged)",
+    ["action"],
+)
+
+# commit status index
+COMMIT_STATUS_INDEX_SIZE = Gauge("commit_status_index_commits", "number of commits in the commit status index")
+COMMIT_STATUS_INDEX_LOOKUPS = Counter(
+    "commit_status_index_lookups_total", "number of commit status lookups by result: hit or miss", ["result"],
+)
+
+# materialized view of the open Pull Requests
+PULL_REQUEST_STORE_SIZE = Gauge(
+    "pull_request_store_open_pull_requests", "number of open Pull Requests in the store", ["backend"],
+)
+PULL_REQUEST_STORE_LOOKUPS = Counter(
+    "pull_request_store_lookups_total", "number of Pull Request lookups by result: hit or miss", ["backend", "result"],
+)
+PULL_REQUEST_STORE_OUTDATED_WRITES = Counter(
+    "pull_request_store_outdated_writes_total", "number of Pull Requests not stored as they were outdated", ["backend"],
+)
+
+# re-checks of Pull Requests whose mergeability is not known yet
+MERGEABILITY_RECHECKS_PENDING = Gauge(
+    "mergeability_rechecks_pending", "number of Pull Request re-checks waiting for their next attempt",
+)
+MERGEABILITY_RECHECKS = Counter(
+    "mergeability_rechecks_total",
+    "number of Pull Request re-checks by result: resolved, retried, gave_up, coalesced or dropped",
+    ["result"],
+)
+
+# rebase sweep after a push to the default branch
+REBASE_SWEEP_UPDATED = Summary(
+    "rebase_sweep_updated_pull_requests", "number of Pull Requests updated with their base branch per push",
+)
+
+# parsed CODEOWNERS per repository
+CODEOWNERS_CACHE_SIZE = Gauge("codeowners_cache_repositories", "number of repositories in the CODEOWNERS cache")
+CODEOWNERS_CACHE_LOOKUPS = Counter(
+    "codeowners_cache_lookups_total",
+    "number of CODEOWNERS lookups by result: hit, negative_hit (repository has none) or miss",
+    ["result"],
+)
+
+# installations of the GitHub App
+INSTALLATION_INDEX_SIZE = Gauge("installation_index_installations", "number of installations in the installation index")
+INSTALLATION_INDEX_LOOKUPS = Counter(
+    "installation_index_lookups_total", "number of installation lookups by account, by result: hit or miss", ["result"],
+)
+INSTALLATION_TOKEN_REQUESTS = Counter(
+    "installation_token_requests_total", "number of installation access tokens requested from GitHub",
+)
+
+# identity directory
+IDENTITY_DIRECTORY_SIZE = Gauge("identity_directory_logins", "number of GitHub logins in the identity directory")
+
+
+def start_metrics_server(port: int = METRICS_PORT) -> None:
+    """Export all metrics at ``/metrics`` on the given port, served from a background thread."""
+    from prometheus_async.aio.web import start_http_server_in_thread
+
+    start_http_server_in_thread(port=port)
+    _LOGGER.info(f"exporting Prometheus metrics on port {port} at /metrics")
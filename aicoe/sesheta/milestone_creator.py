@@ -26,11 +26,6 @@ import time
 
 from datetime import datetime
 
-import aiohttp
-
-from octomachinery.github.api.tokens import GitHubOAuthToken
-from octomachinery.github.api.raw_client import RawGitHubAPI
-
 from thoth.common import init_logging
 from aicoe.sesheta import __version__
 from aicoe.sesheta.actions.label import (
@@ -39,6 +34,7 @@ from aicoe.sesheta.actions.label import (
     create_or_update_label,
     create_or_update_milestone,
 )
+from aicoe.sesheta.github_pool import get_github_pool
 
 
 init_logging(logging_env_var_start="SEFKHET__ABWY_LOG_")
@@ -50,13 +46,12 @@ _LOGGER.info(f"Sesheta action: milestone_creator, Version v{__version__}")
 _LOGGER.debug(f"DEBUG mode is enabled")
 
 
-async def update_milestones(org: str = "thoth-station"):
-    """Update Milestones for one org."""
-    access_token = GitHubOAuthToken(os.environ["GITHUB_ACCESS_TOKEN"])
-
-    async with aiohttp.ClientSession() as client:
-        github_api = RawGitHubAPI(access_token, session=client, user_agent="sesheta-actions")
+async def update_milestones(org: str = "thoth-station", milestones: list = DEFAULT_MILESTONES_THOTH):
+    """Update Milestones for one org, all requests share the connections of the GitHub client pool."""
+    pool = get_github_pool()
+    github_api = pool.client()
 
+    try:
         async for repo in github_api.getiter(f"/orgs/{org}/repos"):
             slug = repo["full_name"]
 
@@ -65,12 +60,18 @@ async def update_milestones(org: str = "thoth-station"):
                 _LOGGER.debug("skipping %s, this repository was archived!", slug)
                 continue
 
-            for milestone in DEFAULT_MILESTONES_THOTH:
+            for milestone in milestones:
                 _LOGGER.debug("checking for %s", milestone)
 
                 await create_or_update_milestone(
-                    slug, milestone["title"], milestone["description"], due_on=milestone["due_on"],
+                    slug,
+                    milestone["title"],
+                    milestone["description"],
+                    due_on=milestone["due_on"],
+                    github_api=github_api,
                 )
+    finally:
+        await pool.close()
 
 
 if __name__ == "__main__":
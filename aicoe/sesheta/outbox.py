@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A durable on-disk outbox for chat notifications.
+
+The outbox is a directory of append-only segment files, each line is one JSON encoded notification.
+A cursor file records up to which position notifications have been delivered, segments before
+the cursor are deleted. Notifications are delivered at least once: after a restart, everything
+after the cursor is delivered (again).
+"""
+
+
+import asyncio
+import os
+import json
+import logging
+import typing
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.coalescer import merge_notifications
+from aicoe.sesheta.dispatcher import Notification
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".log"
+_CURSOR_FILE = "cursor"
+_CURSOR_FORMAT = "{:020d} {:020d}\n"  # fixed width, so that it can be overwritten in place
+
+
+class OutboxDeliveryError(Exception):
+    """Notifications from the outbox could not be delivered, they will be retried."""
+
+
+class Position(typing.NamedTuple):
+    """A position in the outbox: the segment number and the byte offset within it."""
+
+    segment: int
+    offset: int
+
+
+class Outbox:
+    """An append-only, segmented log of notifications."""
+
+    def __init__(self, path: str, segment_size: int = 1024 * 1024, fsync: bool = False):
+        """Open the outbox in the given directory, appending starts in a new segment."""
+        self.path = path
+        self.segment_size = segment_size
+        self.fsync = fsync
+
+        os.makedirs(path, exist_ok=True)
+
+        self._cursor_fd = os.open(os.path.join(path, _CURSOR_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        self.cursor = self._load_cursor()
+        segments = self.segments()
+        self._segment = (segments[-1] if segments else self.cursor.segment) + 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+        self._pending = self._count_pending()
+
+        metrics.CHAT_OUTBOX_PENDING.set(self._pending)
+        _LOGGER.debug(f"opened outbox {path}, {self._pending} notifications pending")
+
+    def _segment_path(self, segment: int) -> str:
+        """Get the file name of a segment."""
+        return os.path.join(self.path, f"{segment:08d}{_SEGMENT_SUFFIX}")
+
+    def segments(self) -> typing.List[int]:
+        """Get the numbers of all segments, in order."""
+        return sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)]) for name in os.listdir(self.path) if name.endswith(_SEGMENT_SUFFIX)
+        )
+
+    def _load_cursor(self) -> Position:
+        """Load the position up to which notifications have been delivered."""
+        cursor = os.pread(self._cursor_fd, 64, 0).split()
+        if len(cursor) != 2:
+            return Position(0, 0)
+
+        return Position(int(cursor[0]), int(cursor[1]))
+
+    def _count_pending(self) -> int:
+        """Count the notifications after the cursor."""
+        return len(self.read(max_records=None))
+
+    @property
+    def pending(self) -> int:
+        """Return the number of notifications not yet delivered."""
+        return self._pending
+
+    def append(self, notification: Notification) -> None:
+        """Append a notification to the outbox."""
+        self._writer.write(json.dumps(notification._asdict()).encode("utf-8") + b"\n")
+        self._writer.flush()
+
+        if self.fsync:
+            os.fsync(self._writer.fileno())
+
+        self._pending += 1
+        metrics.CHAT_OUTBOX_PENDING.set(self._pending)
+
+        if self._writer.tell() >= self.segment_size:
+            self._writer.close()
+            self._segment += 1
+            self._writer = open(self._segment_path(self._segment), "ab")
+
+    def read(self, max_records: typing.Optional[int] = 100) -> typing.List[typing.Tuple[Position, Notification]]:
+        """Read notifications after the cursor, each with the position right after it."""
+        records = []
+
+        for segment in self.segments():
+            if segment < self.cursor.segment:
+                continue
+
+            offset = self.cursor.offset if segment == self.cursor.segment else 0
+
+            with open(self._segment_path(segment), "rb") as segment_file:
+                segment_file.seek(offset)
+
+                for line in segment_file:
+                    offset += len(line)
+
+                    if not line.endswith(b"\n"):
+                        break  # incomplete record, it is still being written
+
+                    try:
+                        notification = Notification(**json.loads(line))
+                    except (ValueError, TypeError) as exc:
+                        _LOGGER.warning(f"skipping malformed record in outbox segment {segment}: {exc}")
+                        continue
+
+                    records.append((Position(segment, offset), notification))
+
+                    if max_records is not None and len(records) >= max_records:
+                        return records
+
+        return records
+
+    def commit(self, position: Position, count: int) -> None:
+        """Record that ``count`` notifications up to ``position`` have been delivered, compact old segments."""
+        os.pwrite(self._cursor_fd, _CURSOR_FORMAT.format(*position).encode("ascii"), 0)
+
+        self.cursor = position
+        self._pending = max(0, self._pending - count)
+        metrics.CHAT_OUTBOX_PENDING.set(self._pending)
+
+        for segment in self.segments():
+            if segment < position.segment:
+                os.remove(self._segment_path(segment))
+                _LOGGER.debug(f"removed delivered outbox segment {segment}")
+
+    def close(self) -> None:
+        """Close the outbox."""
+        self._writer.close()
+        os.close(self._cursor_fd)
+
+
+class OutboxDrainer:
+    """Deliver the notifications from the outbox in the background, at least once.
+
+    Once woken up, the drainer waits for ``coalesce_window`` seconds, then notifications of a batch sent to
+    the same thread are merged into one message. The merged messages of a batch are delivered concurrently;
+    which notifications have been delivered is tracked one by one, so that a failed delivery only causes that
+    one to be retried. The cursor advances over the leading run of delivered notifications.
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        deliver: typing.Callable[[Notification], typing.Awaitable[None]],
+        batch_size: int = 20,
+        poll_interval: float = 5.0,
+        retry_interval: float = 10.0,
+        coalesce_window: float = 0.0,
+    ):
+        """Initialize the drainer, ``deliver`` is awaited for each (merged) notification of a batch."""
+        self.outbox = outbox
+        self._deliver = deliver
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self.coalesce_window = coalesce_window
+        self._delivered = set()
+        self._wakeup = None
+        self._task = None
+
+    def wake(self) -> None:
+        """Wake up the drainer, starting it if it is not running."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+        self._wakeup.set()
+
+    async def _deliver_thread(self, positions: typing.List[Position], notifications: typing.List[Notification]) -> None:
+        """Deliver the merged notifications of a thread, and remember them as delivered."""
+        await self._deliver(merge_notifications(notifications))
+        self._delivered.update(positions)
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of notifications, return the number of notifications delivered."""
+        records = self.outbox.read(self.batch_size)
+        batch = [(position, n) for position, n in records if position not in self._delivered]
+        if not batch:
+            return 0
+
+        threads = {}
+        for position, notification in batch:
+            positions, notifications = threads.setdefault(notification.thread_key, ([], []))
+            positions.append(position)
+            notifications.append(notification)
+
+        results = await asyncio.gather(
+            *(self._deliver_thread(positions, notifications) for positions, notifications in threads.values()),
+            return_exceptions=True,
+        )
+
+        failed = [result for result in results if isinstance(result, Exception)]
+        for result in failed:
+            _LOGGER.error(f"failed to deliver notification from outbox: {result}")
+
+        self._commit(records)
+
+        if failed:
+            raise OutboxDeliveryError(f"failed to deliver {len(failed)} of {len(threads)} notifications")
+
+        return len(batch)
+
+    def _commit(self, records: typing.List[typing.Tuple[Position, Notification]]) -> None:
+        """Advance the cursor over the leading run of delivered notifications."""
+        committed = []
+        for position, _ in records:
+            if position not in self._delivered:
+                break
+            committed.append(position)
+
+        if committed:
+            self.outbox.commit(committed[-1], len(committed))
+            self._delivered.difference_update(committed)
+
+    async def run(self) -> None:
+        """Drain the outbox until cancelled."""
+        # give notifications to the same thread a chance to arrive, so that they are merged
+        await asyncio.sleep(self.coalesce_window)
+
+        while True:
+            try:
+                if await self.drain_once():
+                    continue
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOGGER.warning(f"draining the outbox failed: {exc}, retrying in {self.retry_interval}s")
+                await asyncio.sleep(self.retry_interval)
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                continue
+
+            await asyncio.sleep(self.coalesce_window)
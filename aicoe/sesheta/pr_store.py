@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A materialized view of the open Pull Requests, kept up to date by webhooks.
+
+Pull Requests are stored shaped like the REST API returns them, reduced to the fields Sesheta uses,
+plus ``reviews``: the latest review state per reviewer. ``pull_request`` webhooks carry the whole
+Pull Request, ``pull_request_review``, ``label`` and ``push`` webhooks update parts of it.
+"""
+
+
+import abc
+import asyncio
+import os
+import json
+import logging
+import sqlite3
+import threading
+import time
+import typing
+
+from urllib.parse import urlparse
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.status_index import parse_timestamp
+
+
+_LOGGER = logging.getLogger(__name__)
+
+PR_STORE_BACKEND = os.getenv("SESHETA_PR_STORE_BACKEND", "memory")  # pragma: no cover
+PR_STORE_PATH = os.getenv("SESHETA_PR_STORE_PATH", "/tmp/sesheta-pull-requests.sqlite")  # pragma: no cover
+PR_STORE_MAX_AGE = float(os.getenv("SESHETA_PR_STORE_MAX_AGE", 600))  # pragma: no cover
+
+# the fields of a Pull Request (as sent by webhooks or the REST API) we keep
+_FIELDS = [
+    "id",
+    "node_id",
+    "number",
+    "url",
+    "html_url",
+    "issue_url",
+    "title",
+    "state",
+    "draft",
+    "merged",
+    "merged_at",
+    "mergeable",
+    "rebaseable",
+    "additions",
+    "deletions",
+    "changed_files",
+    "updated_at",
+]
+
+_PR_STORE = None
+_PR_STORE_LOCK = threading.Lock()
+
+
+def parse_pull_request_url(pr_url: str) -> (str, str, int):
+    """Get owner, repository and number from the API URL of a Pull Request."""
+    path = urlparse(pr_url).path.strip("/").split("/")
+
+    # /repos/{owner}/{repo}/pulls/{number}
+    return path[-4], path[-3], int(path[-1])
+
+
+def _reduce(pull_request: dict) -> dict:
+    """Reduce a Pull Request to the fields we keep."""
+    record = {field: pull_request[field] for field in _FIELDS if field in pull_request}
+
+    if "user" in pull_request:
+        record["user"] = {"login": pull_request["user"]["login"]}
+    if "labels" in pull_request:
+        record["labels"] = [{"name": label["name"]} for label in pull_request["labels"]]
+    if "requested_reviewers" in pull_request:
+        record["requested_reviewers"] = [{"login": r["login"]} for r in pull_request["requested_reviewers"]]
+
+    for side in ["head", "base"]:
+        if side in pull_request:
+            repo = pull_request[side].get("repo") or {}
+            record[side] = {
+                "sha": pull_request[side].get("sha"),
+                "ref": pull_request[side].get("ref"),
+                "user": {"login": (pull_request[side].get("user") or {}).get("login")},
+                "repo": {
+                    "name": repo.get("name"),
+                    "full_name": repo.get("full_name"),
+                    "url": repo.get("url"),
+                    "html_url": repo.get("html_url"),
+                    "owner": {"login": (repo.get("owner") or {}).get("login")},
+                },
+            }
+
+    return record
+
+
+def _outdated(record: dict, pull_request: dict) -> bool:
+    """Check if the Pull Request is older than the stored record of it."""
+    if not record.get("updated_at") or not pull_request.get("updated_at"):
+        return False
+
+    return parse_timestamp(pull_request["updated_at"]) < parse_timestamp(record["updated_at"])
+
+
+class PullRequestStore(abc.ABC):
+    """Base class of the Pull Request stores, holding the open Pull Requests per repository.
+
+    Stores doing blocking I/O set ``blocking``, their operations run in the default executor so that
+    waiting for e.g. a database lock does not block the event loop, one operation at a time.
+    """
+
+    backend = None
+    blocking = False
+
+    def __init__(self, max_age: float = PR_STORE_MAX_AGE):
+        """Initialize the store, Pull Requests not updated for ``max_age`` seconds are considered stale."""
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def _locked(self, func: typing.Callable, *args) -> typing.Any:
+        """Run the operation, not concurrently with any other one."""
+        with self._lock:
+            return func(*args)
+
+    async def _run(self, func: typing.Callable, *args) -> typing.Any:
+        """Run the operation, in the default executor if the store is blocking."""
+        if self.blocking:
+            return await asyncio.get_running_loop().run_in_executor(None, self._locked, func, *args)
+
+        return func(*args)
+
+    @abc.abstractmethod
+    def _load(self, repo: str, number: int) -> typing.Optional[dict]:
+        """Load a Pull Request."""
+
+    @abc.abstractmethod
+    def _save(self, repo: str, number: int, installation_id: typing.Optional[int], record: dict) -> None:
+        """Save a Pull Request."""
+
+    @abc.abstractmethod
+    def _delete(self, repo: str, number: int) -> None:
+        """Delete a Pull Request."""
+
+    @abc.abstractmethod
+    def _repository(self, repo: str) -> typing.List[typing.Tuple[typing.Optional[int], dict]]:
+        """Load all Pull Requests of the repository, with their installation."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Return the number of open Pull Requests in the store."""
+
+    async def get(self, repo: str, number: int) -> typing.Optional[dict]:
+        """Get the open Pull Request, None if it is unknown or stale."""
+        return await self._run(self._get, repo, number)
+
+    async def get_by_url(self, pr_url: str) -> typing.Optional[dict]:
+        """Get the open Pull Request by its API URL."""
+        owner, repo, number = parse_pull_request_url(pr_url)
+
+        return await self.get(f"{owner}/{repo}", number)
+
+    async def open_pull_requests(self, repo: str) -> typing.List[dict]:
+        """Get all open Pull Requests of the repository, stale ones included."""
+        return [record for _, record in await self._run(self._repository, repo.lower())]
+
+    async def put(self, pull_request: dict, installation_id: int = None) -> typing.Optional[dict]:
+        """Store a Pull Request, as sent by webhooks or the REST API, closed ones are removed.
+
+        A Pull Request older than the stored one (by ``updated_at``) is ignored, as webhooks may arrive
+        out of order; the stored one is returned.
+        """
+        return await self._run(self._put, pull_request, installation_id)
+
+    async def apply_event(self, name: str, payload: dict) -> None:
+        """Update the store from a webhook, other events than the ones we know are ignored."""
+        apply = {
+            "pull_request": self._apply_pull_request_event,
+            "pull_request_review": self._apply_pull_request_review_event,
+            "label": self._apply_label_event,
+            "push": self._apply_push_event,
+        }.get(name)
+
+        if apply is not None:
+            await self._run(apply, payload)
+
+    def _get(self, repo: str, number: int) -> typing.Optional[dict]:
+        """Get the open Pull Request, None if it is unknown or stale."""
+        record = self._load(repo.lower(), number)
+
+        if record is None or time.time() - record.get("_stored_at", 0) > self.max_age:
+            metrics.PULL_REQUEST_STORE_LOOKUPS.labels(backend=self.backend, result="miss").inc()
+            return None
+
+        metrics.PULL_REQUEST_STORE_LOOKUPS.labels(backend=self.backend, result="hit").inc()
+        return record
+
+    def _put(self, pull_request: dict, installation_id: typing.Optional[int]) -> typing.Optional[dict]:
+        """Store a Pull Request, unless it is outdated."""
+        repo = pull_request["base"]["repo"]["full_name"].lower()
+        number = pull_request["number"]
+        record = self._load(repo, number)
+
+        if record is not None and _outdated(record, pull_request):
+            _LOGGER.debug(f"ignoring outdated {repo}#{number} of {pull_request.get('updated_at')}")
+            metrics.PULL_REQUEST_STORE_OUTDATED_WRITES.labels(backend=self.backend).inc()
+            return record
+
+        if pull_request.get("state") == "closed":
+            self._delete(repo, number)
+            self._update_size_metric()
+            return None
+
+        record = record or {"reviews": {}}
+        record.update(_reduce(pull_request))
+        record["_stored_at"] = time.time()
+
+        self._save(repo, number, installation_id, record)
+        self._update_size_metric()
+
+        return record
+
+    def _apply_pull_request_event(self, payload: dict) -> None:
+        """Update the store from a ``pull_request`` webhook."""
+        self._put(payload["pull_request"], (payload.get("installation") or {}).get("id"))
+
+    def _apply_pull_request_review_event(self, payload: dict) -> None:
+        """Update the store from a ``pull_request_review`` webhook: the reviewer's latest state."""
+        pull_request = payload["pull_request"]
+        repo = pull_request["base"]["repo"]["full_name"].lower()
+        record = self._load(repo, pull_request["number"])
+
+        if record is None:
+            return  # we only know about the review, the Pull Request will be fetched when needed
+
+        review = payload["review"]
+        if payload["action"] == "dismissed":
+            record["reviews"].pop(review["user"]["login"], None)
+        else:
+            record["reviews"][review["user"]["login"]] = review["state"].lower()
+
+        # the Pull Request of a review webhook lacks some fields, e.g. mergeable, keep ours
+        if not _outdated(record, pull_request):
+            record.update({k: v for k, v in _reduce(pull_request).items() if k not in ["mergeable", "rebaseable"]})
+            record["_stored_at"] = time.time()
+
+        self._save(repo, pull_request["number"], (payload.get("installation") or {}).get("id"), record)
+
+    def _apply_label_event(self, payload: dict) -> None:
+        """Update the store from a ``label`` webhook: renamed or deleted labels of the repository."""
+        action = payload["action"]
+        name = payload["label"]["name"]
+        old_name = ((payload.get("changes") or {}).get("name") or {}).get("from")
+
+        if action == "edited" and old_name:
+            rename = {old_name: name}
+        elif action == "deleted":
+            rename = {name: None}
+        else:
+            return
+
+        for installation_id, record in self._repository(payload["repository"]["full_name"].lower()):
+            labels = [label["name"] for label in record.get("labels", [])]
+            if not any(label in rename for label in labels):
+                continue
+
+            record["labels"] = [{"name": rename.get(label, label)} for label in labels if rename.get(label, label)]
+            self._save(record["base"]["repo"]["full_name"].lower(), record["number"], installation_id, record)
+
+    def _apply_push_event(self, payload: dict) -> None:
+        """Update the store from a ``push`` webhook: a new head, or a new base which needs a rebase check."""
+        if not payload["ref"].startswith("refs/heads/"):
+            return
+
+        branch = payload["ref"][len("refs/heads/") :]
+        repo = payload["repository"]["full_name"].lower()
+
+        for installation_id, record in self._repository(repo):
+            if record["base"]["ref"] == branch:
+                # GitHub recomputes mergeable in the background
+                record.update({"mergeable": None, "rebaseable": None})
+            elif record["head"]["ref"] == branch and (record["head"]["repo"]["full_name"] or "").lower() == repo:
+                record["head"]["sha"] = payload["after"]
+                record.update({"mergeable": None, "rebaseable": None})
+            else:
+                continue
+
+            self._save(repo, record["number"], installation_id, record)
+
+    def _update_size_metric(self) -> None:
+        """Export the number of open Pull Requests."""
+        metrics.PULL_REQUEST_STORE_SIZE.labels(backend=self.backend).set(len(self))
+
+
+class MemoryPullRequestStore(PullRequestStore):
+    """An in-process store."""
+
+    backend = "memory"
+
+    def __init__(self, max_age: float = PR_STORE_MAX_AGE):
+        """Initialize an empty store."""
+        super().__init__(max_age)
+        self._pull_requests = {}
+
+    def __len__(self) -> int:
+        """Return the number of open Pull Requests in the store."""
+        return len(self._pull_requests)
+
+    def _load(self, repo: str, number: int) -> typing.Optional[dict]:
+        """Load a copy of a Pull Request."""
+        entry = self._pull_requests.get((repo, number))
+
+        return json.loads(entry[1]) if entry is not None else None
+
+    def _save(self, repo: str, number: int, installation_id: typing.Optional[int], record: dict) -> None:
+        """Save a Pull Request."""
+        self._pull_requests[(repo, number)] = (installation_id, json.dumps(record))
+
+    def _delete(self, repo: str, number: int) -> None:
+        """Delete a Pull Request."""
+        self._pull_requests.pop((repo, number), None)
+
+    def _repository(self, repo: str) -> typing.List[typing.Tuple[typing.Optional[int], dict]]:
+        """Load all Pull Requests of the repository, with their installation."""
+        return [
+            (installation_id, json.loads(record))
+            for (r, _), (installation_id, record) in list(self._pull_requests.items())
+            if r == repo
+        ]
+
+
+class SQLitePullRequestStore(PullRequestStore):
+    """A store in a SQLite database, it survives restarts and can be shared by several processes."""
+
+    backend = "sqlite"
+    blocking = True
+
+    def __init__(self, path: str = PR_STORE_PATH, max_age: float = PR_STORE_MAX_AGE):
+        """Open (and create) the database."""
+        super().__init__(max_age)
+        self.path = path
+
+        self._db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pull_requests "
+            "(repo TEXT, number INTEGER, installation_id INTEGER, data TEXT, PRIMARY KEY (repo, number))",
+        )
+
+        _LOGGER.debug(f"using SQLite Pull Request store at {path}")
+
+    def __len__(self) -> int:
+        """Return the number of open Pull Requests in the store."""
+        return self._db.execute("SELECT COUNT(*) FROM pull_requests").fetchone()[0]
+
+    def _load(self, repo: str, number: int) -> typing.Optional[dict]:
+        """Load a Pull Request."""
+        row = self._db.execute(
+            "SELECT data FROM pull_requests WHERE repo = ? AND number = ?", (repo, number),
+        ).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def _save(self, repo: str, number: int, installation_id: typing.Optional[int], record: dict) -> None:
+        """Save a Pull Request."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO pull_requests (repo, number, installation_id, data) VALUES (?, ?, ?, ?)",
+            (repo, number, installation_id, json.dumps(record)),
+        )
+
+    def _delete(self, repo: str, number: int) -> None:
+        """Delete a Pull Request."""
+        self._db.execute("DELETE FROM pull_requests WHERE repo = ? AND number = ?", (repo, number))
+
+    def _repository(self, repo: str) -> typing.List[typing.Tuple[typing.Optional[int], dict]]:
+        """Load all Pull Requests of the repository, with their installation."""
+        return [
+            (installation_id, json.loads(data))
+            for installation_id, data in self._db.execute(
+                "SELECT installation_id, data FROM pull_requests WHERE repo = ?", (repo,),
+            )
+        ]
+
+
+def get_pull_request_store(backend: str = PR_STORE_BACKEND) -> PullRequestStore:
+    """Get the process-wide Pull Request store, configured by ``SESHETA_PR_STORE_*``."""
+    global _PR_STORE
+
+    with _PR_STORE_LOCK:
+        if _PR_STORE is None:
+            if backend == "sqlite":
+                _PR_STORE = SQLitePullRequestStore()
+            else:
+                if backend != "memory":
+                    _LOGGER.warning(f"unknown Pull Request store backend '{backend}', using an in-memory store")
+
+                _PR_STORE = MemoryPullRequestStore()
+
+    return _PR_STORE
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Re-check Pull Requests whose mergeability GitHub has not computed yet, using a timer wheel.
+
+GitHub computes ``mergeable`` and ``rebaseable`` in the background, until then they are None. A check
+depending on them is scheduled to be retried with exponential backoff: it is put into the slot of a
+timer wheel, which is advanced once per tick, so that scheduling and expiring a retry is O(1) no matter
+how many are pending. A check returns None while the state is still unknown, which schedules the next
+attempt. Checks of the same key pending at the same time are coalesced into one.
+"""
+
+
+import asyncio
+import contextvars
+import math
+import os
+import logging
+import threading
+import typing
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+RECHECK_TICK = float(os.getenv("SESHETA_RECHECK_TICK", 1.0))  # pragma: no cover
+RECHECK_BASE_DELAY = float(os.getenv("SESHETA_RECHECK_BASE_DELAY", 2.0))  # pragma: no cover
+RECHECK_MAX_DELAY = float(os.getenv("SESHETA_RECHECK_MAX_DELAY", 60.0))  # pragma: no cover
+RECHECK_MAX_ATTEMPTS = int(os.getenv("SESHETA_RECHECK_MAX_ATTEMPTS", 8))  # pragma: no cover
+RECHECK_MAX_PENDING = int(os.getenv("SESHETA_RECHECK_MAX_PENDING", 1000))  # pragma: no cover
+RECHECK_CONCURRENCY = int(os.getenv("SESHETA_RECHECK_CONCURRENCY", 8))  # pragma: no cover
+
+_RECHECKER = None
+_RECHECKER_LOCK = threading.Lock()
+
+Check = typing.Callable[[], typing.Awaitable[typing.Optional[typing.Any]]]
+
+
+class _Recheck:
+    """A pending check, its attempts so far, and the future of its result."""
+
+    __slots__ = ("check", "context", "future", "attempt", "rounds")
+
+    def __init__(self, check: Check, context: contextvars.Context, future: asyncio.Future):
+        """Initialize the first attempt of the check."""
+        self.check = check
+        self.context = context
+        self.future = future
+        self.attempt = 0
+        self.rounds = 0
+
+
+class MergeabilityRechecker:
+    """Retry checks with exponential backoff, using a timer wheel of ``slots`` slots of ``tick`` seconds."""
+
+    def __init__(
+        self,
+        tick: float = RECHECK_TICK,
+        slots: int = 64,
+        base_delay: float = RECHECK_BASE_DELAY,
+        max_delay: float = RECHECK_MAX_DELAY,
+        max_attempts: int = RECHECK_MAX_ATTEMPTS,
+        max_pending: int = RECHECK_MAX_PENDING,
+        concurrency: int = RECHECK_CONCURRENCY,
+    ):
+        """Initialize an empty wheel, it starts turning on the first schedule."""
+        self.tick = tick
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+
+        self._wheel = [dict() for _ in range(slots)]
+        self._cursor = 0
+        self._pending = {}
+        self._task = None
+
+        metrics.MERGEABILITY_RECHECKS_PENDING.set_function(lambda: self.pending)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of checks waiting for their next attempt."""
+        return len(self._pending)
+
+    def delay(self, attempt: int) -> float:
+        """Get the delay before the given attempt (counting from 0), doubling with each attempt."""
+        return min(self.base_delay * 2 ** attempt, self.max_delay)
+
+    def _insert(self, key: typing.Hashable, recheck: _Recheck) -> None:
+        """Put the check into the slot it is due in."""
+        ticks = max(1, math.ceil(self.delay(recheck.attempt) / self.tick))
+        recheck.rounds = (ticks - 1) // len(self._wheel)
+        self._wheel[(self._cursor + ticks) % len(self._wheel)][key] = recheck
+
+    def schedule(self, key: typing.Hashable, check: Check) -> asyncio.Future:
+        """Schedule the check to be retried, return the future of its result.
+
+        The result is the first one which is not None, or None if the state was still unknown after
+        ``max_attempts`` attempts or the check could not be scheduled. If a check of the key is pending
+        already, its future is returned and the given check replaces it. The check runs in a copy of the
+        caller's context (e.g. ``RUNTIME_CONTEXT``).
+        """
+        loop = asyncio.get_running_loop()
+
+        recheck = self._pending.get(key)
+        if recheck is not None:
+            _LOGGER.debug(f"re-check of {key} is pending already")
+            metrics.MERGEABILITY_RECHECKS.labels(result="coalesced").inc()
+
+            recheck.check = check
+            recheck.context = contextvars.copy_context()
+            return recheck.future
+
+        future = loop.create_future()
+
+        if len(self._pending) >= self.max_pending:
+            _LOGGER.warning(f"{len(self._pending)} re-checks pending, not re-checking {key}")
+            metrics.MERGEABILITY_RECHECKS.labels(result="dropped").inc()
+
+            future.set_result(None)
+            return future
+
+        recheck = _Recheck(check, contextvars.copy_context(), future)
+        self._pending[key] = recheck
+        self._insert(key, recheck)
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self.run())
+
+        return future
+
+    def _advance(self) -> typing.List[typing.Tuple[typing.Hashable, _Recheck]]:
+        """Advance the wheel by one tick, return the checks which are due."""
+        self._cursor = (self._cursor + 1) % len(self._wheel)
+        slot = self._wheel[self._cursor]
+
+        due = []
+        for key, recheck in list(slot.items()):
+            if recheck.rounds > 0:
+                recheck.rounds -= 1
+            else:
+                due.append((key, recheck))
+                del slot[key]
+
+        return due
+
+    async def _attempt(self, key: typing.Hashable, recheck: _Recheck, slots: asyncio.Semaphore) -> None:
+        """Run one attempt of the check, and schedule the next one if the state is still unknown."""
+        async with slots:
+            try:
+                loop = asyncio.get_running_loop()
+                result = await recheck.context.run(loop.create_task, recheck.check())
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOGGER.error(f"re-checking {key} failed: {exc}")
+                result = None
+
+        recheck.attempt += 1
+
+        if result is None and recheck.attempt < self.max_attempts:
+            _LOGGER.debug(f"state of {key} still unknown, re-checking in {self.delay(recheck.attempt)}s")
+            metrics.MERGEABILITY_RECHECKS.labels(result="retried").inc()
+
+            self._insert(key, recheck)
+            return
+
+        del self._pending[key]
+        metrics.MERGEABILITY_RECHECKS.labels(result="resolved" if result is not None else "gave_up").inc()
+
+        if not recheck.future.done():
+            recheck.future.set_result(result)
+
+    async def run(self) -> None:
+        """Turn the wheel until no check is pending.
+
+        Checks may be scheduled while the last attempts are awaited, so that the wheel keeps turning
+        until no check is pending once they are done.
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+        attempts = set()
+
+        while True:
+            while self._pending:
+                await asyncio.sleep(self.tick)
+
+                for key, recheck in self._advance():
+                    task = asyncio.create_task(self._attempt(key, recheck, slots))
+                    attempts.add(task)
+                    task.add_done_callback(attempts.discard)
+
+            await asyncio.gather(*attempts)
+
+            if not self._pending:
+                return
+
+
+def get_mergeability_rechecker() -> MergeabilityRechecker:
+    """Get the process-wide re-checker of the mergeability of Pull Requests."""
+    global _RECHECKER
+
+    with _RECHECKER_LOCK:
+        if _RECHECKER is None:
+            _RECHECKER = MergeabilityRechecker()
+
+    return _RECHECKER
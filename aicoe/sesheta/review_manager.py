@@ -25,8 +25,7 @@ import socket
 import gidgethub
 
 
-from octomachinery.app.server.runner import run as run_app
-from octomachinery.app.routing import process_event_actions, process_event
+from octomachinery.app.routing import process_event_actions, process_event, WEBHOOK_EVENTS_ROUTER
 from octomachinery.app.routing.decorators import process_webhook_payload
 from octomachinery.app.runtime.context import RUNTIME_CONTEXT
 from octomachinery.github.config.app import GitHubAppIntegrationConfig
@@ -35,8 +34,6 @@ from octomachinery.utils.versiontools import get_version_from_scm_tag
 
 from prometheus_async.aio import time
 
-from expiringdict import ExpiringDict
-
 from aicoe.sesheta import __version__
 from aicoe.sesheta.actions.pull_request import (
     local_check_gate_passed,
@@ -44,9 +41,22 @@ from aicoe.sesheta.actions.pull_request import (
 )
 from aicoe.sesheta.actions.common import (
     conclude_reviewer_list,
+    get_changed_files,
     unpack,
 )
-from aicoe.sesheta.actions.label import do_not_merge
+from aicoe.sesheta.actions.check_gate import CheckGateError, get_check_gate_state
+from aicoe.sesheta.actions.label import do_not_merge, reconcile_labels
+from aicoe.sesheta.actions.rebase import RebaseSweepError, sweep_rebases
+from aicoe.sesheta.actions.snapshot import get_pull_request_snapshot
+from aicoe.sesheta.check_runs import get_check_run_manager
+from aicoe.sesheta.codeowners_cache import get_codeowners_cache
+from aicoe.sesheta.dedup import get_dedup_store
+from aicoe.sesheta.ingestion import IngestionRouter
+from aicoe.sesheta.installations import get_installation_index
+from aicoe.sesheta.pr_store import get_pull_request_store
+from aicoe.sesheta.server import run as run_server
+from aicoe.sesheta.status_index import get_commit_status_index
+from aicoe.sesheta.title_rules import AUTOMATED_CATEGORIES, classify_title
 from aicoe.sesheta.utils import GITHUB_LOGIN_FILTER, notify_channel, hangouts_userid, realname, random_positive_emoji2
 from thoth.common import init_logging
 
@@ -60,19 +70,17 @@ _LOGGER.info(f"AICoE's SrcOps Cyborg, Version v{__version__}")
 logging.getLogger("octomachinery").setLevel(logging.DEBUG)
 logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
 
-notifications = ExpiringDict(max_len=100, max_age_seconds=10)
+notifications = get_dedup_store()
 
 
-def send_notification(repository_name: str, pull_request_id: int, requested_reviewer_login: str) -> bool:
+async def send_notification(repository_name: str, pull_request_id: int, requested_reviewer_login: str) -> bool:
     """Decide if we need to send a notification."""
     if requested_reviewer_login in ["sesheta", "khebhut[bot]"]:
         return False  # we never want to send notifications for Sesheta
 
-    if notifications.get(f"{repository_name}_{pull_request_id}_{requested_reviewer_login}"):
+    if await notifications.seen(f"{repository_name}_{pull_request_id}_{requested_reviewer_login}"):
         return False
 
-    notifications[f"{repository_name}_{pull_request_id}_{requested_reviewer_login}"] = True
-
     return True
 
 
@@ -100,6 +108,12 @@ async def on_install(
     _LOGGER.info("installation=%s", RUNTIME_CONTEXT.app_installation)
 
 
+@process_event("installation")
+async def on_installation(event):
+    """Keep the installation index up to date."""
+    await get_installation_index().apply_installation_event(event.payload)
+
+
 @process_event_actions("pull_request", {"closed"})
 @process_webhook_payload
 @time(metrics.REQ_TIME)
@@ -107,9 +121,10 @@ async def on_pr_closed(*, action, number, pull_request, repository, sender, orga
     """React to an closed PR event."""
     _LOGGER.debug(f"on_pr_closed: working on PR {pull_request['html_url']}")
 
+    categories = classify_title(pull_request["title"])
+
     # we do not notify on standard automated SrcOps
-    ignore_messages = ["Automatic update of", "Release of", "Automatic dependency re-locking"]
-    if not pull_request["title"].startswith(tuple(ignore_messages)):
+    if not categories & AUTOMATED_CATEGORIES:
         if pull_request["merged"]:
             notify_channel(
                 "plain",
@@ -125,7 +140,7 @@ async def on_pr_closed(*, action, number, pull_request, repository, sender, orga
                 f"pull_request_{repository['name']}_{pull_request['id']}",
                 pull_request["html_url"],
             )
-    elif pull_request["title"].startswith("Release of"):
+    elif "release" in categories:
         if pull_request["merged"]:
             commit_hash, release = await handle_release_pull_request(pull_request)
 
@@ -155,10 +170,11 @@ async def on_pr_open_or_edit(*, action, number, pull_request, repository, sender
     _LOGGER.debug(f"on_pr_open_or_edit: working on PR {pull_request['html_url']}")
 
     github_api = RUNTIME_CONTEXT.app_installation_client
+    categories = classify_title(pull_request["title"])
 
     if action in ["opened", "reopened"]:
         # we do not notify on standard automated SrcOps
-        if not pull_request["title"].startswith("Automatic ") and not pull_request["title"].startswith("Release of"):
+        if not categories & {"automatic", "release"}:
             notify_channel(
                 "plain",
                 f"🆕 {pull_request['html_url']} a new Pull Request has been *opened*!",
@@ -166,7 +182,7 @@ async def on_pr_open_or_edit(*, action, number, pull_request, repository, sender
                 pull_request["html_url"],
             )
         # Auto comments and labels added for Release version PR's
-        if pull_request["title"].startswith("Release of version"):
+        if "release_version" in categories:
 
             if pull_request["user"]["login"] not in ["sesheta", "khebhut[bot]"]:
                 _LOGGER.error(
@@ -184,11 +200,7 @@ async def on_pr_open_or_edit(*, action, number, pull_request, repository, sender
                         data={"body": "This is an auto-approve of the releases.", "event": "APPROVE"},
                     )
 
-                    await github_api.post(
-                        f"{pull_request['issue_url']}/labels",
-                        preview_api_version="symmetra",
-                        data={"labels": ["approved", "ok-to-test", "lgtm"]},
-                    )
+                    await reconcile_labels(pull_request, add=["approved", "ok-to-test", "lgtm"], github_api=github_api)
                 except gidgethub.BadRequest as err:
                     if err.status_code != 202:
                         _LOGGER.error(str(err))
@@ -197,9 +209,7 @@ async def on_pr_open_or_edit(*, action, number, pull_request, repository, sender
                 _LOGGER.info(f"on_pr_open_or_edit: This PR is {pull_request['html_url']} not a part of thoth-station.")
 
         # Auto comments and labels added for Package update PR's
-        if pull_request["title"].startswith("Automatic update of") or pull_request["title"].startswith(
-            "Automatic dependency re-locking",
-        ):
+        if categories & {"automatic_update", "dependency_relock"}:
             if pull_request["user"]["login"] not in ["sesheta", "khebhut[bot]", "dependabot[bot]"]:
                 _LOGGER.error(
                     f"on_pr_open_or_edit: automatic update not by Sesheta or Dependabot?! have a look at {pull_request['html_url']}!",
@@ -217,11 +227,7 @@ async def on_pr_open_or_edit(*, action, number, pull_request, repository, sender
                         data={"body": "This is an auto-approve of an auto-PR.", "event": "APPROVE"},
                     )
 
-                    await github_api.post(
-                        f"{pull_request['issue_url']}/labels",
-                        preview_api_version="symmetra",
-                        data={"labels": ["approved", "ok-to-test", "lgtm"]},
-                    )
+                    await reconcile_labels(pull_request, add=["approved", "ok-to-test", "lgtm"], github_api=github_api)
                 except gidgethub.BadRequest as err:
                     if err.status_code != 202:
                         _LOGGER.error(str(err))
@@ -229,9 +235,7 @@ async def on_pr_open_or_edit(*, action, number, pull_request, repository, sender
                 # Don't approve for the other users, until they explicitly ask for turning on this feature.
                 _LOGGER.info(f"on_pr_open_or_edit: This PR is {pull_request['html_url']} not a part of thoth-station.")
 
-        if pull_request["title"].lower().startswith("bump version of") and pull_request["title"].lower().endswith(
-            "stage",
-        ):
+        if "version_bump_stage" in categories:
             _LOGGER.debug(f"on_pr_open_or_edit: {pull_request['html_url']} is a version bump in STAGE")
 
             notify_channel(
@@ -273,11 +277,11 @@ async def on_pull_request_review_requested(*, action, number, pull_request, requ
     )
 
     # we do not notify on standard automated SrcOps
-    if pull_request["title"].startswith("Automatic update of") or pull_request["title"].startswith("Release of"):
+    if classify_title(pull_request["title"]) & {"automatic_update", "release"}:
         return
 
     for requested_reviewer in pull_request["requested_reviewers"]:
-        if send_notification(kwargs["repository"]["name"], pull_request["id"], requested_reviewer["login"]):
+        if await send_notification(kwargs["repository"]["name"], pull_request["id"], requested_reviewer["login"]):
             _LOGGER.info(f"requesting review by {requested_reviewer['login']} on {pull_request['html_url']}")
 
             if requested_reviewer["login"] not in GITHUB_LOGIN_FILTER:
@@ -299,24 +303,20 @@ async def on_issue_opened(*, action, issue, repository, sender, **kwargs):
     """Take actions if an issue got opened."""
     _LOGGER.info(f"working on Issue {issue['html_url']}: opened")
 
-    if issue["title"].startswith("Automatic update of"):
-        _LOGGER.debug(f"{issue['url']} is an 'Automatic update of dependencies', not sending notification")
-        return
-
-    if issue["title"].startswith("Automatic dependency re-locking"):
-        _LOGGER.debug(f"{issue['url']} is an 'Automatic dependency re-locking', not sending notification")
-        return
-
-    if issue["title"].startswith("Initial dependency lock"):
-        _LOGGER.debug(f"{issue['url']} is an 'Initial dependency lock', not sending notification")
-        return
+    categories = classify_title(issue["title"])
 
-    if issue["title"].startswith("Failed to update dependencies"):
-        _LOGGER.debug(f"{issue['url']} is an 'Failed to update dependencies', not sending notification")
+    silent = categories & {
+        "automatic_update",
+        "dependency_relock",
+        "initial_dependency_lock",
+        "failed_dependency_update",
+    }
+    if silent:
+        _LOGGER.debug(f"{issue['url']} is an '{', '.join(sorted(silent))}' issue, not sending notification")
         return
 
     # only of the ml-prague-workshop feb26-2021
-    if issue["title"].startswith("Workshop issue ML Prague"):
+    if "ml_prague_workshop" in categories:
 
         github_api = RUNTIME_CONTEXT.app_installation_client
 
@@ -326,7 +326,7 @@ async def on_issue_opened(*, action, issue, repository, sender, **kwargs):
             data={"assignees": ["vpavlin", "pacospace", "tumido"]},
         )
 
-    if issue["title"].startswith("Release of version"):
+    if "release_version" in categories:
         _LOGGER.debug(f"{issue['url']} is a 'release issue'")
 
         github_api = RUNTIME_CONTEXT.app_installation_client
@@ -361,11 +361,25 @@ async def on_check_gate(*, action, issue, comment, repository, organization, sen
         pr_url = issue["url"].replace("issues", "pulls")
         pr_body_ok = False
 
-        github_api = RUNTIME_CONTEXT.app_installation_client
-        pr = await github_api.getitem(pr_url)
-        do_not_merge_label = await do_not_merge(pr_url)
-        gate_passed = await local_check_gate_passed(pr_url)
-        reviewer_list = await conclude_reviewer_list(pr["base"]["repo"]["owner"]["login"], pr["base"]["repo"]["name"])
+        try:
+            gate = await get_check_gate_state(pr_url)
+
+            pr = gate.pull_request
+            do_not_merge_label = gate.do_not_merge
+            gate_passed = gate.gate_passed
+            reviewer_list = gate.reviewers
+        except (CheckGateError, gidgethub.HTTPException) as err:
+            _LOGGER.warning(f"{err}, falling back to the REST API")
+
+            pr = await get_pull_request_snapshot(pr_url)
+            do_not_merge_label = await do_not_merge(pr_url)
+            gate_passed = await local_check_gate_passed(pr_url)
+            reviewer_list = await conclude_reviewer_list(
+                pr["base"]["repo"]["owner"]["login"],
+                pr["base"]["repo"]["name"],
+                await get_changed_files(pr_url) or (".",),
+            )
+
         current_reviewers = pr["requested_reviewers"]
         pr_owner = pr["user"]["login"]
 
@@ -379,9 +393,7 @@ async def on_check_gate(*, action, issue, comment, repository, organization, sen
             _LOGGER.debug(f"PR {pr['html_url']} is ready for review!")
 
             # we do not notify on standard automated SrcOps
-            if not pr["title"].startswith("Automatic update of dependency") and not pr["title"].startswith(
-                "Release of",
-            ):
+            if not classify_title(pr["title"]) & {"automatic_dependency_update", "release"}:
                 notify_channel(
                     "plain",
                     f"🎉 This Pull Request seems to be *ready for review*... the local/check gate has been passed! 💚",
@@ -399,6 +411,59 @@ async def on_check_gate(*, action, issue, comment, repository, organization, sen
             )
 
 
+@process_event("pull_request")
+@process_event("pull_request_review")
+@process_event("label")
+@process_event("push")
+async def on_pull_request_state_change(event):
+    """Keep the Pull Request store up to date."""
+    await get_pull_request_store().apply_event(event.name, event.payload)
+
+
+@process_event("push")
+async def on_codeowners_change(event):
+    """Forget the CODEOWNERS of the repository, if the push may have changed them."""
+    get_codeowners_cache().apply_push_event(event.payload)
+
+
+@process_event("push")
+@process_webhook_payload
+async def on_push(*, ref, after, repository, deleted=False, **kwargs):
+    """Update the branches of the open Pull Requests, if the default branch has moved on."""
+    if deleted or ref != f"refs/heads/{repository['default_branch']}":
+        return
+
+    owner, repo = repository["full_name"].split("/", 1)
+
+    try:
+        updated = await sweep_rebases(owner, repo, repository["default_branch"], after)
+    except (RebaseSweepError, gidgethub.HTTPException) as err:
+        _LOGGER.error(f"updating the Pull Requests of {repository['full_name']} failed: {err}")
+        return
+
+    _LOGGER.info(f"push to {repository['full_name']}@{after}: updated Pull Requests {updated}")
+
+
+@process_event("status")
+@process_webhook_payload
+async def on_status(**payload):
+    """Record the commit status in the commit status index."""
+    _LOGGER.debug(f"status of {payload['context']} on {payload['sha']}: {payload['state']}")
+
+    get_commit_status_index().update_from_status_event(payload)
+
+
+@process_event("check_run")
+@process_webhook_payload
+async def on_check_run(**payload):
+    """Record the check run in the commit status index, and in the index of our check runs."""
+    check_run = payload["check_run"]
+    _LOGGER.debug(f"check run {check_run['name']} on {check_run['head_sha']}: {payload['action']}")
+
+    get_commit_status_index().update_from_check_run_event(payload)
+    get_check_run_manager().update_from_check_run_event(payload)
+
+
 async def on_security_advisory(*, action, security_advisory, **kwargs):
     """Send a notification to Hangout."""
     _LOGGER.warning(
@@ -423,11 +488,14 @@ if __name__ == "__main__":
     _LOGGER.setLevel(logging.DEBUG)
     _LOGGER.debug("Debug mode turned on")
 
+    metrics.start_metrics_server()
+
     try:
-        run_app(  # pylint: disable=expression-not-assigned
+        run_server(
             name="Sefkhet-Abwy",
             version=get_version_from_scm_tag(root="../..", relative_to=__file__),
             url="https://github.com/apps/Sefkhet-Abwy",
+            event_routers={IngestionRouter(WEBHOOK_EVENTS_ROUTER)},
         )
     except socket.gaierror as gai:
         _LOGGER.exception(gai)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Schedule the processing of webhook events: concurrently, but strictly ordered per Pull Request.
+
+Events of different repositories or Pull Requests are processed concurrently, at most
+``SESHETA_SCHEDULER_MAX_IN_FLIGHT`` at a time. Events of the same (repository, Pull Request) are
+processed one after the other, in the order they have been submitted, so that handlers do not race on
+labels and check runs. At most ``SESHETA_SCHEDULER_MAX_PENDING`` events are queued or running, further
+submissions wait for room (backpressure).
+"""
+
+
+import asyncio
+import os
+import logging
+import threading
+import time
+import typing
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEDULER_MAX_IN_FLIGHT = int(os.getenv("SESHETA_SCHEDULER_MAX_IN_FLIGHT", 16))  # pragma: no cover
+SCHEDULER_MAX_PENDING = int(os.getenv("SESHETA_SCHEDULER_MAX_PENDING", 1000))  # pragma: no cover
+
+_EVENT_SCHEDULER = None
+_EVENT_SCHEDULER_LOCK = threading.Lock()
+
+SchedulingKey = typing.Tuple[str, int]
+
+
+def scheduling_key(event_name: str, payload: dict) -> typing.Optional[SchedulingKey]:
+    """Get the (repository, Pull Request) an event is ordered by, None if it does not refer to one."""
+    repository = payload.get("repository", {}).get("full_name")
+    if repository is None:
+        return None
+
+    number = None
+    if event_name in ["pull_request", "pull_request_review", "pull_request_review_comment"]:
+        number = payload.get("number") or payload.get("pull_request", {}).get("number")
+    elif event_name in ["issue_comment", "issues"]:
+        number = payload.get("issue", {}).get("number")
+    elif event_name == "check_run":
+        pull_requests = payload.get("check_run", {}).get("pull_requests") or []
+        number = pull_requests[0]["number"] if len(pull_requests) == 1 else None
+
+    if number is None:
+        return None
+
+    return (repository.lower(), number)
+
+
+class EventScheduler:
+    """Run jobs with bounded concurrency, in submission order per key."""
+
+    def __init__(self, max_in_flight: int = SCHEDULER_MAX_IN_FLIGHT, max_pending: int = SCHEDULER_MAX_PENDING):
+        """Initialize the scheduler, it is bound to the event loop of the first submission."""
+        self.max_in_flight = max_in_flight
+        self.max_pending = max_pending
+        self._tails = {}
+        self._pending = {}
+        self._pending_total = 0
+        self._slots = None
+        self._room = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of jobs queued or running."""
+        return self._pending_total
+
+    def queue_length(self, key: SchedulingKey) -> int:
+        """Return the number of jobs of a key queued or running."""
+        return self._pending.get(key, 0)
+
+    def _start(self) -> None:
+        """Create the synchronization primitives on the running event loop."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._room = asyncio.Condition()
+
+    def _set_queue_length(self, key: SchedulingKey, delta: int) -> None:
+        """Account for a job of the key being added or finished, a key is dropped once it is drained."""
+        length = self._pending.get(key, 0) + delta
+        repository, number = key
+
+        if length > 0:
+            self._pending[key] = length
+            metrics.EVENT_SCHEDULER_QUEUE_LENGTH.labels(repository=repository, pull_request=number).set(length)
+        else:
+            self._pending.pop(key, None)
+            metrics.EVENT_SCHEDULER_QUEUE_LENGTH.remove(repository, str(number))
+
+    async def _wait_for_room(self) -> None:
+        """Wait until less than ``max_pending`` jobs are queued or running."""
+        async with self._room:
+            if self._pending_total >= self.max_pending:
+                _LOGGER.debug(f"{self._pending_total} events pending, waiting for room")
+                metrics.EVENT_SCHEDULER_BACKPRESSURE_WAITS.inc()
+
+                await self._room.wait_for(lambda: self._pending_total < self.max_pending)
+
+            self._pending_total += 1
+
+    async def _release_room(self) -> None:
+        """Let a submission waiting for room in."""
+        async with self._room:
+            self._pending_total -= 1
+            self._room.notify()
+
+    async def run(self, key: typing.Optional[SchedulingKey], job: typing.Callable[[], typing.Awaitable]):
+        """Run the job after all jobs submitted before with the same key, return its result.
+
+        The job's place in the order of its key is taken right away, before waiting for room. The job
+        runs in the task of the caller, so it sees the caller's context (e.g. ``RUNTIME_CONTEXT``).
+        Jobs without a key are not ordered.
+        """
+        self._start()
+
+        submitted_at = time.monotonic()
+        done = asyncio.get_running_loop().create_future()
+        previous = None
+        has_room = False
+
+        if key is not None:
+            previous = self._tails.get(key)
+            self._tails[key] = done
+            self._set_queue_length(key, 1)
+
+        try:
+            await self._wait_for_room()
+            has_room = True
+
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            async with self._slots:
+                metrics.EVENT_SCHEDULER_WAIT_TIME.observe(time.monotonic() - submitted_at)
+                metrics.EVENT_SCHEDULER_IN_FLIGHT.inc()
+
+                try:
+                    return await job()
+                finally:
+                    metrics.EVENT_SCHEDULER_IN_FLIGHT.dec()
+        finally:
+            done.set_result(None)
+
+            if key is not None:
+                if self._tails.get(key) is done:
+                    del self._tails[key]
+                self._set_queue_length(key, -1)
+
+            if has_room:
+                await self._release_room()
+
+
+def get_event_scheduler() -> EventScheduler:
+    """Get the process-wide event scheduler."""
+    global _EVENT_SCHEDULER
+
+    with _EVENT_SCHEDULER_LOCK:
+        if _EVENT_SCHEDULER is None:
+            _EVENT_SCHEDULER = EventScheduler()
+
+    return _EVENT_SCHEDULER
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A webhook server acknowledging deliveries right away, with a bound on the events processed at a time.
+
+The endpoint validates the signature of a delivery, puts the event into a bounded queue and returns
+``202 Accepted``. If the queue is full, the response is held back until there is room (backpressure).
+The events are taken from the queue and their handlers started, each event in a task of its own so that
+it gets a fresh ``RUNTIME_CONTEXT``, as long as less than ``SESHETA_WEBHOOK_MAX_IN_FLIGHT`` are being
+processed. Waiting for GitHub's eventual consistency, debouncing and ordering happen within these tasks,
+they do not hold up taking the next events from the queue.
+
+``serve()`` runs either this server or octomachinery's, and delivers the queued chat notifications on
+shutdown.
+"""
+
+
+import asyncio
+import os
+import logging
+import sys
+import time
+import typing
+
+import attr
+
+from aiohttp import web
+from aiohttp.client import ClientSession
+from aiohttp.web_runner import GracefulExit
+from anyio import run as run_until_complete
+
+from octomachinery.app.config import BotAppConfig
+from octomachinery.app.routing.webhooks_dispatcher import get_event_from_request
+from octomachinery.app.server.config import WebServerConfig
+from octomachinery.app.server.machinery import get_server_runner, log_webhook_secret_status, start_tcp_site
+from octomachinery.app.server.machinery import run_forever as run_octomachinery_forever
+from octomachinery.github.api.app_client import GitHubApp
+from octomachinery.routing.webhooks_dispatcher import route_github_event
+from octomachinery.utils.asynctools import auto_cleanup_aio_tasks
+
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.github_pool import get_github_pool
+from aicoe.sesheta.installations import get_installation_index
+from aicoe.sesheta.utils import get_notification_coalescer, get_notification_dispatcher, get_notification_outbox_drainer
+
+
+_LOGGER = logging.getLogger(__name__)
+
+WEBHOOK_FAST_ACK = bool(int(os.getenv("SESHETA_WEBHOOK_FAST_ACK", 0)))  # pragma: no cover
+WEBHOOK_MAX_IN_FLIGHT = int(os.getenv("SESHETA_WEBHOOK_MAX_IN_FLIGHT", 256))  # pragma: no cover
+WEBHOOK_QUEUE_SIZE = int(os.getenv("SESHETA_WEBHOOK_QUEUE_SIZE", 1000))  # pragma: no cover
+
+
+class WebhookQueue:
+    """Accept webhook deliveries into a bounded queue, and process them with bounded concurrency."""
+
+    def __init__(
+        self,
+        github_app: GitHubApp,
+        max_in_flight: int = WEBHOOK_MAX_IN_FLIGHT,
+        max_queue_size: int = WEBHOOK_QUEUE_SIZE,
+    ):
+        """Initialize the queue, processing is started by ``start()``."""
+        self.github_app = github_app
+        self.max_in_flight = max_in_flight
+        self.max_queue_size = max_queue_size
+        self._queue = None
+        self._slots = None
+        self._pump = None
+        self._tasks = set()
+
+        metrics.WEBHOOK_QUEUE_DEPTH.set_function(lambda: self.qsize)
+        metrics.WEBHOOK_IN_FLIGHT.set_function(lambda: self.in_flight)
+
+    @property
+    def qsize(self) -> int:
+        """Return the number of events waiting to be processed."""
+        if self._queue is None:
+            return 0
+
+        return self._queue.qsize()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of events being processed."""
+        return len(self._tasks)
+
+    def start(self) -> None:
+        """Start taking events from the queue, on the running event loop."""
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._pump = asyncio.create_task(self._run())
+
+        _LOGGER.info(f"processing at most {self.max_in_flight} webhook events at a time")
+
+    async def stop(self) -> None:
+        """Stop processing, events still in the queue are not processed."""
+        tasks = [self._pump, *self._tasks] if self._pump is not None else list(self._tasks)
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pump = None
+
+    async def handle(self, request: web.Request, webhook_secret: typing.Optional[str] = None) -> web.Response:
+        """Validate the delivery and queue the event, acknowledging it with ``202 Accepted``."""
+        received_at = time.monotonic()
+
+        if request.method != "POST":
+            raise web.HTTPMethodNotAllowed(method=request.method, allowed_methods={"POST"})
+
+        event = await get_event_from_request(request, webhook_secret)
+        await self._queue.put((event, received_at))
+
+        metrics.WEBHOOK_ACK_LATENCY.observe(time.monotonic() - received_at)
+
+        return web.Response(status=202, text=f"Accepted: {event!r} has been queued for processing")
+
+    async def _run(self) -> None:
+        """Start processing the queued events, as long as there is a free slot."""
+        while True:
+            event, received_at = await self._queue.get()
+            await self._slots.acquire()
+
+            task = asyncio.create_task(self._process(event, received_at))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, event, received_at: float) -> None:
+        """Run the handlers of the event, and free its slot."""
+        try:
+            await route_github_event(github_event=event, github_app=self.github_app)
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.exception(f"processing {event.name} {event.delivery_id} failed: {exc}")
+        finally:
+            metrics.WEBHOOK_PROCESSING_LATENCY.labels(event=event.name).observe(time.monotonic() - received_at)
+            self._slots.release()
+            self._queue.task_done()
+
+
+@auto_cleanup_aio_tasks
+async def run_forever(config: BotAppConfig, event_routers) -> None:
+    """Serve the webhooks in fast-ack mode until cancelled."""
+    log_webhook_secret_status(config.github.webhook_secret)
+
+    async with ClientSession() as http_session:
+        github_app = GitHubApp(config.github, http_session=http_session, event_routers=event_routers)
+        await github_app.log_installs_list()
+
+        webhook_queue = WebhookQueue(github_app)
+        webhook_queue.start()
+
+        runner = await get_server_runner(lambda request: webhook_queue.handle(request, config.github.webhook_secret))
+        site = await start_tcp_site(config.server, runner)
+
+        try:
+            await asyncio.Event().wait()
+        finally:
+            _LOGGER.info(" Stopping the server ".center(50, "="))
+            await site.stop()
+            await webhook_queue.stop()
+
+
+async def serve(config: BotAppConfig, event_routers, fast_ack: bool = WEBHOOK_FAST_ACK) -> None:
+    """Serve the webhooks until cancelled, in fast-ack mode or like octomachinery does.
+
+    On shutdown, the chat notifications still held back or queued are delivered.
+    """
+    # the clients of the installations use the pooled session, identifying as the GitHub App
+    github_pool = get_github_pool()
+    github_pool.user_agent = config.github.user_agent
+
+    # deliver the notifications left in the outbox by the previous run
+    drainer = get_notification_outbox_drainer()
+    if drainer is not None:
+        drainer.wake()
+
+    try:
+        if fast_ack:
+            await run_forever(config, event_routers)
+        else:
+            await run_octomachinery_forever(config, event_routers)
+    finally:
+        get_notification_coalescer().flush_all()
+        await get_notification_dispatcher().close()
+        await get_installation_index().close()
+        await github_pool.close()
+
+
+def run(*, name: str, version: str, url: str, event_routers, fast_ack: bool = WEBHOOK_FAST_ACK) -> None:
+    """Start up the server, using CLI args for host and port like octomachinery does."""
+    config = BotAppConfig.from_dotenv(app_name=name, app_version=version, app_url=url)
+    if len(sys.argv) > 2:
+        config = attr.evolve(config, server=WebServerConfig(*sys.argv[1:3]))
+
+    try:
+        run_until_complete(serve, config, event_routers, fast_ack)
+    except (GracefulExit, KeyboardInterrupt):
+        _LOGGER.info(" Exiting the app ".center(50, "="))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""An index of the latest commit status per repository, commit and context, fed by webhooks.
+
+``status`` events carry commit statuses, ``check_run`` events check runs, which are indexed by their
+name and with their conclusion mapped to a commit status state. States polled from the API are only
+recorded once they are final: a later change of a pending state may not be seen by the index.
+"""
+
+
+import os
+import logging
+import threading
+import typing
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import aicoe.sesheta.metrics as metrics
+
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_INDEX_MAX_COMMITS = int(os.getenv("SESHETA_STATUS_INDEX_MAX_COMMITS", 4096))  # pragma: no cover
+
+# check run conclusions which do not block a Pull Request
+_SUCCESSFUL_CONCLUSIONS = ["success", "neutral", "skipped"]
+
+# commit status states which will not change anymore
+FINAL_STATES = ["success", "failure", "error"]
+
+# a missing timestamp is older than any other
+_NO_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
+
+_STATUS_INDEX = None
+_STATUS_INDEX_LOCK = threading.Lock()
+
+
+class CommitStatus(typing.NamedTuple):
+    """The state of one context of a commit, and when it was reported."""
+
+    state: str
+    updated_at: datetime
+
+
+def parse_timestamp(timestamp: typing.Optional[str]) -> datetime:
+    """Parse an ISO 8601 timestamp as used by GitHub, timestamps without a timezone are in UTC."""
+    if not timestamp:
+        return _NO_TIMESTAMP
+
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
+
+
+def check_run_state(check_run: dict) -> str:
+    """Map a check run to the state of a commit status: pending, success or failure."""
+    if check_run.get("status") != "completed":
+        return "pending"
+
+    return "success" if check_run.get("conclusion") in _SUCCESSFUL_CONCLUSIONS else "failure"
+
+
+class CommitStatusIndex:
+    """An LRU of commits, each with the latest state per context."""
+
+    def __init__(self, max_commits: int = STATUS_INDEX_MAX_COMMITS):
+        """Initialize an empty index, holding the statuses of at most ``max_commits`` commits."""
+        self.max_commits = max_commits
+        self._commits = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of commits in the index."""
+        return len(self._commits)
+
+    def update(self, repo: str, sha: str, context: str, state: str, updated_at: str = "") -> None:
+        """Record the state of a context, unless a later state has been recorded already.
+
+        ``updated_at`` is an ISO 8601 timestamp as used by GitHub, webhooks may arrive out of order.
+        """
+        timestamp = parse_timestamp(updated_at)
+        key = (repo.lower(), sha)
+        contexts = self._commits.get(key)
+
+        if contexts is None:
+            contexts = self._commits[key] = {}
+
+            while len(self._commits) > self.max_commits:
+                self._commits.popitem(last=False)
+        else:
+            self._commits.move_to_end(key)
+
+        current = contexts.get(context)
+        if current is not None and current.updated_at > timestamp:
+            _LOGGER.debug(f"ignoring outdated state {state} of {context} on {repo}@{sha}")
+            return
+
+        contexts[context] = CommitStatus(state, timestamp)
+        metrics.COMMIT_STATUS_INDEX_SIZE.set(len(self._commits))
+
+    def get(self, repo: str, sha: str, context: str) -> typing.Optional[str]:
+        """Get the latest state of a context of the commit, None if it is unknown."""
+        key = (repo.lower(), sha)
+        status = self._commits.get(key, {}).get(context)
+
+        if status is None:
+            metrics.COMMIT_STATUS_INDEX_LOOKUPS.labels(result="miss").inc()
+            return None
+
+        self._commits.move_to_end(key)
+        metrics.COMMIT_STATUS_INDEX_LOOKUPS.labels(result="hit").inc()
+
+        return status.state
+
+    def update_from_status_event(self, payload: dict) -> None:
+        """Record the commit status of a ``status`` webhook."""
+        self.update(
+            payload["repository"]["full_name"],
+            payload["sha"],
+            payload["context"],
+            payload["state"],
+            payload.get("updated_at") or "",
+        )
+
+    def update_from_check_run_event(self, payload: dict) -> None:
+        """Record the check run of a ``check_run`` webhook."""
+        check_run = payload["check_run"]
+
+        self.update(
+            payload["repository"]["full_name"],
+            check_run["head_sha"],
+            check_run["name"],
+            check_run_state(check_run),
+            check_run.get("completed_at") or check_run.get("started_at") or "",
+        )
+
+    def update_from_combined_status(self, repo: str, combined_status: dict) -> None:
+        """Record the final statuses of a response of the combined status endpoint."""
+        for status in combined_status.get("statuses", []):
+            if status["state"] in FINAL_STATES:
+                self.update(
+                    repo, combined_status["sha"], status["context"], status["state"], status.get("updated_at") or "",
+                )
+
+    def update_from_status_contexts(self, repo: str, sha: str, contexts: typing.List[dict]) -> None:
+        """Record the final statuses of the ``StatusContext`` nodes of a GraphQL response."""
+        for context in contexts:
+            state = context["state"].lower()
+            if state in FINAL_STATES:
+                self.update(repo, sha, context["context"], state, context.get("createdAt") or "")
+
+
+def get_commit_status_index() -> CommitStatusIndex:
+    """Get the process-wide commit status index."""
+    global _STATUS_INDEX
+
+    with _STATUS_INDEX_LOCK:
+        if _STATUS_INDEX is None:
+            _STATUS_INDEX = CommitStatusIndex()
+
+    return _STATUS_INDEX
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Classify Pull Request and Issue titles into categories, using one declarative rule table.
+
+The rules are compiled into two prefix tries (case-sensitive and case-insensitive) and one regular
+expression for the markers a title may contain anywhere, so that a title is classified in a single
+pass over its characters, no matter how many rules there are.
+"""
+
+
+import functools
+import re
+import typing
+
+
+class TitleRule(typing.NamedTuple):
+    """A category, for titles starting with ``prefix`` and ending with ``suffix``, or containing any ``markers``.
+
+    Markers are matched ignoring case, prefixes and suffixes only if ``ignore_case`` is set.
+    """
+
+    category: str
+    prefix: str = ""
+    suffix: str = ""
+    markers: typing.Tuple[str, ...] = ()
+    ignore_case: bool = False
+
+
+WIP_MARKERS = ("wip", "🚧", "dnm", "work in progress", "work-in-progress", "do not merge", "do-not-merge", "draft")
+
+TITLE_RULES = [
+    TitleRule("automatic", prefix="Automatic "),
+    TitleRule("automatic_update", prefix="Automatic update of"),
+    TitleRule("automatic_dependency_update", prefix="Automatic update of dependency"),
+    TitleRule("dependency_relock", prefix="Automatic dependency re-locking"),
+    TitleRule("initial_dependency_lock", prefix="Initial dependency lock"),
+    TitleRule("failed_dependency_update", prefix="Failed to update dependencies"),
+    TitleRule("release", prefix="Release of"),
+    TitleRule("release_version", prefix="Release of version"),
+    TitleRule("version_bump_stage", prefix="bump version of", suffix="stage", ignore_case=True),
+    TitleRule("ml_prague_workshop", prefix="Workshop issue ML Prague"),
+    TitleRule("work_in_progress", markers=WIP_MARKERS),
+]
+
+# titles of automated SrcOps Pull Requests and Issues we do not notify about
+AUTOMATED_CATEGORIES = frozenset(["automatic_update", "dependency_relock", "release"])
+
+
+class _TrieNode:
+    """A node of a prefix trie, with the rules of the prefixes ending here."""
+
+    __slots__ = ("children", "rules")
+
+    def __init__(self):
+        """Initialize an empty node."""
+        self.children = {}
+        self.rules = []
+
+
+class TitleClassifier:
+    """A matcher compiled from a rule table, tagging a title with all categories of the rules it matches."""
+
+    def __init__(self, rules: typing.Iterable[TitleRule] = TITLE_RULES):
+        """Compile the rules."""
+        self.rules = list(rules)
+        self._tries = {False: _TrieNode(), True: _TrieNode()}
+        self._prefixes = {False: [], True: []}
+        self._marker_categories = {}
+
+        for rule in self.rules:
+            if rule.prefix:
+                prefix = rule.prefix.lower() if rule.ignore_case else rule.prefix
+                self._prefixes[rule.ignore_case].append(prefix)
+
+                node = self._tries[rule.ignore_case]
+                for char in prefix:
+                    node = node.children.setdefault(char, _TrieNode())
+                node.rules.append(rule)
+
+        # most titles do not start with any prefix, they are rejected without walking the tries
+        self._prefixes = {ignore_case: tuple(prefixes) for ignore_case, prefixes in self._prefixes.items()}
+
+        for rule in self.rules:
+            for marker in rule.markers:
+                self._marker_categories.setdefault(marker.lower(), set()).add(rule.category)
+
+        self._markers = None
+        if self._marker_categories:
+            # longest markers first, so that a marker is not shadowed by one of its prefixes
+            markers = sorted(self._marker_categories, key=len, reverse=True)
+            self._markers = re.compile("|".join(re.escape(m) for m in markers))
+
+    def _match_prefixes(self, text: str, ignore_case: bool, categories: set) -> None:
+        """Add the categories of the prefix rules matching the text, walking the trie along its characters."""
+        if not text.startswith(self._prefixes[ignore_case]):
+            return
+
+        node = self._tries[ignore_case]
+        for char in text:
+            node = node.children.get(char)
+            if node is None:
+                return
+
+            for rule in node.rules:
+                if not rule.suffix or text.endswith(rule.suffix.lower() if ignore_case else rule.suffix):
+                    categories.add(rule.category)
+
+    def classify(self, title: str) -> typing.FrozenSet[str]:
+        """Get the categories of the title."""
+        categories = set()
+        lower_title = title.lower()
+
+        self._match_prefixes(title, False, categories)
+        self._match_prefixes(lower_title, True, categories)
+
+        if self._markers is not None:
+            for marker in self._markers.findall(lower_title):
+                categories.update(self._marker_categories[marker])
+
+        return frozenset(categories)
+
+
+_CLASSIFIER = TitleClassifier()
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_title(title: str) -> typing.FrozenSet[str]:
+    """Get the categories of a Pull Request or Issue title, each title is classified once."""
+    return _CLASSIFIER.classify(title)
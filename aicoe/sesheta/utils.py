@@ -27,10 +27,14 @@ import random
 import re
 
 
-from httplib2 import Http
-from apiclient.discovery import build, build_from_document
-from oauth2client.service_account import ServiceAccountCredentials
-from aiographql.client import GraphQLClient, GraphQLRequest, GraphQLResponse
+import aicoe.sesheta.metrics as metrics
+
+from aicoe.sesheta.chat_routing import get_chat_router
+from aicoe.sesheta.chat_sender import ChatSendError, get_chat_sender
+from aicoe.sesheta.coalescer import NotificationCoalescer
+from aicoe.sesheta.dispatcher import Notification, NotificationDispatcher
+from aicoe.sesheta.identity import IdentityDirectory, get_github_members
+from aicoe.sesheta.outbox import Outbox, OutboxDrainer
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,45 +42,19 @@ _LOGGER.setLevel(logging.DEBUG if bool(os.getenv("DEBUG", False)) else logging.I
 THOTH_DEVOPS_SPACE = os.getenv("SESHETA_THOTH_DEVOPS_SPACE", None)  # pragma: no cover
 AIOPS_DEVOPS_SPACE = os.getenv("SESHETA_AIOPS_DEVOPS_SPACE", None)  # pragma: no cover
 DISABLE_CHAT_NOTIFICATIONS = os.getenv("DISABLE_CHAT_NOTIFICATIONS", True)  # pragma: no cover
-
-_GITHUB_ORG_MEMBERS_REQUEST = GraphQLRequest(
-    query="""
-{
-  organization(login: "thoth-station") {
-    membersWithRole(first: 100) {
-      edges {
-        node {
-          name
-          login
-        }
-      }
-    }
-  }
-}
-""",
-)
-
-
-async def get_github_members(org: str = "thoth-station") -> dict:
-    """Get a list of GitHub org members including their names."""
-    client = GraphQLClient(
-        endpoint="https://api.github.com/graphql",
-        headers={"Authorization": f"Bearer {os.environ['GITHUB_TOKEN']}"},
-    )
-    members = dict()
-
-    resp: GraphQLResponse = await client.query(request=_GITHUB_ORG_MEMBERS_REQUEST)
-    _LOGGER.debug(resp.data)
-
-    for member in resp.data["organization"]["membersWithRole"]["edges"]:
-        login = member["node"]["login"].lower()
-        name = member["node"]["name"]
-        members[login] = name
-
-    _LOGGER.debug(members)
-
-    return members
-
+CHAT_NOTIFICATION_WORKERS = int(os.getenv("SESHETA_CHAT_NOTIFICATION_WORKERS", 4))  # pragma: no cover
+CHAT_NOTIFICATION_QUEUE_SIZE = int(os.getenv("SESHETA_CHAT_NOTIFICATION_QUEUE_SIZE", 1000))  # pragma: no cover
+CHAT_NOTIFICATION_COALESCE_WINDOW = float(
+    os.getenv("SESHETA_CHAT_NOTIFICATION_COALESCE_WINDOW", 3.0),
+)  # pragma: no cover
+CHAT_NOTIFICATION_OUTBOX_PATH = os.getenv("SESHETA_CHAT_NOTIFICATION_OUTBOX_PATH", None)  # pragma: no cover
+IDENTITY_GITHUB_ORGS = os.getenv("SESHETA_IDENTITY_GITHUB_ORGS", "thoth-station").split(",")  # pragma: no cover
+IDENTITY_TTL = float(os.getenv("SESHETA_IDENTITY_TTL", 3600))  # pragma: no cover
+
+_NOTIFICATION_DISPATCHER = None
+_NOTIFICATION_COALESCER = None
+_NOTIFICATION_OUTBOX_DRAINER = None
+_IDENTITY_DIRECTORY = None
 
 # pragma: no cover
 GITHUB_REALNAME_MAP = {
@@ -201,73 +179,152 @@ URL_REGEX = re.compile(
 )
 
 
-def hangouts_room_for(data: str) -> str:
-    """Return the Google Hangout Chat Room for the given GitHub repository name."""
-    if any(org in data.lower() for org in ["thoth-station", "sefkhet-abwy", "sesheta", "srcopsmetrics"]):
-        return THOTH_DEVOPS_SPACE
-    if "AICoE" in data:
-        return AIOPS_DEVOPS_SPACE
-    else:
-        return None
+def hangouts_room_for(data: str, kind: str = "plain") -> str:
+    """Return the Google Hangout Chat Room for the given GitHub repository URL and kind of notification."""
+    return get_chat_router().route(data, kind)
+
+
+def get_identity_directory() -> IdentityDirectory:
+    """Get the process-wide directory of GitHub logins, seeded with the static maps."""
+    global _IDENTITY_DIRECTORY
+
+    if _IDENTITY_DIRECTORY is None:
+        _IDENTITY_DIRECTORY = IdentityDirectory(
+            IDENTITY_GITHUB_ORGS,
+            [THOTH_DEVOPS_SPACE, AIOPS_DEVOPS_SPACE],
+            realnames=GITHUB_REALNAME_MAP,
+            chat_user_ids=REALNAME_HANGOUTS_MAP,
+            ttl=IDENTITY_TTL,
+        )
+
+    return _IDENTITY_DIRECTORY
 
 
 def hangouts_userid(github_user: str) -> str:
     """Map GitHub user to Google Hangout Chat user ID."""
-    try:
-        return f"<users/{REALNAME_HANGOUTS_MAP[GITHUB_REALNAME_MAP[github_user.lower()]]}>"
-    except KeyError as exc:
+    chat_user_id = get_identity_directory().chat_user_id(github_user)
+
+    if chat_user_id is None:
         return github_user
 
+    return f"<users/{chat_user_id}>"
+
 
 def realname(github_user: str) -> str:
     """Map GitHub user to Real Name."""
-    return GITHUB_REALNAME_MAP.get(github_user.lower(), github_user)
+    return get_identity_directory().realname(github_user)
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Get the process-wide dispatcher delivering chat notifications."""
+    global _NOTIFICATION_DISPATCHER
+
+    if _NOTIFICATION_DISPATCHER is None:
+        _NOTIFICATION_DISPATCHER = NotificationDispatcher(
+            send_chat_message, workers=CHAT_NOTIFICATION_WORKERS, max_queue_size=CHAT_NOTIFICATION_QUEUE_SIZE,
+        )
+
+    return _NOTIFICATION_DISPATCHER
+
+
+def get_notification_outbox_drainer() -> typing.Optional[OutboxDrainer]:
+    """Get the process-wide drainer of the chat notification outbox, if an outbox is configured."""
+    global _NOTIFICATION_OUTBOX_DRAINER
+
+    if _NOTIFICATION_OUTBOX_DRAINER is None and CHAT_NOTIFICATION_OUTBOX_PATH is not None:
+        _NOTIFICATION_OUTBOX_DRAINER = OutboxDrainer(
+            Outbox(CHAT_NOTIFICATION_OUTBOX_PATH),
+            _deliver_from_outbox,
+            batch_size=CHAT_NOTIFICATION_WORKERS,
+            coalesce_window=CHAT_NOTIFICATION_COALESCE_WINDOW,
+        )
+
+    return _NOTIFICATION_OUTBOX_DRAINER
+
+
+async def _deliver_from_outbox(notification: Notification) -> None:
+    """Deliver a notification from the outbox, dropping it if sending it again would fail again."""
+    try:
+        await get_notification_dispatcher().deliver(notification)
+    except ChatSendError as exc:
+        if exc.retryable:
+            raise
+
+        _LOGGER.error(f"dropping chat notification for {notification.thread_key} from the outbox: {exc}")
+        metrics.CHAT_NOTIFICATIONS_DROPPED.labels(reason="undeliverable").inc()
+
+
+def get_notification_coalescer() -> NotificationCoalescer:
+    """Get the process-wide coalescer merging chat notifications sent to the same thread."""
+    global _NOTIFICATION_COALESCER
+
+    if _NOTIFICATION_COALESCER is None:
+        _NOTIFICATION_COALESCER = NotificationCoalescer(
+            lambda notification: get_notification_dispatcher().enqueue(notification),
+            window=CHAT_NOTIFICATION_COALESCE_WINDOW,
+        )
+
+    return _NOTIFICATION_COALESCER
 
 
 def notify_channel(kind: str, message: str, thread_key: str, url: str) -> None:
-    """Send message to a Google Hangouts Chat space."""
-    if DISABLE_CHAT_NOTIFICATION:
+    """Send message to a Google Hangouts Chat space.
+
+    If called from within a running event loop, this returns right away: the message is written to
+    the outbox if ``SESHETA_CHAT_NOTIFICATION_OUTBOX_PATH`` is set, or held back in memory otherwise.
+    After a short window it is merged with other messages sent to the same thread, and delivered in
+    the background. Otherwise the message is sent synchronously.
+    """
+    if DISABLE_CHAT_NOTIFICATIONS:
         _LOGGER.info("Chat notification is disabled, skipping...")
         return
 
-    response = None
-    scopes = ["https://www.googleapis.com/auth/chat.bot"]
-    credentials = ServiceAccountCredentials.from_json_keyfile_name(
-        "/opt/app-root/etc/gcloud/sesheta-chatbot.json",
-        scopes,
-    )
-    http_auth = credentials.authorize(Http())
+    metrics.CHAT_NOTIFICATIONS.labels(kind=kind.lower()).inc()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            send_chat_message(kind, message, thread_key, url)
+        except ChatSendError as exc:
+            _LOGGER.error(exc)
 
-    chat = build("chat", "v1", http=http_auth)
+        return
+
+    notification = Notification(kind, message, thread_key, url)
+
+    drainer = get_notification_outbox_drainer()
+    if drainer is not None:
+        drainer.outbox.append(notification)
+        drainer.wake()
+        return
 
-    SPACE = hangouts_room_for(url)
+    get_notification_coalescer().add(notification)
+
+
+def send_chat_message(kind: str, message: str, thread_key: str, url: str) -> None:
+    """Send message to a Google Hangouts Chat space, this will block until Google Chat accepted it.
+
+    Raises ChatSendError if the message could not be sent, even after retrying.
+    """
+    body = None
+    SPACE = hangouts_room_for(url, kind)
 
     if SPACE is None:
+        metrics.CHAT_NOTIFICATIONS_DROPPED.labels(reason="no_space").inc()
         return
 
     if kind.upper() in ["NEW_PULL_REQUEST", "NEW_PULL_REQUEST_REVIEW", "PULL_REQUEST_REVIEW", "REBASE_PULL_REQUEST"]:
-        response = (
-            chat.spaces()
-            .messages()
-            .create(parent=SPACE, body=create_pull_request_response(message, url), threadKey=thread_key)
-        )
+        body = create_pull_request_response(message, url)
     elif kind.upper() == "NEW_ISSUE":
-        response = (
-            chat.spaces()
-            .messages()
-            .create(parent=SPACE, body=create_issue_response(message, url), threadKey=thread_key)
-        )
+        body = create_issue_response(message, url)
     elif (kind.upper() == "MERGED_PULL_REQUEST") or (kind.upper() == "PLAIN"):
-        response = chat.spaces().messages().create(parent=SPACE, body={"text": message}, threadKey=thread_key)
+        body = {"text": message}
     elif kind.upper() == "PROMETHEUS_ALERT":
-        response = (
-            chat.spaces()
-            .messages()
-            .create(parent=SPACE, body=create_prometheus_alert(message, url), threadKey=thread_key)
-        )
+        body = create_prometheus_alert(message, url)
 
-    if response is not None:
-        response.execute()
+    if body is not None:
+        get_chat_sender().send(SPACE, body, thread_key)
 
 
 def create_pull_request_response(message: str, url: str) -> dict:
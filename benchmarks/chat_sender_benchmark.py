@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Benchmark the chat sender against the fake Google Chat API server."""
+
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from aicoe.sesheta.chat_client import GoogleChatClient
+from aicoe.sesheta.chat_sender import ChatSendError, ChatSender
+
+from fake_chat_server import FakeChatServer
+
+
+@click.command()
+@click.option("--messages", default=1000, type=int, help="Number of messages to send.")
+@click.option("--spaces", default=2, type=int, help="Number of spaces to spread the messages over.")
+@click.option("--threads", default=4, type=int, help="Number of sending threads.")
+@click.option("--error-rate", default=0.0, type=float, help="Share of requests rejected with 429.")
+@click.option("--rate", default=1000.0, type=float, help="Token bucket rate per space (messages/s).")
+@click.option("--burst", default=10, type=int, help="Token bucket capacity per space.")
+@click.option("--backoff-base", default=0.01, type=float, help="Base of the exponential backoff (s).")
+def main(messages: int, spaces: int, threads: int, error_rate: float, rate: float, burst: int, backoff_base: float):
+    """Send messages through ChatSender and report throughput, retries and failures."""
+    server = FakeChatServer(error_rate=error_rate)
+    endpoint = server.start_in_thread()
+
+    client = GoogleChatClient(credentials_file=None, api_endpoint=endpoint)
+    sender = ChatSender(
+        client, rate=rate, burst=burst, backoff_base=backoff_base, failure_threshold=messages, max_retries=8,
+    )
+
+    failed = 0
+
+    def send(i: int) -> bool:
+        try:
+            sender.send(f"spaces/BENCH{i % spaces}", {"text": f"message {i}"}, f"thread_{i % 50}")
+            return True
+        except ChatSendError:
+            return False
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        failed = sum(1 for ok in executor.map(send, range(messages)) if not ok)
+    elapsed = time.monotonic() - started
+
+    print(f"messages:    {messages} to {spaces} spaces using {threads} threads, injected 429 rate: {error_rate}")
+    print(f"elapsed:     {elapsed:.2f}s")
+    print(f"throughput:  {(messages - failed) / elapsed:.1f} messages/s")
+    print(f"requests:    {server.accepted + server.rejected} ({server.rejected} rejected with 429)")
+    print(f"failed:      {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Compare the latency of the check gate decision via the REST API and via one GraphQL query."""
+
+
+import asyncio
+import statistics
+import time
+import uuid
+
+import aiohttp
+import click
+
+from octomachinery.app.runtime.context import RUNTIME_CONTEXT
+from octomachinery.github.api.raw_client import RawGitHubAPI
+from octomachinery.github.api.tokens import GitHubOAuthToken
+from octomachinery.github.models.events import GitHubWebhookEvent
+
+from aicoe.sesheta.actions.check_gate import get_check_gate_state
+from aicoe.sesheta.actions.common import conclude_reviewer_list
+from aicoe.sesheta.actions.label import do_not_merge
+from aicoe.sesheta.actions.pull_request import local_check_gate_passed
+from aicoe.sesheta.actions.snapshot import get_pull_request_snapshot
+
+from fake_github_server import FakeGitHubServer
+
+
+async def rest_decision(pr_url: str) -> tuple:
+    """Decide on the gate like on_check_gate does without GraphQL."""
+    pr = await get_pull_request_snapshot(pr_url)
+    do_not_merge_label = await do_not_merge(pr_url)
+    gate_passed = await local_check_gate_passed(pr_url)
+    reviewers = await conclude_reviewer_list(pr["base"]["repo"]["owner"]["login"], pr["base"]["repo"]["name"])
+
+    return gate_passed, do_not_merge_label, reviewers
+
+
+async def graphql_decision(pr_url: str) -> tuple:
+    """Decide on the gate using the check gate query."""
+    gate = await get_check_gate_state(pr_url)
+
+    return gate.gate_passed, gate.do_not_merge, gate.reviewers
+
+
+async def measure(decide, pr_url: str, iterations: int) -> list:
+    """Time the decisions, each one as a separate webhook delivery."""
+    latencies = []
+
+    for _ in range(iterations):
+        RUNTIME_CONTEXT.github_event = GitHubWebhookEvent(name="issue_comment", payload={}, delivery_id=uuid.uuid4())
+
+        started = time.monotonic()
+        decision = await decide(pr_url)
+        latencies.append(time.monotonic() - started)
+
+        assert decision[0] and not decision[1], decision
+
+    return latencies
+
+
+async def run(commits: int, latency: float, iterations: int) -> None:
+    """Run both variants against the fake GitHub API server."""
+    server = FakeGitHubServer(commits=commits, latency=latency)
+    base_url = server.start_in_thread()
+    pr_url = f"{base_url}repos/thoth-station/adviser/pulls/1"
+
+    async with aiohttp.ClientSession() as session:
+        RUNTIME_CONTEXT.app_installation_client = RawGitHubAPI(
+            GitHubOAuthToken("benchmark"), session=session, user_agent="sesheta-benchmark", base_url=base_url,
+        )
+
+        for name, decide in [("REST", rest_decision), ("GraphQL", graphql_decision)]:
+            server.requests.clear()
+            latencies = await measure(decide, pr_url, iterations)
+
+            click.echo(
+                f"{name:8s} mean {statistics.mean(latencies) * 1000:8.1f}ms  "
+                f"p95 {sorted(latencies)[int(0.95 * (len(latencies) - 1))] * 1000:8.1f}ms  "
+                f"requests/decision {sum(server.requests.values()) / iterations:5.1f}",
+            )
+
+
+@click.command()
+@click.option("--commits", default=50, type=int, help="Number of commits of the Pull Request.")
+@click.option("--latency", default=0.05, type=float, help="Seconds the fake GitHub API adds to each response.")
+@click.option("--iterations", default=20, type=int, help="Number of gate decisions per variant.")
+def main(commits: int, latency: float, iterations: int):
+    """Compare the REST and the GraphQL path of the check gate decision."""
+    asyncio.run(run(commits, latency, iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A fake Google Chat API server, to benchmark sending chat messages offline.
+
+Run it using ``python benchmarks/fake_chat_server.py --error-rate 0.2`` and point Sesheta to it by
+setting ``SESHETA_CHAT_API_ENDPOINT=http://localhost:8085/``.
+"""
+
+
+import asyncio
+import logging
+import random
+import threading
+
+import click
+
+from aiohttp import web
+
+
+_LOGGER = logging.getLogger("aicoe.sesheta.fake_chat_server")
+
+
+class FakeChatServer:
+    """Accept messages like the Google Chat API, rejecting a share of them with 429 Too Many Requests."""
+
+    def __init__(self, error_rate: float = 0.0, latency: float = 0.0, retry_after: int = None):
+        """Initialize the server, ``latency`` seconds are added to each response."""
+        self.error_rate = error_rate
+        self.latency = latency
+        self.retry_after = retry_after
+        self.accepted = 0
+        self.rejected = 0
+
+    async def create_message(self, request: web.Request) -> web.Response:
+        """Handle spaces.messages.create."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if random.random() < self.error_rate:
+            self.rejected += 1
+            headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else None
+            return web.json_response(
+                {"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}},
+                status=429,
+                headers=headers,
+            )
+
+        self.accepted += 1
+        body = await request.json()
+        space = request.match_info["space"]
+        thread_key = request.query.get("threadKey", "default")
+
+        return web.json_response(
+            {
+                "name": f"spaces/{space}/messages/{self.accepted}",
+                "text": body.get("text", ""),
+                "thread": {"name": f"spaces/{space}/threads/{thread_key}"},
+            },
+        )
+
+    async def list_members(self, request: web.Request) -> web.Response:
+        """Handle spaces.members.list."""
+        space = request.match_info["space"]
+
+        return web.json_response(
+            {
+                "memberships": [
+                    {"name": f"spaces/{space}/members/1", "member": {"name": "users/1", "displayName": "Sesheta"}},
+                ],
+            },
+        )
+
+    def app(self) -> web.Application:
+        """Create the aiohttp application."""
+        app = web.Application()
+        app.add_routes(
+            [
+                web.post("/v1/spaces/{space}/messages", self.create_message),
+                web.get("/v1/spaces/{space}/members", self.list_members),
+            ],
+        )
+
+        return app
+
+    def start_in_thread(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread, return the base URL of the server."""
+        started = threading.Event()
+        address = {}
+
+        async def serve():
+            runner = web.AppRunner(self.app())
+            await runner.setup()
+            site = web.TCPSite(runner, host, port)
+            await site.start()
+            address["port"] = runner.addresses[0][1]
+            started.set()
+            await asyncio.Event().wait()
+
+        threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+        started.wait()
+
+        return f"http://{host}:{address['port']}/"
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", help="Address to listen on.")
+@click.option("--port", default=8085, type=int, help="Port to listen on.")
+@click.option("--error-rate", default=0.0, type=float, help="Share of requests rejected with 429.")
+@click.option("--latency", default=0.0, type=float, help="Seconds added to each response.")
+@click.option("--retry-after", default=None, type=int, help="Retry-After header sent with 429 responses.")
+def cli(host: str, port: int, error_rate: float, latency: float, retry_after: int):
+    """Run the fake Google Chat API server."""
+    server = FakeChatServer(error_rate=error_rate, latency=latency, retry_after=retry_after)
+    web.run_app(server.app(), host=host, port=port)
+
+
+if __name__ == "__main__":
+    cli()
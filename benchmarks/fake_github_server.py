@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A fake GitHub API server, to benchmark Sesheta's use of the GitHub API offline.
+
+It serves one repository with one Pull Request, which has ``--commits`` commits and passed the
+'local/check' gate, and an organization with ``--repositories`` repositories without milestones.
+Run it using ``python benchmarks/fake_github_server.py --latency 0.05``.
+"""
+
+
+import asyncio
+import base64
+import collections
+import logging
+import threading
+
+import click
+
+from aiohttp import web
+
+
+_LOGGER = logging.getLogger("aicoe.sesheta.fake_github_server")
+
+CODEOWNERS = "* @fridex @goern\n"
+CODEOWNERS_SHA = "c0de0000000000000000000000000000000000fe"
+PER_PAGE = 30
+
+
+class FakeGitHubServer:
+    """Serve the parts of the GitHub REST and GraphQL APIs Sesheta uses, counting the requests."""
+
+    def __init__(self, commits: int = 5, latency: float = 0.0, repositories: int = 10, connect_latency: float = 0.0):
+        """Initialize the server, ``latency`` seconds are added to each response.
+
+        ``connect_latency`` seconds are added to the first response on a connection, standing in for the
+        DNS lookup, TCP and TLS handshakes a new connection to GitHub takes.
+        """
+        self.commits = commits
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.repositories = repositories
+        self.requests = collections.Counter()
+        self.connections = set()
+        self.base_url = None
+
+    def _sha(self, i: int) -> str:
+        """Get the SHA of the i-th commit of the Pull Request."""
+        return f"{i:040x}"
+
+    def _pull_request(self, owner: str, repo: str, number: int) -> dict:
+        """Render the Pull Request like the REST API does."""
+        repo_url = f"{self.base_url}repos/{owner}/{repo}"
+
+        return {
+            "id": 4242,
+            "number": number,
+            "title": "Benchmark the check gate",
+            "url": f"{repo_url}/pulls/{number}",
+            "html_url": f"https://github.com/{owner}/{repo}/pull/{number}",
+            "issue_url": f"{repo_url}/issues/{number}",
+            "user": {"login": "goern"},
+            "labels": [{"name": "size/S"}],
+            "requested_reviewers": [{"login": "fridex"}],
+            "state": "open",
+            "head": {"sha": self._sha(self.commits - 1), "ref": "benchmark"},
+            "base": {
+                "sha": self._sha(0),
+                "ref": "master",
+                "repo": {"name": repo, "full_name": f"{owner}/{repo}", "owner": {"login": owner}, "url": repo_url},
+            },
+            "merged": False,
+            "mergeable": True,
+            "rebaseable": True,
+        }
+
+    async def _respond(self, name: str) -> None:
+        """Count the request and simulate the latency of GitHub."""
+        self.requests[name] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def get_pull_request(self, request: web.Request) -> web.Response:
+        """Handle GET /repos/{owner}/{repo}/pulls/{number}."""
+        await self._respond("pull_request")
+        info = request.match_info
+
+        return web.json_response(self._pull_request(info["owner"], info["repo"], int(info["number"])))
+
+    async def list_commits(self, request: web.Request) -> web.Response:
+        """Handle GET /repos/{owner}/{repo}/pulls/{number}/commits, paginated."""
+        await self._respond("commits")
+        info = request.match_info
+        page = int(request.query.get("page", 1))
+
+        start = (page - 1) * PER_PAGE
+        commits = [
+            {"sha": self._sha(i), "url": f"{self.base_url}repos/{info['owner']}/{info['repo']}/commits/{self._sha(i)}"}
+            for i in range(start, min(start + PER_PAGE, self.commits))
+        ]
+
+        headers = {}
+        if start + PER_PAGE < self.commits:
+            headers["Link"] = f'<{request.url.with_query(page=page + 1)}>; rel="next"'
+
+        return web.json_response(commits, headers=headers)
+
+    async def list_statuses(self, request: web.Request) -> web.Response:
+        """Handle GET /repos/{owner}/{repo}/commits/{sha}/statuses."""
+        await self._respond("statuses")
+
+        return web.json_response([{"context": "local/check", "state": "success"}])
+
+    async def get_combined_status(self, request: web.Request) -> web.Response:
+        """Handle GET /repos/{owner}/{repo}/commits/{sha}/status."""
+        await self._respond("status")
+
+        return web.json_response(
+            {
+                "sha": request.match_info["sha"],
+                "state": "success",
+                "statuses": [{"context": "local/check", "state": "success", "updated_at": "2026-01-01T00:00:00Z"}],
+            },
+        )
+
+    async def get_codeowners(self, request: web.Request) -> web.Response:
+        """Handle GET /repos/{owner}/{repo}/contents/.github/CODEOWNERS."""
+        await self._respond("codeowners")
+
+        return web.json_response(
+            {"sha": CODEOWNERS_SHA, "content": base64.b64encode(CODEOWNERS.encode("utf-8")).decode("ascii")},
+        )
+
+    async def graphql(self, request: web.Request) -> web.Response:
+        """Handle the check gate query of POST /graphql."""
+        await self._respond("graphql")
+        variables = (await request.json())["variables"]
+        pr = self._pull_request(variables["owner"], variables["name"], variables["number"])
+
+        return web.json_response(
+            {
+                "data": {
+                    "repository": {
+                        "pullRequest": {
+                            "databaseId": pr["id"],
+                            "number": pr["number"],
+                            "title": pr["title"],
+                            "url": pr["html_url"],
+                            "author": pr["user"],
+                            "labels": {"nodes": pr["labels"]},
+                            "reviewRequests": {"nodes": [{"requestedReviewer": r} for r in pr["requested_reviewers"]]},
+                            "files": {"nodes": [{"path": "README.md"}]},
+                            "headRefOid": pr["head"]["sha"],
+                            "commits": {
+                                "nodes": [
+                                    {
+                                        "commit": {
+                                            "oid": pr["head"]["sha"],
+                                            "status": {"contexts": [{"context": "local/check", "state": "SUCCESS"}]},
+                                        },
+                                    },
+                                ],
+                            },
+                        },
+                        "codeowners": {"oid": CODEOWNERS_SHA, "text": CODEOWNERS},
+                    },
+                },
+            },
+        )
+
+    async def list_repositories(self, request: web.Request) -> web.Response:
+        """Handle GET /orgs/{org}/repos, paginated."""
+        await self._respond("repositories")
+        page = int(request.query.get("page", 1))
+
+        start = (page - 1) * PER_PAGE
+        repositories = [
+            {"full_name": f"{request.match_info['org']}/repository-{i}", "archived": False}
+            for i in range(start, min(start + PER_PAGE, self.repositories))
+        ]
+
+        headers = {}
+        if start + PER_PAGE < self.repositories:
+            headers["Link"] = f'<{request.url.with_query(page=page + 1)}>; rel="next"'
+
+        return web.json_response(repositories, headers=headers)
+
+    async def list_milestones(self, request: web.Request) -> web.Response:
+        """Handle GET /repos/{owner}/{repo}/milestones, there are none."""
+        await self._respond("milestones")
+
+        return web.json_response([])
+
+    async def create_milestone(self, request: web.Request) -> web.Response:
+        """Handle POST /repos/{owner}/{repo}/milestones."""
+        await self._respond("create_milestone")
+
+        return web.json_response(dict(await request.json(), number=1), status=201)
+
+    @web.middleware
+    async def count_connections(self, request: web.Request, handler) -> web.Response:
+        """Count the distinct client connections the requests arrive on, simulating the cost of new ones."""
+        peer = request.transport.get_extra_info("peername")
+
+        if peer not in self.connections:
+            self.connections.add(peer)
+
+            if self.connect_latency:
+                await asyncio.sleep(self.connect_latency)
+
+        return await handler(request)
+
+    def app(self) -> web.Application:
+        """Create the aiohttp application."""
+        app = web.Application(middlewares=[self.count_connections])
+        app.add_routes(
+            [
+                web.get("/repos/{owner}/{repo}/pulls/{number}", self.get_pull_request),
+                web.get("/repos/{owner}/{repo}/pulls/{number}/commits", self.list_commits),
+                web.get("/repos/{owner}/{repo}/commits/{sha}/statuses", self.list_statuses),
+                web.get("/repos/{owner}/{repo}/commits/{sha}/status", self.get_combined_status),
+                web.get("/repos/{owner}/{repo}/contents/.github/CODEOWNERS", self.get_codeowners),
+                web.post("/graphql", self.graphql),
+                web.get("/orgs/{org}/repos", self.list_repositories),
+                web.get("/repos/{owner}/{repo}/milestones", self.list_milestones),
+                web.post("/repos/{owner}/{repo}/milestones", self.create_milestone),
+            ],
+        )
+
+        return app
+
+    def start_in_thread(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread, return the base URL of the server."""
+        started = threading.Event()
+        address = {}
+
+        async def serve():
+            runner = web.AppRunner(self.app())
+            await runner.setup()
+            site = web.TCPSite(runner, host, port)
+            await site.start()
+            address["port"] = runner.addresses[0][1]
+            started.set()
+            await asyncio.Event().wait()
+
+        threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+        started.wait()
+
+        self.base_url = f"http://{host}:{address['port']}/"
+
+        return self.base_url
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", help="Address to listen on.")
+@click.option("--port", default=8086, type=int, help="Port to listen on.")
+@click.option("--commits", default=5, type=int, help="Number of commits of the Pull Request.")
+@click.option("--latency", default=0.0, type=float, help="Seconds added to each response.")
+@click.option("--repositories", default=10, type=int, help="Number of repositories of the organization.")
+@click.option("--connect-latency", default=0.0, type=float, help="Seconds added to the first response per connection.")
+def cli(host: str, port: int, commits: int, latency: float, repositories: int, connect_latency: float):
+    """Run the fake GitHub API server."""
+    server = FakeGitHubServer(
+        commits=commits, latency=latency, repositories=repositories, connect_latency=connect_latency,
+    )
+    server.base_url = f"http://{host}:{port}/"
+    web.run_app(server.app(), host=host, port=port)
+
+
+if __name__ == "__main__":
+    cli()
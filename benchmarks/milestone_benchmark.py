@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Compare the wall time of a milestone run with a session per call and with the shared client pool."""
+
+
+import asyncio
+import logging
+import os
+import time
+
+import aiohttp
+import click
+
+from octomachinery.github.api.tokens import GitHubOAuthToken
+
+from aicoe.sesheta.actions.label import create_or_update_milestone
+from aicoe.sesheta.github_cache import CachingGitHubAPI
+from aicoe.sesheta.github_pool import get_github_pool
+from aicoe.sesheta.milestone_creator import update_milestones
+
+from fake_github_server import FakeGitHubServer
+
+
+# importing milestone_creator configures logging, keep the output readable
+logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+logging.getLogger("thoth.labelnormalizer").setLevel(logging.WARNING)
+
+MILESTONES = [
+    {"title": f"milestone-{i}", "description": "benchmark milestone", "due_on": "2099-01-01T00:00:00Z"}
+    for i in range(3)
+]
+
+
+def _client(session: aiohttp.ClientSession, base_url: str) -> CachingGitHubAPI:
+    return CachingGitHubAPI(
+        GitHubOAuthToken("benchmark"),
+        namespace="benchmark",
+        session=session,
+        user_agent="sesheta-benchmark",
+        base_url=base_url,
+    )
+
+
+async def session_per_call(org: str, base_url: str) -> None:
+    """Update the milestones like the helpers used to, each call opening a session of its own."""
+    async with aiohttp.ClientSession() as session:
+        repositories = [repo async for repo in _client(session, base_url).getiter(f"/orgs/{org}/repos")]
+
+    for repo in repositories:
+        for milestone in MILESTONES:
+            async with aiohttp.ClientSession() as session:
+                await create_or_update_milestone(
+                    repo["full_name"],
+                    milestone["title"],
+                    milestone["description"],
+                    due_on=milestone["due_on"],
+                    github_api=_client(session, base_url),
+                )
+
+
+async def shared_pool(org: str, base_url: str) -> None:
+    """Update the milestones using the shared client pool, like milestone_creator does."""
+    get_github_pool().base_url = base_url
+
+    await update_milestones(org, MILESTONES)
+
+
+async def run(repositories: int, latency: float, connect_latency: float) -> None:
+    """Run both variants against the fake GitHub API server."""
+    server = FakeGitHubServer(latency=latency, repositories=repositories, connect_latency=connect_latency)
+    # resolve the host name, like api.github.com has to be
+    base_url = server.start_in_thread().replace("127.0.0.1", "localhost")
+
+    for name, update in [("session per call", session_per_call), ("shared pool", shared_pool)]:
+        server.requests.clear()
+        server.connections.clear()
+
+        started = time.monotonic()
+        await update("thoth-station", base_url)
+        elapsed = time.monotonic() - started
+
+        click.echo(
+            f"{name:17s} {elapsed:7.2f}s  requests {sum(server.requests.values()):5d}  "
+            f"connections {len(server.connections):5d}",
+        )
+
+
+@click.command()
+@click.option("--repositories", default=50, type=int, help="Number of repositories of the organization.")
+@click.option("--latency", default=0.01, type=float, help="Seconds the fake GitHub API adds to each response.")
+@click.option(
+    "--connect-latency", default=0.1, type=float, help="Seconds the fake GitHub API adds per new connection.",
+)
+def main(repositories: int, latency: float, connect_latency: float):
+    """Compare a milestone run with a session per call and with the shared client pool."""
+    os.environ.setdefault("GITHUB_ACCESS_TOKEN", "benchmark")
+    asyncio.run(run(repositories, latency, connect_latency))
+
+
+if __name__ == "__main__":
+    main()
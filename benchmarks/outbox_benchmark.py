@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Benchmark enqueueing notifications to, and draining them from, the on-disk outbox."""
+
+
+import asyncio
+import tempfile
+import time
+
+import click
+
+from aicoe.sesheta.dispatcher import Notification
+from aicoe.sesheta.outbox import Outbox, OutboxDrainer
+
+
+@click.command()
+@click.option("--notifications", default=100000, type=int, help="Number of notifications to enqueue.")
+@click.option("--segment-size", default=1024 * 1024, type=int, help="Size of the outbox segments (bytes).")
+@click.option("--fsync", is_flag=True, default=False, help="fsync after each notification.")
+@click.option("--batch-size", default=100, type=int, help="Batch size of the drainer.")
+def main(notifications: int, segment_size: int, fsync: bool, batch_size: int):
+    """Enqueue notifications to the outbox, then drain them using a no-op delivery."""
+    notification = Notification(
+        "plain",
+        "🆕 https://github.com/thoth-station/adviser/pull/1234 a new Pull Request has been *opened*!",
+        "pull_request_adviser_1234567890",
+        "https://github.com/thoth-station/adviser/pull/1234",
+    )
+
+    with tempfile.TemporaryDirectory() as path:
+        outbox = Outbox(path, segment_size=segment_size, fsync=fsync)
+
+        started = time.perf_counter()
+        for _ in range(notifications):
+            outbox.append(notification)
+        elapsed = time.perf_counter() - started
+
+        print(f"enqueued:  {notifications} notifications in {elapsed:.2f}s, fsync={fsync}")
+        print(f"enqueue:   {notifications / elapsed:.0f} notifications/s, {elapsed / notifications * 1e6:.1f}µs each")
+        print(f"segments:  {len(outbox.segments())}")
+
+        async def deliver(notification):
+            pass
+
+        async def drain():
+            drainer = OutboxDrainer(outbox, deliver, batch_size=batch_size)
+            while await drainer.drain_once():
+                pass
+
+        started = time.perf_counter()
+        asyncio.run(drain())
+        elapsed = time.perf_counter() - started
+
+        print(f"drained:   {notifications} notifications in {elapsed:.2f}s, {notifications / elapsed:.0f}/s")
+        print(f"segments:  {len(outbox.segments())} left, {outbox.pending} notifications pending")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Sefkhet-Abwy
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Benchmark classifying titles using the compiled rule table, against the chains of checks it replaced."""
+
+
+import glob
+import json
+import os
+import time
+
+import click
+
+from aicoe.sesheta.title_rules import TITLE_RULES, TitleClassifier, classify_title
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+
+# titles of the kinds Sesheta sees, in addition to the ones of the fixtures
+TITLES = [
+    "Automatic update of dependency thoth-common from 0.10.0 to 0.10.1",
+    "Automatic dependency re-locking",
+    "Initial dependency lock",
+    "Failed to update dependencies to their latest version",
+    "Release of version 0.6.0",
+    "Bump version of adviser in STAGE",
+    "Workshop issue ML Prague: install the notebooks",
+    "Add the check gate to the review manager",
+]
+
+
+def chained_classify(title: str) -> frozenset:
+    """Classify a title like the handlers did, one check after the other."""
+    categories = set()
+    lower_title = title.lower()
+
+    for rule in TITLE_RULES:
+        if rule.markers:
+            if any(m in lower_title for m in rule.markers):
+                categories.add(rule.category)
+            continue
+
+        text = lower_title if rule.ignore_case else title
+        prefix = rule.prefix.lower() if rule.ignore_case else rule.prefix
+        if text.startswith(prefix) and text.endswith(rule.suffix):
+            categories.add(rule.category)
+
+    return frozenset(categories)
+
+
+def fixture_titles() -> list:
+    """Get the titles of the Pull Request fixtures."""
+    titles = []
+
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.json"))):
+        with open(path) as f:
+            fixture = json.load(f)
+
+        if isinstance(fixture, dict) and "title" in fixture:
+            titles.append(fixture["title"])
+
+    return titles
+
+
+@click.command()
+@click.option("--iterations", default=20000, type=int, help="Number of times all titles are classified.")
+def main(iterations: int):
+    """Classify the titles of the fixtures and typical titles, using both matchers."""
+    titles = fixture_titles() + TITLES
+    classifier = TitleClassifier()
+
+    for title in titles:
+        assert classifier.classify(title) == chained_classify(title), title
+
+    matchers = [("chained", chained_classify), ("compiled", classifier.classify), ("cached", classify_title)]
+    for name, classify in matchers:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for title in titles:
+                classify(title)
+        elapsed = time.perf_counter() - started
+
+        per_title = elapsed / iterations / len(titles)
+        print(f"{name:9} {1 / per_title:10.0f} titles/s  {per_title * 1e6:.2f}µs each")
+
+
+if __name__ == "__main__":
+    main()
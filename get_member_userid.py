@@ -23,13 +23,10 @@ import os
 import logging
 import typing
 
-from httplib2 import Http
-from apiclient.discovery import build, build_from_document
-from httplib2 import Http
-from oauth2client.service_account import ServiceAccountCredentials
-
 from thoth.common import init_logging
 
+from aicoe.sesheta.chat_client import get_chat_client
+
 
 init_logging()
 
@@ -41,19 +38,18 @@ SPACE = os.getenv("SESHETA_THOTH_DEVOPS_SPACE", None)
 def main():
     """Get a List of user from a Google Chat Space and print it to stdout."""
     if SPACE is not None:
-        scopes = ["https://www.googleapis.com/auth/chat.bot"]
-        credentials = ServiceAccountCredentials.from_json_keyfile_name("sesheta-chatbot-b5a97b40eeab.json", scopes)
-        http_auth = credentials.authorize(Http())
-
-        chat = build("chat", "v1", http=http_auth)
+        chat = get_chat_client("sesheta-chatbot-b5a97b40eeab.json")
+        page_token = None
 
-        response = chat.spaces().members().list(parent=SPACE)
+        while True:
+            r = chat.list_members(SPACE, page_token=page_token)
 
-        if response is not None:
-            r = response.execute()
+            for member in r["memberships"]:
+                print(f"\"{member['member']['displayName']}\": \"{member['member']['name'].replace('users/', '')}\",")
 
-        for member in r["memberships"]:
-            print(f"\"{member['member']['displayName']}\": \"{member['member']['name'].replace('users/', '')}\",")
+            page_token = r.get("nextPageToken")
+            if not page_token:
+                break
 
 
 if __name__ == "__main__":
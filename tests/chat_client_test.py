@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's Google Chat client Tests."""
+
+
+import threading
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import aicoe.sesheta.chat_client as chat_client
+
+
+class FakeCredentials:
+    """Service account credentials, counting the token refreshes."""
+
+    def __init__(self, expires_in: timedelta):
+        """Initialize the credentials with a token expiring in ``expires_in``."""
+        self.access_token = "token"
+        self.token_expiry = datetime.utcnow() + expires_in
+        self.refreshes = 0
+
+    def refresh(self, http):
+        """Refresh the token, it is valid for an hour."""
+        self.refreshes += 1
+        self.token_expiry = datetime.utcnow() + timedelta(hours=1)
+
+    def authorize(self, http):
+        """Authorize the HTTP connection as is."""
+        return http
+
+
+@pytest.fixture
+def no_discovery(monkeypatch):
+    """Do not fetch the discovery document of the Google Chat API."""
+    monkeypatch.setattr(chat_client, "build", lambda *args, **kwargs: object())
+
+
+class TestGoogleChatClient:
+    """Class to test the long-lived Google Chat client."""
+
+    def test_http_per_thread(self, no_discovery):
+        """Test that each thread gets an HTTP connection of its own, and keeps it."""
+        client = chat_client.GoogleChatClient(None, api_endpoint="http://localhost:8085/")
+        connections = []
+
+        def use():
+            connections.append(client._http())
+            connections.append(client._http())
+
+        threads = [threading.Thread(target=use) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert connections[0] is connections[1]
+        assert connections[2] is connections[3]
+        assert connections[0] is not connections[2]
+
+    def test_ensure_token(self, no_discovery):
+        """Test that the token is only refreshed when it is about to expire."""
+        client = chat_client.GoogleChatClient(None, refresh_margin=300)
+
+        client._credentials = FakeCredentials(timedelta(hours=1))
+        client._ensure_token()
+        assert client._credentials.refreshes == 0
+
+        client._credentials = FakeCredentials(timedelta(seconds=60))
+        client._ensure_token()
+        client._ensure_token()
+        assert client._credentials.refreshes == 1
+
+    def test_get_chat_client(self, no_discovery, monkeypatch):
+        """Test that one client is kept per credentials file and API endpoint."""
+        monkeypatch.setattr(chat_client, "_CHAT_CLIENTS", {})
+
+        local = chat_client.get_chat_client(None, "http://localhost:8085/")
+
+        assert chat_client.get_chat_client(None, "http://localhost:8085/") is local
+        assert chat_client.get_chat_client(None, "http://localhost:8086/") is not local
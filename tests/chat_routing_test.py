@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's chat routing Tests."""
+
+
+import os
+import pytest
+
+from aicoe.sesheta.chat_routing import DEFAULT_RULES, ChatRouter, ReloadingChatRouter, parse_repository
+
+
+class TestChatRouting:
+    """Class to test routing notifications to Google Chat spaces."""
+
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            ("https://github.com/thoth-station/adviser/pull/1", ("thoth-station", "adviser")),
+            ("https://api.github.com/repos/AICoE/sefkhet-abwy/pulls/2", ("AICoE", "sefkhet-abwy")),
+            ("thoth-station", ("thoth-station", "")),
+        ],
+    )
+    def test_parse_repository(self, data, expected):
+        """Test getting organization and repository from URLs."""
+        assert parse_repository(data) == expected
+
+    def test_default_rules(self, monkeypatch):
+        """Test that the default rules route like the hard-coded org names did."""
+        monkeypatch.setenv("SESHETA_THOTH_DEVOPS_SPACE", "spaces/THOTH")
+        monkeypatch.setenv("SESHETA_AIOPS_DEVOPS_SPACE", "spaces/AIOPS")
+        router = ChatRouter(DEFAULT_RULES)
+
+        assert router.route("https://github.com/thoth-station/adviser/pull/1") == "spaces/THOTH"
+        assert router.route("thoth-station") == "spaces/THOTH"
+        assert router.route("https://github.com/AICoE/sefkhet-abwy/pull/2") == "spaces/THOTH"
+        assert router.route("https://github.com/AICoE/prometheus-anomaly-detector/issues/3") == "spaces/AIOPS"
+        assert router.route("https://github.com/octocat/hello-world/pull/4") is None
+
+    def test_first_matching_rule_wins(self):
+        """Test rules with repository globs and kinds."""
+        router = ChatRouter(
+            [
+                {"org": "thoth-station", "repo": "*-bot", "kind": "new_issue", "space": "spaces/BOTS"},
+                {"org": "thoth-station", "space": "spaces/THOTH"},
+            ],
+        )
+
+        assert router.route("https://github.com/thoth-station/kebechet-bot/issues/1", "NEW_ISSUE") == "spaces/BOTS"
+        assert router.route("https://github.com/thoth-station/kebechet-bot/pull/2", "plain") == "spaces/THOTH"
+
+    def test_reload_on_change(self, tmp_path):
+        """Test that a changed configuration file is reloaded."""
+        config = tmp_path / "routing.yaml"
+        config.write_text("rules:\n  - org: thoth-station\n    space: spaces/ONE\n")
+        router = ReloadingChatRouter(str(config), check_interval=0)
+
+        assert router.route("thoth-station") == "spaces/ONE"
+
+        config.write_text("rules:\n  - org: thoth-station\n    space: spaces/TWO\n")
+        os.utime(config, (0, 1))
+
+        assert router.route("thoth-station") == "spaces/TWO"
+
+    def test_keep_rules_on_invalid_config(self, tmp_path):
+        """Test that the last good rules are kept if the configuration file is not a mapping of rules."""
+        config = tmp_path / "routing.yaml"
+        config.write_text("rules:\n  - org: thoth-station\n    space: spaces/ONE\n")
+        router = ReloadingChatRouter(str(config), check_interval=0)
+
+        for mtime, content in enumerate(["- org: thoth-station\n", "just a string\n", "rules: thoth-station\n"], 1):
+            config.write_text(content)
+            os.utime(config, (0, mtime))
+
+            assert router.route("thoth-station") == "spaces/ONE"
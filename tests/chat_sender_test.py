@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Sesheta's Google Chat sender Tests."""
+
+
+import time
+import pytest
+
+import httplib2
+
+from googleapiclient.errors import HttpError
+
+import aicoe.sesheta.chat_sender as chat_sender
+
+from aicoe.sesheta.chat_sender import ChatSendError, ChatSender, CircuitBreaker, TokenBucket
+
+
+class FakeChatClient:
+    """A Google Chat client failing with the given errors before it succeeds."""
+
+    def __init__(self, *errors):
+        """Initialize the client with the errors to raise, in order."""
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create_message(self, space: str, body: dict, thread_key: str = None) -> dict:
+        """Raise the next error, or return the message."""
+        self.calls += 1
+
+        if self.errors:
+            raise self.errors.pop(0)
+
+        return {"space": space, "thread_key": thread_key}
+
+
+def _http_error(status: int, **headers) -> HttpError:
+    return HttpError(httplib2.Response({"status": status, **headers}), b"")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the backoff delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(chat_sender.time, "sleep", delays.append)
+    return delays
+
+
+class TestTokenBucket:
+    """Class to test the token bucket rate limiter."""
+
+    def test_burst_then_rate(self):
+        """Test that a full bucket allows a burst, then waits for the refill."""
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+
+        started = time.monotonic()
+        assert bucket.acquire() > 0
+        assert time.monotonic() - started >= 0.04
+
+
+class TestCircuitBreaker:
+    """Class to test the circuit breaker."""
+
+    def test_open_half_open_close(self):
+        """Test that the circuit opens after the threshold, and a trial call closes it again."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial call re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestChatSender:
+    """Class to test sending with retries and backoff."""
+
+    def test_retry_with_backoff(self, sleeps):
+        """Test that 5xx and connection errors are retried with a bounded, growing backoff."""
+        client = FakeChatClient(_http_error(503), ConnectionError(), _http_error(500))
+        sender = ChatSender(client, rate=1000, burst=10, backoff_base=0.5, backoff_max=30)
+
+        assert sender.send("spaces/a", {"text": "hi"}, "thread_1") == {"space": "spaces/a", "thread_key": "thread_1"}
+        assert client.calls == 4
+        assert len(sleeps) == 3
+        assert [delay <= 0.5 * 2 ** attempt for attempt, delay in enumerate(sleeps)] == [True] * 3
+
+    def test_retry_after(self, sleeps):
+        """Test that the delay asked for by a 429 is honored, up to backoff_max."""
+        client = FakeChatClient(_http_error(429, **{"retry-after": "2"}), _http_error(429, **{"retry-after": "90"}))
+        sender = ChatSender(client, rate=1000, burst=10, backoff_max=30)
+
+        sender.send("spaces/a", {"text": "hi"})
+        assert sleeps == [2.0, 30]
+
+    def test_retries_exhausted(self, sleeps):
+        """Test that sending gives up after max_retries."""
+        client = FakeChatClient(*[_http_error(503) for _ in range(3)])
+        sender = ChatSender(client, rate=1000, burst=10, max_retries=2, failure_threshold=10)
+
+        with pytest.raises(ChatSendError) as exc_info:
+            sender.send("spaces/a", {"text": "hi"})
+
+        assert exc_info.value.retryable
+        assert client.calls == 3
+
+    def test_client_errors_do_not_open_circuit(self, sleeps):
+        """Test that 4xx errors are not retried and do not count towards the circuit breaker."""
+        client = FakeChatClient(*[_http_error(400) for _ in range(3)])
+        sender = ChatSender(client, rate=1000, burst=10, failure_threshold=2)
+
+        for _ in range(3):
+            with pytest.raises(ChatSendError) as exc_info:
+                sender.send("spaces/a", {"text": "hi"})
+            assert not exc_info.value.retryable
+
+        assert client.calls == 3
+        assert sleeps == []
+        assert sender.send("spaces/a", {"text": "hi"})
+
+    def test_server_errors_open_circuit(self, sleeps):
+        """Test that the circuit opens after repeated 5xx errors, failing fast afterwards."""
+        client = FakeChatClient(*[_http_error(503) for _ in range(5)])
+        sender = ChatSender(client, rate=1000, burst=10, max_retries=5, failure_threshold=2, reset_timeout=60)
+
+        with pytest.raises(ChatSendError, match="circuit breaker"):
+            sender.send("spaces/a", {"text": "hi"})
+
+        assert client.calls == 2
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's check gate Tests."""
+
+
+import base64
+import hashlib
+
+import pytest
+
+import aicoe.sesheta.actions.common as common
+import aicoe.sesheta.codeowners_cache as codeowners_cache
+import aicoe.sesheta.status_index as status_index
+
+from aicoe.sesheta.actions.check_gate import CheckGateError, get_check_gate_state
+from aicoe.sesheta.pr_store import parse_pull_request_url
+
+
+def _repository(labels: list, contexts: list, codeowners: str = None, files: list = ("README.md",)) -> dict:
+    return {
+        "pullRequest": {
+            "databaseId": 4242,
+            "number": 7,
+            "title": "Add the check gate",
+            "url": "https://github.com/thoth-station/adviser/pull/7",
+            "author": {"login": "goern"},
+            "labels": {"nodes": [{"name": label} for label in labels]},
+            "reviewRequests": {"nodes": [{"requestedReviewer": {"login": "fridex"}}, {"requestedReviewer": {}}]},
+            "files": {"nodes": [{"path": path} for path in files]},
+            "headRefOid": "abc",
+            "commits": {"nodes": [{"commit": {"oid": "abc", "status": {"contexts": contexts}}}]},
+        },
+        "codeowners": (
+            {"oid": hashlib.sha1(codeowners.encode()).hexdigest(), "text": codeowners} if codeowners is not None else None
+        ),
+    }
+
+
+@pytest.fixture(autouse=True)
+def commit_status_index(monkeypatch):
+    """Use an empty commit status index for each test."""
+    monkeypatch.setattr(status_index, "_STATUS_INDEX", None)
+    return status_index.get_commit_status_index()
+
+
+class FakeGitHubAPI:
+    """A GitHub API client answering the GraphQL query."""
+
+    def __init__(self, response: dict):
+        """Initialize the client."""
+        self.response = response
+
+    async def post(self, url, data=None, **kwargs):
+        """Answer the query."""
+        return self.response
+
+
+class TestCheckGate:
+    """Class to test the check gate decision."""
+
+    def test_parse_pull_request_url(self):
+        """Test getting owner, repository and number from the API URL."""
+        assert parse_pull_request_url("https://api.github.com/repos/thoth-station/adviser/pulls/7") == (
+            "thoth-station",
+            "adviser",
+            7,
+        )
+
+    @pytest.mark.asyncio
+    async def test_gate_passed(self):
+        """Test the decision on a Pull Request which passed the gate."""
+        response = {
+            "data": {
+                "repository": _repository(
+                    ["size/S"], [{"context": "local/check", "state": "SUCCESS"}], "* @pacospace\n",
+                ),
+            },
+        }
+        gate = await get_check_gate_state(
+            "https://api.github.com/repos/thoth-station/adviser/pulls/7", FakeGitHubAPI(response),
+        )
+
+        assert gate.gate_passed
+        assert not gate.do_not_merge
+        assert gate.reviewers == ["pacospace"]
+        assert gate.pull_request["id"] == 4242
+        assert gate.requested_reviewers == ["fridex"]
+
+    @pytest.mark.asyncio
+    async def test_gate_not_passed(self):
+        """Test the decision on a work-in-progress Pull Request without CODEOWNERS."""
+        response = {
+            "data": {
+                "repository": _repository(
+                    ["work-in-progress"],
+                    [{"context": "local/check", "state": "FAILURE"}, {"context": "ci/other", "state": "SUCCESS"}],
+                ),
+            },
+        }
+        gate = await get_check_gate_state(
+            "https://api.github.com/repos/thoth-station/adviser/pulls/7", FakeGitHubAPI(response),
+        )
+
+        assert not gate.gate_passed
+        assert gate.do_not_merge
+        assert gate.reviewers == ["fridex", "pacospace"]
+
+    @pytest.mark.asyncio
+    async def test_reviewers_of_changed_files(self):
+        """Test that the Reviewers are the owners of the files changed by the Pull Request."""
+        codeowners = "* @pacospace\n/docs/ @goern\n/thoth/ @fridex\n"
+        response = {"data": {"repository": _repository([], [], codeowners, ["docs/index.rst", "thoth/adviser.py"])}}
+        gate = await get_check_gate_state(
+            "https://api.github.com/repos/thoth-station/adviser/pulls/7", FakeGitHubAPI(response),
+        )
+
+        assert gate.changed_files == ["docs/index.rst", "thoth/adviser.py"]
+        assert gate.reviewers == ["goern", "fridex"]
+
+    @pytest.mark.asyncio
+    async def test_gate_from_index(self, commit_status_index):
+        """Test that the later of the queried state and the state of the webhooks decides."""
+        pr_url = "https://api.github.com/repos/thoth-station/adviser/pulls/7"
+        contexts = [{"context": "local/check", "state": "FAILURE", "createdAt": "2026-01-01T10:00:00Z"}]
+        response = {"data": {"repository": _repository([], contexts)}}
+
+        commit_status_index.update("thoth-station/adviser", "abc", "local/check", "success", "2026-01-01T11:00:00Z")
+        assert (await get_check_gate_state(pr_url, FakeGitHubAPI(response))).gate_passed
+
+        commit_status_index.update("thoth-station/adviser", "abc", "local/check", "pending", "2026-01-01T12:00:00Z")
+        contexts[0].update({"state": "SUCCESS", "createdAt": "2026-01-01T12:05:00+01:00"})
+        assert not (await get_check_gate_state(pr_url, FakeGitHubAPI(response))).gate_passed
+
+        contexts[0].update({"createdAt": "2026-01-01T12:05:00Z"})
+        assert (await get_check_gate_state(pr_url, FakeGitHubAPI(response))).gate_passed
+        assert commit_status_index.get("thoth-station/adviser", "abc", "local/check") == "success"
+
+    @pytest.mark.asyncio
+    async def test_errors(self):
+        """Test that GraphQL errors are raised."""
+        with pytest.raises(CheckGateError):
+            await get_check_gate_state(
+                "https://api.github.com/repos/thoth-station/adviser/pulls/7",
+                FakeGitHubAPI({"data": None, "errors": [{"message": "Bad credentials"}]}),
+            )
+
+    @pytest.mark.asyncio
+    async def test_rest_fallback_reviewers(self, monkeypatch):
+        """Test that the REST fallback concludes on the same Reviewers as the check gate query."""
+        codeowners = "* @pacospace\n/docs/ @goern\n/thoth/ @fridex\n"
+        files = ["docs/index.rst", "thoth/adviser.py"]
+        pr_url = "https://api.github.com/repos/thoth-station/adviser/pulls/7"
+
+        response = {"data": {"repository": _repository([], [], codeowners, files)}}
+        gate = await get_check_gate_state(pr_url, FakeGitHubAPI(response))
+
+        class FakeRestAPI:
+            """A GitHub API client answering the files and contents API."""
+
+            async def getitem(self, url, **kwargs):
+                """Answer like GitHub does."""
+                if url.startswith(f"{pr_url}/files"):
+                    return [{"filename": path} for path in files]
+
+                return {"sha": "abc", "content": base64.b64encode(codeowners.encode()).decode()}
+
+        monkeypatch.setattr(codeowners_cache, "_CODEOWNERS_CACHE", None)
+        monkeypatch.setattr(common, "get_installation_client", FakeRestAPI)
+
+        reviewers = await common.conclude_reviewer_list(
+            "thoth-station", "adviser", await common.get_changed_files(pr_url),
+        )
+        assert reviewers == gate.reviewers == ["goern", "fridex"]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's check run manager Tests."""
+
+
+import pytest
+
+from aicoe.sesheta.check_runs import CheckRunManager
+
+
+REPO_URL = "https://api.github.com/repos/thoth-station/adviser"
+NAME = "Sesheta work-in-progress state"
+
+
+class FakeGitHubAPI:
+    """A GitHub API client recording the requests."""
+
+    def __init__(self):
+        """Initialize the client."""
+        self.requests = []
+
+    async def post(self, url, data=None, **kwargs):
+        """Record the request, and answer like GitHub does."""
+        self.requests.append(("POST", url, data["status"], data["conclusion"]))
+        return {"id": 42, **data}
+
+    async def patch(self, url, data=None, **kwargs):
+        """Record the request, and answer like GitHub does."""
+        self.requests.append(("PATCH", url, data["status"], data["conclusion"]))
+        return {"id": int(url.rsplit("/", 1)[-1]), **data}
+
+
+class TestCheckRunManager:
+    """Class to test reporting check runs."""
+
+    @pytest.mark.asyncio
+    async def test_report(self):
+        """Test that a check run is created completed, updated on a new conclusion, and not sent otherwise."""
+        github_api = FakeGitHubAPI()
+        manager = CheckRunManager()
+        output = {"title": "Good to go", "summary": "This change is no longer work-in-progress."}
+
+        for conclusion in ["neutral", "neutral", "success", "success"]:
+            await manager.report(github_api, REPO_URL, "thoth-station/adviser", "abc", NAME, conclusion, output)
+
+        assert github_api.requests == [
+            ("POST", f"{REPO_URL}/check-runs", "completed", "neutral"),
+            ("PATCH", f"{REPO_URL}/check-runs/42", "completed", "success"),
+        ]
+        assert manager.get("Thoth-Station/adviser", "abc", NAME).conclusion == "success"
+
+        await manager.report(github_api, REPO_URL, "thoth-station/adviser", "def", NAME, "neutral", output)
+        assert github_api.requests[-1] == ("POST", f"{REPO_URL}/check-runs", "completed", "neutral")
+
+    @pytest.mark.asyncio
+    async def test_report_changed_output(self):
+        """Test that a check run is updated if only its output has changed."""
+        github_api = FakeGitHubAPI()
+        manager = CheckRunManager()
+
+        for title in ["Good to go", "Good to go", "Still good to go"]:
+            await manager.report(
+                github_api, REPO_URL, "thoth-station/adviser", "abc", NAME, "success", {"title": title},
+            )
+
+        assert github_api.requests == [
+            ("POST", f"{REPO_URL}/check-runs", "completed", "success"),
+            ("PATCH", f"{REPO_URL}/check-runs/42", "completed", "success"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_seed_from_check_run_events(self):
+        """Test that check runs of our App known from webhooks are updated, and not created again."""
+        github_api = FakeGitHubAPI()
+        manager = CheckRunManager(app_id=7)
+        output = {"title": "Good to go", "summary": "This change is no longer work-in-progress."}
+
+        for app_id, check_run_id in [(7, 23), (8, 24)]:
+            manager.update_from_check_run_event(
+                {
+                    "repository": {"full_name": "thoth-station/adviser"},
+                    "check_run": {
+                        "id": check_run_id,
+                        "head_sha": "abc",
+                        "name": NAME,
+                        "status": "completed",
+                        "conclusion": "neutral",
+                        "output": {"title": "Work in progress", "summary": None, "text": None},
+                        "app": {"id": app_id},
+                    },
+                },
+            )
+
+        assert manager.get("thoth-station/adviser", "abc", NAME).id == 23
+
+        await manager.report(github_api, REPO_URL, "thoth-station/adviser", "abc", NAME, "success", output)
+        assert github_api.requests == [("PATCH", f"{REPO_URL}/check-runs/23", "completed", "success")]
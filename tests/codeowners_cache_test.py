@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's CODEOWNERS cache Tests."""
+
+
+import base64
+import http
+
+import gidgethub
+import pytest
+
+from aicoe.sesheta.actions.common import reviewers_for_paths
+from aicoe.sesheta.codeowners_cache import CodeOwnersCache
+
+
+CODEOWNERS = "* @fridex\ndocs/ @pacospace\n"
+
+
+def _push(files: list, ref: str = "refs/heads/master") -> dict:
+    return {
+        "ref": ref,
+        "repository": {"full_name": "thoth-station/adviser", "default_branch": "master"},
+        "commits": [{"added": [], "modified": files, "removed": []}],
+    }
+
+
+class FakeGitHubAPI:
+    """A GitHub API client serving the CODEOWNERS blob, counting the requests."""
+
+    def __init__(self, content: str = None):
+        """Initialize the client."""
+        self.content = content
+        self.requests = 0
+
+    async def getitem(self, url, **kwargs):
+        """Answer like the contents API does."""
+        self.requests += 1
+
+        if self.content is None:
+            raise gidgethub.BadRequest(http.HTTPStatus.NOT_FOUND)
+
+        return {"sha": "abc", "content": base64.b64encode(self.content.encode()).decode()}
+
+
+class TestCodeOwnersCache:
+    """Class to test parsing CODEOWNERS once per blob."""
+
+    @pytest.mark.asyncio
+    async def test_fetch(self):
+        """Test that CODEOWNERS are downloaded once, and missing ones are remembered as well."""
+        cache = CodeOwnersCache()
+        github_api = FakeGitHubAPI(CODEOWNERS)
+
+        codeowners = await cache.fetch("thoth-station", "adviser", github_api)
+        assert await cache.fetch("Thoth-Station", "adviser", github_api) is codeowners
+        assert github_api.requests == 1
+
+        github_api = FakeGitHubAPI()
+        assert await cache.fetch("thoth-station", "kebechet", github_api) is None
+        assert await cache.fetch("thoth-station", "kebechet", github_api) is None
+        assert github_api.requests == 1
+
+        assert reviewers_for_paths("thoth-station", "adviser", codeowners, ["README.md", "docs/index.rst"]) == [
+            "fridex",
+            "pacospace",
+        ]
+        assert reviewers_for_paths("thoth-station", "kebechet", None) == ["fridex", "pacospace"]
+
+    def test_put(self):
+        """Test that a blob is parsed again only if its SHA has changed."""
+        cache = CodeOwnersCache()
+
+        codeowners = cache.put("thoth-station/adviser", "abc", CODEOWNERS)
+        assert cache.put("thoth-station/adviser", "abc", CODEOWNERS) is codeowners
+        assert cache.put("thoth-station/adviser", "def", "* @goern\n") is not codeowners
+
+    def test_apply_push_event(self):
+        """Test that only pushes to the default branch changing the CODEOWNERS invalidate the entry."""
+        cache = CodeOwnersCache()
+        cache.put("thoth-station/adviser", "abc", CODEOWNERS)
+
+        cache.apply_push_event(_push(["README.md"]))
+        cache.apply_push_event(_push([".github/CODEOWNERS"], ref="refs/heads/feature"))
+        assert cache.get("thoth-station/adviser") is not None
+
+        cache.apply_push_event(_push([".github/CODEOWNERS"]))
+        assert cache.get("thoth-station/adviser") is None
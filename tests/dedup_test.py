@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's notification dedup store Tests."""
+
+
+import asyncio
+import time
+import pytest
+
+from aicoe.sesheta.dedup import MemoryDedupStore, SQLiteDedupStore
+
+
+def _stores(tmp_path, **kwargs) -> list:
+    return [MemoryDedupStore(**kwargs), SQLiteDedupStore(str(tmp_path / "dedup.sqlite"), **kwargs)]
+
+
+class TestDedupStore:
+    """Class to test the dedup store backends."""
+
+    @pytest.mark.asyncio
+    async def test_seen(self, tmp_path):
+        """Test that a key is only reported as new once."""
+        for store in _stores(tmp_path, max_len=10, max_age=60):
+            assert not await store.seen("thoth-station/a_1_goern")
+            assert await store.seen("thoth-station/a_1_goern")
+            assert not await store.seen("thoth-station/a_1_fridex")
+
+    @pytest.mark.asyncio
+    async def test_expiry(self, tmp_path):
+        """Test that keys expire after max_age."""
+        for store in _stores(tmp_path, max_len=10, max_age=0.05):
+            assert not await store.seen("key")
+            await asyncio.sleep(0.1)
+            assert not await store.seen("key")
+
+    @pytest.mark.asyncio
+    async def test_capacity(self, tmp_path):
+        """Test that the least recently seen key is evicted when the store is full."""
+        for store in _stores(tmp_path, max_len=2, max_age=60):
+            assert not await store.seen("a")
+            time.sleep(0.01)
+            assert not await store.seen("b")
+            time.sleep(0.01)
+            assert await store.seen("a")
+            time.sleep(0.01)
+            assert not await store.seen("c")
+
+            assert len(store) == 2
+            assert await store.seen("a")
+            assert not await store.seen("b")
+
+    @pytest.mark.asyncio
+    async def test_shared_sqlite_store(self, tmp_path):
+        """Test that two stores on the same database deduplicate against each other."""
+        path = str(tmp_path / "shared.sqlite")
+        replica_1 = SQLiteDedupStore(path, max_len=10, max_age=60)
+        replica_2 = SQLiteDedupStore(path, max_len=10, max_age=60)
+
+        assert not await replica_1.seen("key")
+        assert await replica_2.seen("key")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sqlite_lookups(self, tmp_path):
+        """Test that concurrent lookups, running in the executor, each see a key only once."""
+        store = SQLiteDedupStore(str(tmp_path / "dedup.sqlite"), max_len=100, max_age=60)
+
+        hits = await asyncio.gather(*(store.seen(f"key_{i % 10}") for i in range(50)))
+
+        assert hits.count(False) == 10
+        assert len(store) == 10
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's notification dispatcher Tests."""
+
+
+import asyncio
+import time
+import pytest
+
+from aicoe.sesheta.coalescer import NotificationCoalescer
+from aicoe.sesheta.dispatcher import Notification, NotificationDispatcher
+
+
+class TestNotificationDispatcher:
+    """Class to test the non-blocking notification dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_before_delivery(self):
+        """Test that enqueueing does not wait for the (slow) delivery."""
+        delivered = []
+
+        def deliver(kind, message, thread_key, url):
+            time.sleep(0.1)
+            delivered.append(thread_key)
+
+        dispatcher = NotificationDispatcher(deliver, workers=2)
+
+        started = time.monotonic()
+        assert dispatcher.enqueue(Notification("plain", "one", "thread_1", "https://github.com/thoth-station/a"))
+        assert dispatcher.enqueue(Notification("plain", "two", "thread_2", "https://github.com/thoth-station/a"))
+        assert time.monotonic() - started < 0.05
+        assert delivered == []
+
+        await dispatcher.close()
+
+        assert sorted(delivered) == ["thread_1", "thread_2"]
+        assert dispatcher.qsize == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_notification(self):
+        """Test that a full queue drops notifications instead of blocking the handler."""
+        dispatcher = NotificationDispatcher(lambda *args: None, workers=1, max_queue_size=1)
+
+        assert dispatcher.enqueue(Notification("plain", "one", "thread_1", ""))
+        assert not dispatcher.enqueue(Notification("plain", "two", "thread_2", ""))
+
+        await dispatcher.close()
+
+    def test_bound_to_one_loop(self):
+        """Test that the workers stay on the event loop they were started on, until the dispatcher is closed."""
+        dispatcher = NotificationDispatcher(lambda *args: None, workers=1)
+
+        async def enqueue(close: bool):
+            dispatcher.enqueue(Notification("plain", "one", "thread_1", ""))
+            if close:
+                await dispatcher.close()
+
+        asyncio.run(enqueue(close=True))
+        asyncio.run(enqueue(close=False))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(enqueue(close=False))
+
+
+class TestNotificationCoalescer:
+    """Class to test merging of notifications sent to the same thread."""
+
+    @pytest.mark.asyncio
+    async def test_merge_within_window(self):
+        """Test that notifications to one thread are merged, and other threads are kept apart."""
+        emitted = []
+        coalescer = NotificationCoalescer(emitted.append, window=0.05)
+
+        coalescer.add(Notification("plain", "opened", "pull_request_a_1", "https://github.com/thoth-station/a"))
+        coalescer.add(Notification("plain", "approved", "pull_request_a_1", "https://github.com/thoth-station/a"))
+        coalescer.add(Notification("plain", "opened", "pull_request_a_2", "https://github.com/thoth-station/a"))
+        assert emitted == []
+        assert coalescer.pending == 3
+
+        await asyncio.sleep(0.1)
+
+        assert len(emitted) == 2
+        assert emitted[0].message == "opened\napproved"
+        assert emitted[1].message == "opened"
+        assert coalescer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_merge_kinds_of_one_thread(self):
+        """Test that notifications of different kinds to one thread are merged, flushed on shutdown."""
+        emitted = []
+        coalescer = NotificationCoalescer(emitted.append, window=60)
+
+        url = "https://github.com/thoth-station/a"
+        coalescer.add(Notification("new_pull_request", "opened", "pull_request_a_1", url))
+        coalescer.add(Notification("plain", "approved", "pull_request_a_1", url))
+        coalescer.flush_all()
+
+        assert len(emitted) == 1
+        assert emitted[0].kind == "new_pull_request"
+        assert emitted[0].message == "opened\napproved"
+        assert coalescer.pending == 0
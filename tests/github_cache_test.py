@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's GitHub API response cache Tests."""
+
+
+import contextvars
+import types
+
+import aiohttp
+import pytest
+
+from aiohttp import web
+
+from octomachinery.app.runtime.context import RUNTIME_CONTEXT
+from octomachinery.github.api.tokens import GitHubOAuthToken
+
+from aicoe.sesheta.github_cache import CachingGitHubAPI, ResponseCache, get_installation_client
+from aicoe.sesheta.github_pool import get_github_pool
+
+
+class TestResponseCache:
+    """Class to test the response cache."""
+
+    def test_lru(self):
+        """Test that the least recently used response is evicted."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("installation/1", "/a", ('"a"', None, {"a": 1}, None))
+        cache.set("installation/1", "/b", ('"b"', None, {"b": 1}, None))
+        assert cache.get("installation/1", "/a") is not None
+
+        cache.set("installation/1", "/c", ('"c"', None, {"c": 1}, None))
+
+        assert cache.get("installation/1", "/b") is None
+        assert cache.get("installation/1", "/a") is not None
+        assert cache.get("installation/2", "/a") is None
+
+    def test_persistence(self, tmp_path):
+        """Test that persisted responses survive a restart."""
+        path = str(tmp_path / "responses.sqlite")
+        ResponseCache(path=path).set("access-token", "/a", ('"a"', "Mon, 01 Jan 2024 00:00:00 GMT", [1, 2], None))
+
+        assert ResponseCache(path=path).get("access-token", "/a") == (
+            '"a"',
+            "Mon, 01 Jan 2024 00:00:00 GMT",
+            [1, 2],
+            None,
+        )
+
+    def test_namespaces(self):
+        """Test that the view of a namespace only holds its own responses."""
+        cache = ResponseCache()
+        cache.set("installation/1", "/a", ('"a"', None, {"a": 1}, None))
+        cache.set("installation/2", "/b", ('"b"', None, {"b": 1}, None))
+
+        assert list(cache.urls("installation/1")) == ["/a"]
+        assert list(cache.view("installation/2")) == ["/b"]
+        assert len(cache.view("installation/3")) == 0
+
+    @pytest.mark.asyncio
+    async def test_installation_client(self):
+        """Test that the client of an installation caches responses in the installation's namespace."""
+        context_client = object()
+
+        def set_up_context(payload: dict):
+            RUNTIME_CONTEXT.app_installation = types.SimpleNamespace()
+            RUNTIME_CONTEXT.app_installation_client = context_client
+            RUNTIME_CONTEXT.github_event = types.SimpleNamespace(payload=payload)
+            return get_installation_client()
+
+        github_api = contextvars.copy_context().run(set_up_context, {"installation": {"id": 7}})
+        assert isinstance(github_api, CachingGitHubAPI)
+        assert github_api._cache.namespace == "installation/7"
+
+        assert contextvars.copy_context().run(set_up_context, {}) is context_client
+
+        await get_github_pool().close()
+
+    @pytest.mark.asyncio
+    async def test_conditional_request(self):
+        """Test that an unchanged response is served from the cache after a 304."""
+        requests = []
+
+        async def handler(request):
+            requests.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.json_response({"sha": "abc"}, headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/repos/thoth-station/adviser/pulls/1", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                github_api = CachingGitHubAPI(
+                    GitHubOAuthToken("x"),
+                    cache=ResponseCache(),
+                    session=session,
+                    user_agent="sesheta-test",
+                    base_url=f"http://127.0.0.1:{port}",
+                )
+
+                assert await github_api.getitem("/repos/thoth-station/adviser/pulls/1") == {"sha": "abc"}
+                assert await github_api.getitem("/repos/thoth-station/adviser/pulls/1") == {"sha": "abc"}
+        finally:
+            await runner.cleanup()
+
+        assert requests == [None, '"v1"']
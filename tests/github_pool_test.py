@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's GitHub client pool Tests."""
+
+
+import pytest
+
+from aicoe.sesheta.github_pool import GitHubClientPool
+
+
+class TestGitHubClientPool:
+    """Class to test sharing one session between the GitHub API clients."""
+
+    @pytest.mark.asyncio
+    async def test_shared_session(self):
+        """Test that clients share the session and its connection limits, until the pool is closed."""
+        pool = GitHubClientPool(base_url="http://localhost:8086", limit_per_host=5)
+
+        first, second = pool.client("token"), pool.client("token")
+        assert first._session is second._session
+        assert first._session.connector.limit_per_host == 5
+        assert first.base_url == "http://localhost:8086"
+
+        await pool.close()
+        assert first._session.closed
+
+        third = pool.client("token")
+        assert third._session is not first._session
+
+        await pool.close()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Sesheta's identity directory Tests."""
+
+
+import time
+import pytest
+
+import aicoe.sesheta.identity as identity
+
+from aicoe.sesheta.identity import IdentityDirectory, normalize_name
+
+
+@pytest.fixture
+def members(monkeypatch):
+    """Serve the GitHub org and Google Chat space members from dicts instead of the APIs."""
+    github_members = {"goern": "Christoph Görn", "fridex": "Fridolín Pokorný", "nobody": None}
+    chat_members = {"Christoph Görn": "1001", "fridolin pokorny": "1002"}
+
+    async def get_github_members(org):
+        return github_members
+
+    def get_chat_members(space):
+        return chat_members
+
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setattr(identity, "get_github_members", get_github_members)
+    monkeypatch.setattr(identity, "get_chat_members", get_chat_members)
+
+    return github_members, chat_members
+
+
+class TestNormalizeName:
+    """Class to test matching of GitHub and Google Chat names."""
+
+    def test_normalize_name(self):
+        """Test that accents, case, whitespace and punctuation are ignored."""
+        assert normalize_name("Christoph Görn") == "christophgorn"
+        assert normalize_name("christoph  GORN") == "christophgorn"
+        assert normalize_name("Fridolín Pokorný") == normalize_name("Fridolin-Pokorny")
+        assert normalize_name("Goern") != normalize_name("Görn")
+
+
+class TestIdentityDirectory:
+    """Class to test the index from GitHub login to real name and Google Chat user ID."""
+
+    def test_build_index(self):
+        """Test that logins are joined to Chat user IDs by name, live members overriding the seed."""
+        directory = IdentityDirectory(
+            ["thoth-station"], [], realnames={"GoErn": "Christoph Görn"}, chat_user_ids={"Christoph Görn": "1"},
+        )
+
+        index = directory._build_index(
+            {"fridex": "Fridolín Pokorný", "nobody": None}, {"Fridolin Pokorny": "2", "christoph gorn": "3"},
+        )
+
+        assert index["goern"].chat_user_id == "3"
+        assert index["fridex"] == identity.Identity("fridex", "Fridolín Pokorný", "2")
+        assert "nobody" not in index
+
+    def test_build_index_misses(self):
+        """Test that a name differing from the Chat display name gets no Chat user ID."""
+        directory = IdentityDirectory(["thoth-station"], [])
+
+        index = directory._build_index({"harshad16": "Harshad Reddy Nalla"}, {"Harshad": "4"})
+
+        assert index["harshad16"].chat_user_id is None
+
+    def test_build_index_collisions(self):
+        """Test that Chat members sharing a normalized display name are not mapped to anyone."""
+        directory = IdentityDirectory(["thoth-station"], [])
+
+        index = directory._build_index(
+            {"goern": "Christoph Görn", "fridex": "Fridolín Pokorný"},
+            {"Christoph Görn": "1", "christoph gorn": "2", "Fridolin Pokorny": "3", "fridolin-pokorny": "3"},
+        )
+
+        assert index["goern"].chat_user_id is None
+        assert index["fridex"].chat_user_id == "3"
+
+    @pytest.mark.asyncio
+    async def test_refresh(self, members):
+        """Test that a refresh swaps in the index of the current members."""
+        directory = IdentityDirectory(["thoth-station"], ["spaces/a"], realnames={"sesheta": "Sesheta"})
+        github_members, chat_members = members
+
+        await directory.refresh()
+
+        assert directory._index["goern"].chat_user_id == "1001"
+        assert directory._index["fridex"].chat_user_id == "1002"
+        assert directory._index["sesheta"].chat_user_id is None
+        assert directory.realname("unknown") == "unknown"
+
+        del chat_members["Christoph Görn"]
+        github_members["harshad16"] = "Harshad Reddy Nalla"
+        await directory.refresh()
+
+        assert directory.chat_user_id("goern") is None
+        assert directory.realname("Harshad16") == "Harshad Reddy Nalla"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh(self, members, monkeypatch):
+        """Test that a failed refresh keeps the current index and is retried after retry_interval."""
+        directory = IdentityDirectory(["thoth-station"], ["spaces/a"], ttl=3600, retry_interval=60)
+        await directory.refresh()
+
+        def get_chat_members(space):
+            raise ConnectionError("no route to chat.googleapis.com")
+
+        monkeypatch.setattr(identity, "get_chat_members", get_chat_members)
+        await directory.refresh()
+
+        assert directory.chat_user_id("goern") == "1001"
+        assert 3539 <= time.monotonic() - directory._updated_at <= 3541
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's webhook ingestion stage Tests."""
+
+
+import asyncio
+import uuid
+
+import pytest
+
+from octomachinery.app.routing.routers import ConcurrentRouter
+from octomachinery.github.models.events import GitHubWebhookEvent
+
+from aicoe.sesheta.ingestion import IngestionRouter, IngestionStage
+from aicoe.sesheta.scheduler import EventScheduler
+
+
+def _event(action: str, delivery_id=None, number: int = 1) -> GitHubWebhookEvent:
+    return GitHubWebhookEvent(
+        name="pull_request",
+        payload={"action": action, "number": number, "repository": {"full_name": "thoth-station/adviser"}},
+        delivery_id=delivery_id or uuid.uuid4(),
+    )
+
+
+class TestIngestionStage:
+    """Class to test dropping redeliveries and debouncing event storms."""
+
+    @pytest.mark.asyncio
+    async def test_redelivery_is_dropped(self):
+        """Test that a delivery is processed once."""
+        router = ConcurrentRouter()
+        processed = []
+
+        @router.register("pull_request")
+        async def handler(event):
+            processed.append(event.delivery_id)
+
+        ingestion_router = IngestionRouter(router, stage=IngestionStage(window=0), scheduler=EventScheduler())
+        event = _event("opened")
+
+        await ingestion_router.dispatch(event)
+        await ingestion_router.dispatch(event)
+        assert processed == [event.delivery_id]
+
+    @pytest.mark.asyncio
+    async def test_storm_is_debounced(self):
+        """Test that only the last event of a burst is admitted, per Pull Request."""
+        stage = IngestionStage(window=0.05)
+
+        admitted = await asyncio.gather(
+            stage.admit(_event("synchronize")),
+            stage.admit(_event("synchronize")),
+            stage.admit(_event("synchronize", number=2)),
+            stage.admit(_event("opened")),
+        )
+        assert admitted == [False, True, True, True]
+
+    @pytest.mark.asyncio
+    async def test_actions_are_debounced_apart(self):
+        """Test that an event of another action does not drop the held back one."""
+        stage = IngestionStage(window=0.05)
+
+        admitted = await asyncio.gather(
+            stage.admit(_event("synchronize")), stage.admit(_event("labeled")), stage.admit(_event("labeled")),
+        )
+        assert admitted == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_debounced_events_keep_their_place(self):
+        """Test that a later event which is not debounced does not overtake a held back one."""
+        router = ConcurrentRouter()
+        processed = []
+
+        @router.register("pull_request")
+        async def handler(event):
+            processed.append((event.payload["number"], event.payload["action"]))
+
+        ingestion_router = IngestionRouter(router, stage=IngestionStage(window=0.05), scheduler=EventScheduler())
+
+        async def dispatch(action: str, number: int = 1, delay: float = 0.01):
+            await asyncio.sleep(delay)
+            await ingestion_router.dispatch(_event(action, number=number))
+
+        await asyncio.gather(
+            dispatch("synchronize", delay=0),
+            dispatch("synchronize", delay=0.01),
+            dispatch("closed", delay=0.02),
+            dispatch("synchronize", number=2, delay=0.02),
+            dispatch("opened", number=2, delay=0.03),
+        )
+
+        assert [action for number, action in processed if number == 1] == ["synchronize", "closed"]
+        assert [action for number, action in processed if number == 2] == ["synchronize", "opened"]
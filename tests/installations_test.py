@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's installation index Tests."""
+
+
+import asyncio
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aicoe.sesheta.installations import InstallationIndex
+
+
+def _installation(installation_id: int, login: str) -> dict:
+    return {
+        "id": installation_id,
+        "app_id": 42,
+        "app_slug": "sefkhet-abwy",
+        "created_at": "2026-01-01T10:00:00Z",
+        "updated_at": "2026-01-01T10:00:00Z",
+        "account": {"login": login},
+        "events": ["pull_request"],
+        "permissions": {"pull_requests": "write"},
+        "repository_selection": "all",
+        "single_file_name": None,
+        "target_id": installation_id,
+        "target_type": "Organization",
+        "access_tokens_url": f"https://api.github.com/app/installations/{installation_id}/access_tokens",
+        "html_url": f"https://github.com/organizations/{login}/settings/installations/{installation_id}",
+        "repositories_url": "https://api.github.com/installation/repositories",
+        "suspended_at": None,
+        "suspended_by": None,
+        "has_multiple_single_files": False,
+        "single_file_paths": [],
+    }
+
+
+class FakeGitHubAPI:
+    """The client of a GitHub App, listing its installations and handing out access tokens valid for ``lifetime``."""
+
+    def __init__(self, installations: list, lifetime: timedelta = timedelta(hours=1)):
+        """Initialize the client."""
+        self.installations = installations
+        self.lifetime = lifetime
+        self.listed = 0
+        self.tokens = []
+
+    async def getiter(self, url, **kwargs):
+        """List the installations."""
+        self.listed += 1
+        for installation in self.installations:
+            yield installation
+
+    async def post(self, url, **kwargs):
+        """Hand out a new access token, after a while."""
+        self.tokens.append(url)
+        await asyncio.sleep(0.01)
+
+        expires_at = datetime.now(timezone.utc) + self.lifetime
+        return {
+            "token": f"token-{len(self.tokens)}",
+            "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "permissions": {},
+            "repository_selection": "all",
+        }
+
+
+class FakeGitHubApp:
+    """A GitHub App."""
+
+    def __init__(self, installations: list):
+        """Initialize the GitHub App."""
+        self.api_client = FakeGitHubAPI(installations)
+
+
+class TestInstallationIndex:
+    """Class to test looking up installations and their access tokens."""
+
+    @pytest.mark.asyncio
+    async def test_lookup(self):
+        """Test that installations are listed once, and looked up by login."""
+        github_app = FakeGitHubApp([_installation(1, "thoth-station"), _installation(2, "AICoE")])
+        index = InstallationIndex()
+
+        assert (await index.get(github_app, "aicoe")).id == 2
+        assert (await index.get(github_app, "thoth-station")).login == "thoth-station"
+        assert await index.get(github_app, "goern") is None
+        assert github_app.api_client.listed == 1
+
+        await index.apply_installation_event({"action": "deleted", "installation": {"account": {"login": "AICoE"}}})
+        assert await index.get(github_app, "aicoe") is None
+        assert len(index) == 1
+
+        await index.apply_installation_event({"action": "created", "installation": _installation(3, "goern")})
+        assert (await index.get(github_app, "goern")).id == 3
+        assert github_app.api_client.listed == 1
+
+    @pytest.mark.asyncio
+    async def test_token(self):
+        """Test that access tokens are cached, and requested once at a time."""
+        github_app = FakeGitHubApp([_installation(1, "thoth-station")])
+        index = InstallationIndex(refresh_margin=300)
+        installation = await index.get(github_app, "thoth-station")
+
+        tokens = await asyncio.gather(*[index.token(installation.id, installation.installation) for _ in range(5)])
+        assert [str(token) for token in tokens] == ["token-1"] * 5
+        assert github_app.api_client.tokens == [
+            "https://api.github.com/app/installations/1/access_tokens",
+        ]
+
+        await index.close()
+
+    @pytest.mark.asyncio
+    async def test_token_refresh(self):
+        """Test that access tokens are refreshed in the background before they expire, only if they are used."""
+        github_app = FakeGitHubApp([_installation(1, "thoth-station")])
+        github_app.api_client.lifetime = timedelta(seconds=300.2)
+        index = InstallationIndex(refresh_margin=300)
+        installation = await index.get(github_app, "thoth-station")
+
+        assert str(await index.token(installation.id, installation.installation)) == "token-1"
+        assert str(await index.token(installation.id, installation.installation)) == "token-1"
+
+        await asyncio.sleep(0.3)
+        assert len(github_app.api_client.tokens) == 2
+        assert str(await index.token(installation.id, installation.installation)) == "token-2"
+        assert len(github_app.api_client.tokens) == 2
+
+        # token-3 is not used, so it is dropped instead of being refreshed
+        await asyncio.sleep(0.5)
+        assert len(github_app.api_client.tokens) == 3
+        assert not index._tokens
+        assert index._refresher.done()
+
+        assert str(await index.token(installation.id, installation.installation)) == "token-4"
+        await index.close()
+
+    @pytest.mark.asyncio
+    async def test_token_expired(self):
+        """Test that an expired access token is requested again when it is used."""
+        github_app = FakeGitHubApp([_installation(1, "thoth-station")])
+        index = InstallationIndex(refresh_margin=300)
+        installation = await index.get(github_app, "thoth-station")
+
+        assert str(await index.token(installation.id, installation.installation)) == "token-1"
+        await index.close()
+
+        token, _ = index._tokens[installation.id]
+        token.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        assert str(await index.token(installation.id, installation.installation)) == "token-2"
+        assert len(github_app.api_client.tokens) == 2
+        await index.close()
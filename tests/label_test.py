@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's label reconciler Tests."""
+
+
+import pytest
+
+import aicoe.sesheta.actions.label as label
+
+from aicoe.sesheta.actions.label import diff_labels, reconcile_labels
+
+
+class FakeGitHubAPI:
+    """A GitHub API client recording the requests, keeping the labels of a repository and one Pull Request."""
+
+    def __init__(self, repository_labels, labels):
+        """Initialize the client with the labels of the repository and of the Pull Request."""
+        self.ids = {name: f"L_{name}" for name in repository_labels}
+        self.labels = list(labels)
+        self.requests = []
+
+    async def post(self, url, data=None, **kwargs):
+        """Record the request, and answer the label query, the mutation and label creation like GitHub does."""
+        if url != "/graphql":
+            self.requests.append(("create", data["name"]))
+            self.ids[data["name"]] = f"L_{data['name']}"
+            return {"name": data["name"], "node_id": self.ids[data["name"]]}
+
+        variables = data["variables"]
+        if data["query"].lstrip().startswith("query"):
+            self.requests.append(("query", variables["number"]))
+            return {
+                "data": {
+                    "repository": {
+                        "pullRequest": {"id": "PR_7"},
+                        "labels": {
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                            "nodes": [{"id": i, "name": n} for n, i in self.ids.items()],
+                        },
+                    },
+                },
+            }
+
+        names = {i: n for n, i in self.ids.items()}
+        self.requests.append(("mutation", variables.get("add", []), variables.get("remove", [])))
+
+        self.labels = [n for n in self.labels if self.ids[n] not in variables.get("remove", [])]
+        self.labels += [names[i] for i in variables.get("add", []) if names[i] not in self.labels]
+
+        labelable = {"labelable": {"labels": {"nodes": [{"name": n} for n in self.labels]}}}
+        return {"data": {"added" if "add" in variables else "removed": labelable}}
+
+
+def _pull_request(labels) -> dict:
+    return {
+        "html_url": "https://github.com/thoth-station/adviser/pull/7",
+        "url": "https://api.github.com/repos/thoth-station/adviser/pulls/7",
+        "node_id": "PR_7",
+        "labels": [{"name": name} for name in labels],
+    }
+
+
+@pytest.fixture(autouse=True)
+def label_ids(monkeypatch):
+    """Resolve the node ids of the labels in each test."""
+    monkeypatch.setattr(label, "_LABEL_IDS", {})
+
+
+class TestLabelReconciler:
+    """Class to test applying label changes in one request."""
+
+    def test_diff_labels(self):
+        """Test that only actual changes are applied."""
+        assert diff_labels(["size/S", "approved"], add=["approved"], remove=["lgtm"]) is None
+        assert diff_labels(["size/S", "approved"], add=["size/M"], remove=["size/S"]) == (["size/M"], ["size/S"])
+
+    @pytest.mark.asyncio
+    async def test_reconcile_labels(self):
+        """Test that the changes are applied in one request, and nothing is sent if the labels are up to date."""
+        github_api = FakeGitHubAPI(
+            ["size/S", "size/M", "approved", "ok-to-test", "lgtm", "do-not-merge/work-in-progress"],
+            ["size/S", "do-not-merge/work-in-progress"],
+        )
+        pull_request = _pull_request(["size/S", "do-not-merge/work-in-progress"])
+
+        # the node ids of the labels are resolved once
+        assert await reconcile_labels(pull_request, add=["ok-to-test"], github_api=github_api)
+        assert github_api.requests == [("query", 7), ("mutation", ["L_ok-to-test"], [])]
+        github_api.requests.clear()
+
+        assert await reconcile_labels(
+            pull_request,
+            add=["approved", "ok-to-test", "lgtm"],
+            remove=["do-not-merge/work-in-progress", "do-not-merge/needs-rebase"],
+            github_api=github_api,
+        )
+        assert github_api.requests == [("mutation", ["L_approved", "L_lgtm"], ["L_do-not-merge/work-in-progress"])]
+        assert [label["name"] for label in pull_request["labels"]] == ["size/S", "ok-to-test", "approved", "lgtm"]
+
+        assert await reconcile_labels(pull_request, add=["size/M"], remove=["size/S"], github_api=github_api)
+        assert github_api.requests[1:] == [("mutation", ["L_size/M"], ["L_size/S"])]
+
+        assert not await reconcile_labels(pull_request, add=["lgtm"], github_api=github_api)
+        assert len(github_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_keep_labels_added_meanwhile(self):
+        """Test that labels added by someone else since the Pull Request was fetched are kept."""
+        github_api = FakeGitHubAPI(
+            ["size/S", "priority/critical-urgent", "do-not-merge/work-in-progress"],
+            ["size/S", "priority/critical-urgent", "do-not-merge/work-in-progress"],
+        )
+        pull_request = _pull_request(["size/S", "do-not-merge/work-in-progress"])
+
+        assert await reconcile_labels(
+            pull_request, add=["approved"], remove=["do-not-merge/work-in-progress"], github_api=github_api,
+        )
+        assert github_api.requests == [
+            ("query", 7),
+            ("create", "approved"),
+            ("mutation", ["L_approved"], ["L_do-not-merge/work-in-progress"]),
+        ]
+        assert github_api.labels == ["size/S", "priority/critical-urgent", "approved"]
+        assert [label["name"] for label in pull_request["labels"]] == github_api.labels
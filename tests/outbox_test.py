@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's notification outbox Tests."""
+
+
+import asyncio
+import pytest
+
+from aicoe.sesheta.dispatcher import Notification
+from aicoe.sesheta.outbox import Outbox, OutboxDeliveryError, OutboxDrainer
+
+
+def _notification(i: int) -> Notification:
+    return Notification("plain", f"message {i}", f"thread_{i}", "https://github.com/thoth-station/a")
+
+
+class TestOutbox:
+    """Class to test the durable notification outbox."""
+
+    def test_resume_after_restart(self, tmp_path):
+        """Test that undelivered notifications are read again after reopening the outbox."""
+        outbox = Outbox(str(tmp_path))
+        for i in range(5):
+            outbox.append(_notification(i))
+
+        records = outbox.read(2)
+        outbox.commit(records[-1][0], len(records))
+        outbox.close()
+
+        outbox = Outbox(str(tmp_path))
+        assert outbox.pending == 3
+        assert [n.message for _, n in outbox.read()] == ["message 2", "message 3", "message 4"]
+
+    def test_compaction(self, tmp_path):
+        """Test that delivered segments are removed."""
+        outbox = Outbox(str(tmp_path), segment_size=100)
+        for i in range(10):
+            outbox.append(_notification(i))
+        assert len(outbox.segments()) > 2
+
+        records = outbox.read(None)
+        outbox.commit(records[-1][0], len(records))
+
+        assert len(outbox.segments()) <= 2
+        assert outbox.pending == 0
+        assert outbox.read() == []
+
+    @pytest.mark.asyncio
+    async def test_drain_retries_failed_only(self, tmp_path):
+        """Test that only the notification which could not be delivered is delivered again."""
+        outbox = Outbox(str(tmp_path))
+        for i in range(3):
+            outbox.append(_notification(i))
+
+        delivered = []
+        failing = {"message 1"}
+
+        async def deliver(notification):
+            if notification.message in failing:
+                raise ConnectionError("Google Chat is down")
+            delivered.append(notification.message)
+
+        drainer = OutboxDrainer(outbox, deliver, batch_size=10)
+
+        with pytest.raises(OutboxDeliveryError):
+            await drainer.drain_once()
+
+        assert sorted(delivered) == ["message 0", "message 2"]
+        assert outbox.pending == 2
+        assert [n.message for _, n in outbox.read()] == ["message 1", "message 2"]
+
+        failing.clear()
+        assert await drainer.drain_once() == 1
+
+        assert sorted(delivered) == ["message 0", "message 1", "message 2"]
+        assert outbox.pending == 0
+        assert outbox.read() == []
+
+    @pytest.mark.asyncio
+    async def test_drain_merges_threads(self, tmp_path):
+        """Test that notifications of a batch sent to the same thread are delivered as one message."""
+        outbox = Outbox(str(tmp_path))
+        url = "https://github.com/thoth-station/a"
+        outbox.append(Notification("new_pull_request", "opened", "pull_request_a_1", url))
+        outbox.append(Notification("plain", "opened", "pull_request_a_2", url))
+        outbox.append(Notification("plain", "approved", "pull_request_a_1", url))
+
+        delivered = []
+
+        async def deliver(notification):
+            delivered.append(notification)
+
+        assert await OutboxDrainer(outbox, deliver).drain_once() == 3
+
+        assert [(n.kind, n.message) for n in delivered] == [
+            ("new_pull_request", "opened\napproved"),
+            ("plain", "opened"),
+        ]
+        assert outbox.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_run_survives_errors(self, tmp_path):
+        """Test that the drainer keeps running after any error, and notifications appended are coalesced."""
+        outbox = Outbox(str(tmp_path))
+        delivered = []
+        failures = [ValueError("unexpected")]
+
+        async def deliver(notification):
+            if failures:
+                raise failures.pop()
+            delivered.append(notification.message)
+
+        drainer = OutboxDrainer(outbox, deliver, retry_interval=0.01, coalesce_window=0.05)
+
+        outbox.append(_notification(1))
+        drainer.wake()
+        outbox.append(_notification(1)._replace(message="message 1 again"))
+        drainer.wake()
+
+        await asyncio.sleep(0.2)
+
+        assert delivered == ["message 1\nmessage 1 again"]
+        assert not drainer._task.done()
+
+        drainer._task.cancel()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's Pull Request store Tests."""
+
+
+import threading
+
+import pytest
+
+from aicoe.sesheta.actions.pull_request import get_pr_size_label, has_label
+from aicoe.sesheta.pr_store import MemoryPullRequestStore, SQLitePullRequestStore
+
+
+REPOSITORY = {"full_name": "thoth-station/adviser"}
+
+
+def _pull_request(**kwargs) -> dict:
+    pull_request = {
+        "number": 7,
+        "state": "open",
+        "url": "https://api.github.com/repos/thoth-station/adviser/pulls/7",
+        "mergeable": True,
+        "additions": 20,
+        "deletions": 1,
+        "labels": [{"name": "size/S", "color": "ededed"}],
+        "requested_reviewers": [{"login": "fridex"}],
+        "user": {"login": "goern"},
+        "head": {"sha": "abc", "ref": "feature", "repo": REPOSITORY},
+        "base": {"sha": "def", "ref": "master", "repo": REPOSITORY},
+    }
+    pull_request.update(kwargs)
+
+    return pull_request
+
+
+def _stores(tmp_path) -> list:
+    return [MemoryPullRequestStore(), SQLitePullRequestStore(str(tmp_path / "pull_requests.sqlite"))]
+
+
+class TestPullRequestStore:
+    """Class to test the materialized view of the open Pull Requests."""
+
+    @pytest.mark.asyncio
+    async def test_pull_request_events(self, tmp_path):
+        """Test that Pull Requests are stored while open."""
+        for store in _stores(tmp_path):
+            await store.apply_event("pull_request", {"action": "opened", "pull_request": _pull_request()})
+
+            pull_request = await store.get("Thoth-Station/adviser", 7)
+            assert get_pr_size_label(pull_request) == "size/S"
+            assert await store.get_by_url("https://api.github.com/repos/thoth-station/adviser/pulls/7") == pull_request
+            assert len(store) == 1
+
+            await store.apply_event("pull_request", {"action": "closed", "pull_request": _pull_request(state="closed")})
+            assert await store.get("thoth-station/adviser", 7) is None
+            assert len(store) == 0
+
+    @pytest.mark.asyncio
+    async def test_review_and_label_events(self, tmp_path):
+        """Test that reviews are recorded and renamed or deleted labels are updated."""
+        for store in _stores(tmp_path):
+            await store.apply_event("pull_request", {"action": "opened", "pull_request": _pull_request()})
+
+            review_pull_request = _pull_request()
+            del review_pull_request["mergeable"]
+            await store.apply_event(
+                "pull_request_review",
+                {
+                    "action": "submitted",
+                    "review": {"user": {"login": "fridex"}, "state": "APPROVED"},
+                    "pull_request": review_pull_request,
+                },
+            )
+            await store.apply_event(
+                "label",
+                {
+                    "action": "edited",
+                    "label": {"name": "size/small"},
+                    "changes": {"name": {"from": "size/S"}},
+                    "repository": REPOSITORY,
+                },
+            )
+
+            pull_request = await store.get("thoth-station/adviser", 7)
+            assert pull_request["reviews"] == {"fridex": "approved"}
+            assert pull_request["mergeable"]
+            assert has_label(pull_request, "size/small")
+
+    @pytest.mark.asyncio
+    async def test_push_events(self, tmp_path):
+        """Test that pushes to the base or head branch reset mergeable."""
+        for store in _stores(tmp_path):
+            await store.apply_event("pull_request", {"action": "opened", "pull_request": _pull_request()})
+
+            await store.apply_event("push", {"ref": "refs/heads/feature", "after": "123", "repository": REPOSITORY})
+            pull_request = await store.get("thoth-station/adviser", 7)
+            assert pull_request["head"]["sha"] == "123"
+            assert pull_request["mergeable"] is None
+
+    @pytest.mark.asyncio
+    async def test_outdated_writes(self, tmp_path):
+        """Test that a Pull Request older than the stored one is ignored, also when it was closed."""
+        for store in _stores(tmp_path):
+            await store.put(_pull_request(title="WIP: new", updated_at="2026-01-01T10:00:00Z"))
+            await store.put(_pull_request(title="old", updated_at="2026-01-01T11:30:00+02:00"))
+            await store.put(_pull_request(state="closed", updated_at="2026-01-01T09:00:00Z"))
+
+            pull_request = await store.get("thoth-station/adviser", 7)
+            assert pull_request["title"] == "WIP: new"
+
+            await store.put(_pull_request(title="new", updated_at="2026-01-01T10:00:01Z"))
+            assert (await store.get("thoth-station/adviser", 7))["title"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_blocking_store_off_the_loop(self, tmp_path):
+        """Test that the operations of the SQLite store run in the executor, and not on the event loop."""
+        store = SQLitePullRequestStore(str(tmp_path / "pull_requests.sqlite"))
+        threads = []
+
+        load = store._load
+        store._load = lambda *args: threads.append(threading.get_ident()) or load(*args)
+
+        await store.put(_pull_request())
+        assert (await store.get("thoth-station/adviser", 7))["number"] == 7
+
+        assert threads and threading.get_ident() not in threads
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's rebase sweep Tests."""
+
+
+import asyncio
+
+import pytest
+
+import aicoe.sesheta.actions.rebase as rebase
+
+
+def _pull_request(number: int, mergeable: str, base_sha: str, approved: bool = False, gate: str = None) -> dict:
+    contexts = [{"context": "local/check", "state": gate}] if gate else []
+
+    return {
+        "number": number,
+        "url": f"https://github.com/thoth-station/adviser/pull/{number}",
+        "mergeable": mergeable,
+        "reviewDecision": "APPROVED" if approved else "REVIEW_REQUIRED",
+        "baseRefOid": base_sha,
+        "headRefOid": f"head{number}",
+        "labels": {"nodes": []},
+        "commits": {"nodes": [{"commit": {"oid": f"head{number}", "status": {"contexts": contexts}}}]},
+    }
+
+
+class FakeRechecker:
+    """A re-checker recording the checks scheduled, they are run by the test."""
+
+    def __init__(self):
+        """Initialize the re-checker."""
+        self.checks = {}
+
+    def schedule(self, key, check):
+        """Record the check."""
+        self.checks[key] = check
+
+
+class FakeGitHubAPI:
+    """A GitHub API client answering the GraphQL query, a page at a time."""
+
+    def __init__(self, pages: list):
+        """Initialize the client."""
+        self.pages = pages
+        self.cursors = []
+
+    async def post(self, url, data=None, **kwargs):
+        """Answer the query with the page after the cursor."""
+        after = data["variables"]["after"]
+        self.cursors.append(after)
+
+        page = 0 if after is None else int(after)
+        has_next_page = page + 1 < len(self.pages)
+
+        return {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": has_next_page, "endCursor": str(page + 1)},
+                        "nodes": self.pages[page],
+                    },
+                },
+            },
+        }
+
+
+class TestRebaseSweep:
+    """Class to test updating the branches of open Pull Requests after a push."""
+
+    @pytest.mark.asyncio
+    async def test_get_rebase_candidates(self):
+        """Test that all pages are queried, and Pull Requests are prioritized."""
+        github_api = FakeGitHubAPI(
+            [
+                [_pull_request(1, "MERGEABLE", "old"), _pull_request(2, "UNKNOWN", "old", approved=True)],
+                [_pull_request(3, "CONFLICTING", "old", gate="SUCCESS")],
+            ],
+        )
+
+        candidates = await rebase.get_rebase_candidates("thoth-station", "adviser", "master", github_api)
+
+        assert github_api.cursors == [None, "1"]
+        assert [(c.number, c.mergeable, c.priority) for c in candidates] == [(1, True, 2), (2, None, 1), (3, False, 1)]
+
+    @pytest.mark.asyncio
+    async def test_sweep_rebases(self, monkeypatch):
+        """Test that mergeable Pull Requests behind the head are updated, by priority and at most two at a time."""
+        github_api = FakeGitHubAPI(
+            [
+                [
+                    _pull_request(1, "MERGEABLE", "old"),
+                    _pull_request(2, "MERGEABLE", "old", gate="SUCCESS"),
+                    _pull_request(3, "MERGEABLE", "old", approved=True, gate="SUCCESS"),
+                    _pull_request(4, "MERGEABLE", "new", approved=True),
+                    _pull_request(5, "CONFLICTING", "old", approved=True),
+                    _pull_request(6, "UNKNOWN", "old"),
+                ],
+            ],
+        )
+        client = github_api
+        started = []
+        in_flight = []
+
+        async def trigger_update_branch(owner, repo, pull_request, github_api=None):
+            assert github_api is client
+            started.append(pull_request)
+            in_flight.append(pull_request)
+            assert len(in_flight) <= 2
+
+            await asyncio.sleep(0.01)
+            in_flight.remove(pull_request)
+
+            return pull_request != 1
+
+        rechecker = FakeRechecker()
+        monkeypatch.setattr(rebase, "trigger_update_branch", trigger_update_branch)
+        monkeypatch.setattr(rebase, "get_mergeability_rechecker", lambda: rechecker)
+
+        updated = await rebase.sweep_rebases("thoth-station", "adviser", "master", "new", github_api, concurrency=2)
+
+        assert started == [3, 2, 1]
+        assert updated == [3, 2]
+        assert list(rechecker.checks) == [("rebase_sweep", "thoth-station/adviser", "master")]
+
+    @pytest.mark.asyncio
+    async def test_sweep_rebases_unknown(self, monkeypatch):
+        """Test that Pull Requests GitHub does not know to be mergeable yet are updated once they are."""
+        github_api = FakeGitHubAPI([[_pull_request(1, "UNKNOWN", "old"), _pull_request(2, "UNKNOWN", "old")]])
+        started = []
+
+        async def trigger_update_branch(owner, repo, pull_request, github_api=None):
+            started.append(pull_request)
+            return True
+
+        rechecker = FakeRechecker()
+        monkeypatch.setattr(rebase, "trigger_update_branch", trigger_update_branch)
+        monkeypatch.setattr(rebase, "get_mergeability_rechecker", lambda: rechecker)
+
+        assert await rebase.sweep_rebases("thoth-station", "adviser", "master", "new", github_api) == []
+        assert started == []
+
+        check = rechecker.checks[("rebase_sweep", "thoth-station/adviser", "master")]
+        assert await check() is None
+
+        github_api.pages = [[_pull_request(1, "MERGEABLE", "old"), _pull_request(2, "UNKNOWN", "old")]]
+        assert await check() is None
+        assert started == [1]
+
+        github_api.pages = [[_pull_request(1, "UNKNOWN", "new"), _pull_request(2, "CONFLICTING", "old")]]
+        assert await check() == [1]
+        assert started == [1]
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's mergeability re-checker Tests."""
+
+
+import asyncio
+import contextvars
+
+import pytest
+
+import aicoe.sesheta.actions.pull_request as pull_request
+import aicoe.sesheta.recheck as recheck
+
+from aicoe.sesheta.recheck import MergeabilityRechecker
+
+
+_INSTALLATION = contextvars.ContextVar("installation")
+
+
+def _rechecker(**kwargs) -> MergeabilityRechecker:
+    return MergeabilityRechecker(tick=0.001, slots=8, base_delay=0.001, max_delay=0.004, **kwargs)
+
+
+class TestMergeabilityRechecker:
+    """Class to test re-checking Pull Requests with backoff, using a timer wheel."""
+
+    def test_delay(self):
+        """Test that the delay doubles with each attempt, up to the maximum."""
+        rechecker = MergeabilityRechecker(base_delay=2, max_delay=60)
+
+        assert [rechecker.delay(attempt) for attempt in range(7)] == [2, 4, 8, 16, 32, 60, 60]
+
+    @pytest.mark.asyncio
+    async def test_retried_until_known(self):
+        """Test that a check is retried while it returns None, in the context it was scheduled in."""
+        rechecker = _rechecker()
+        attempts = []
+
+        async def check():
+            attempts.append(_INSTALLATION.get())
+            return True if len(attempts) == 3 else None
+
+        _INSTALLATION.set(42)
+
+        assert await rechecker.schedule(("adviser", 1), check) is True
+        assert attempts == [42, 42, 42]
+        assert rechecker.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesced_and_capped(self):
+        """Test that pending checks of a key are coalesced, and checks beyond the cap are dropped."""
+        rechecker = _rechecker(max_pending=2, max_attempts=2)
+        calls = []
+
+        def check(name: str):
+            async def run():
+                calls.append(name)
+                return name
+
+            return run
+
+        first = rechecker.schedule(("adviser", 1), check("first"))
+        second = rechecker.schedule(("adviser", 1), check("second"))
+        other = rechecker.schedule(("adviser", 2), check("other"))
+        dropped = rechecker.schedule(("adviser", 3), check("dropped"))
+
+        assert first is second
+        assert rechecker.pending == 2
+        assert await dropped is None
+        assert await asyncio.gather(first, other) == ["second", "other"]
+        assert sorted(calls) == ["other", "second"]
+
+    @pytest.mark.asyncio
+    async def test_gives_up(self):
+        """Test that a check which stays unknown is given up after the maximum number of attempts."""
+        rechecker = _rechecker(max_attempts=3)
+        attempts = []
+
+        async def check():
+            attempts.append(None)
+
+        assert await rechecker.schedule(("adviser", 1), check) is None
+        assert len(attempts) == 3
+
+    @pytest.mark.asyncio
+    async def test_long_delays(self):
+        """Test that checks due after more than one turn of the wheel wait for it."""
+        rechecker = MergeabilityRechecker(tick=0.001, slots=2, base_delay=0.005, max_attempts=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def check():
+            return loop.time() - started
+
+        assert await rechecker.schedule(("adviser", 1), check) >= 0.005
+
+    @pytest.mark.asyncio
+    async def test_scheduled_while_draining(self, monkeypatch):
+        """Test that a check scheduled while the last attempts are awaited is attempted."""
+        rechecker = _rechecker()
+        scheduled = []
+        gather = asyncio.gather
+
+        async def known():
+            return True
+
+        def gather_and_schedule(*aws, **kwargs):
+            if not scheduled:
+                scheduled.append(rechecker.schedule(("adviser", 2), known))
+
+            return gather(*aws, **kwargs)
+
+        monkeypatch.setattr(recheck.asyncio, "gather", gather_and_schedule)
+
+        assert await rechecker.schedule(("adviser", 1), known) is True
+        await asyncio.wait_for(rechecker._task, timeout=1)
+
+        assert await asyncio.wait_for(scheduled[0], timeout=1) is True
+        assert rechecker.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_merge_master_gives_up(self, monkeypatch):
+        """Test that merging the master into a Pull Request fails if the re-check gives up."""
+        rechecker = _rechecker(max_attempts=2)
+
+        async def unknown(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(pull_request, "_merge_master_into_pullrequest_once", unknown)
+        monkeypatch.setattr(pull_request, "get_mergeability_rechecker", lambda: rechecker)
+
+        assert await pull_request.merge_master_into_pullrequest("thoth-station", "adviser", 7) is False
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's event scheduler Tests."""
+
+
+import asyncio
+
+import pytest
+
+from aicoe.sesheta.scheduler import EventScheduler, scheduling_key
+
+
+class TestEventScheduler:
+    """Class to test running events concurrently, but ordered per Pull Request."""
+
+    def test_scheduling_key(self):
+        """Test that events are keyed by repository and Pull Request."""
+        repository = {"full_name": "Thoth-Station/adviser"}
+
+        assert scheduling_key("pull_request", {"number": 1, "repository": repository}) == ("thoth-station/adviser", 1)
+        assert scheduling_key("issue_comment", {"issue": {"number": 2}, "repository": repository})[1] == 2
+        assert scheduling_key("push", {"repository": repository}) is None
+
+    @pytest.mark.asyncio
+    async def test_ordered_per_key(self):
+        """Test that jobs of a key run one after the other, and jobs of other keys meanwhile."""
+        scheduler = EventScheduler(max_in_flight=4)
+        log = []
+
+        def job(name: str, delay: float):
+            async def run():
+                log.append(f"start {name}")
+                await asyncio.sleep(delay)
+                log.append(f"end {name}")
+                return name
+
+            return run
+
+        results = await asyncio.gather(
+            scheduler.run(("adviser", 1), job("a1", 0.02)),
+            scheduler.run(("adviser", 1), job("a2", 0.0)),
+            scheduler.run(("adviser", 2), job("b1", 0.01)),
+        )
+
+        assert results == ["a1", "a2", "b1"]
+        assert log.index("end a1") < log.index("start a2")
+        assert log.index("start b1") < log.index("end a1")
+        assert scheduler.pending == 0
+        assert scheduler.queue_length(("adviser", 1)) == 0
+
+    @pytest.mark.asyncio
+    async def test_bounded(self):
+        """Test that at most max_in_flight jobs run, and submissions wait for room."""
+        scheduler = EventScheduler(max_in_flight=2, max_pending=3)
+        running = []
+        peak = []
+
+        async def job():
+            running.append(None)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        await asyncio.gather(*(scheduler.run(None, job) for _ in range(10)))
+
+        assert max(peak) == 2
+        assert len(peak) == 10
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's fast-ack webhook server Tests."""
+
+
+import asyncio
+import types
+import uuid
+
+import aiohttp
+import pytest
+
+from aiohttp import web
+
+from aicoe.sesheta.server import WebhookQueue
+
+
+class TestWebhookQueue:
+    """Class to test acknowledging webhooks before processing them."""
+
+    @pytest.mark.asyncio
+    async def test_fast_ack(self, monkeypatch):
+        """Test that a delivery is acknowledged with 202 before its handlers have run."""
+        processed = asyncio.Event()
+
+        async def route_github_event(*, github_event, github_app):
+            await asyncio.sleep(0.1)
+            processed.set()
+
+        monkeypatch.setattr("aicoe.sesheta.server.route_github_event", route_github_event)
+
+        webhook_queue = WebhookQueue(github_app=None, max_in_flight=2)
+        webhook_queue.start()
+
+        app = web.Application()
+        app.router.add_post("/", webhook_queue.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                response = await session.post(
+                    f"http://127.0.0.1:{port}/",
+                    json={"zen": "Keep it logically awesome."},
+                    headers={"X-GitHub-Event": "ping", "X-GitHub-Delivery": str(uuid.uuid4())},
+                )
+
+                assert response.status == 202
+                assert not processed.is_set()
+
+            await asyncio.wait_for(processed.wait(), timeout=5)
+        finally:
+            await runner.cleanup()
+            await webhook_queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, monkeypatch):
+        """Test that slow events do not hold up the queue beyond the bound of events in flight."""
+        running = []
+        release = asyncio.Event()
+
+        async def route_github_event(*, github_event, github_app):
+            running.append(github_event)
+            await release.wait()
+
+        monkeypatch.setattr("aicoe.sesheta.server.route_github_event", route_github_event)
+
+        webhook_queue = WebhookQueue(github_app=None, max_in_flight=3)
+        webhook_queue.start()
+
+        try:
+            for i in range(5):
+                await webhook_queue._queue.put((types.SimpleNamespace(name="ping", delivery_id=i), 0.0))
+            await asyncio.sleep(0.05)
+
+            assert len(running) == 3
+            assert webhook_queue.in_flight == 3
+            assert webhook_queue.qsize == 1
+
+            release.set()
+            await asyncio.wait_for(webhook_queue._queue.join(), timeout=5)
+
+            assert len(running) == 5
+            assert webhook_queue.in_flight == 0
+        finally:
+            await webhook_queue.stop()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's Pull Request snapshot Tests."""
+
+
+import uuid
+import pytest
+
+from octomachinery.app.runtime.context import RUNTIME_CONTEXT
+from octomachinery.github.models.events import GitHubWebhookEvent
+
+from aicoe.sesheta.actions.label import do_not_merge
+from aicoe.sesheta.actions.snapshot import get_pull_request_snapshot
+from aicoe.sesheta.pr_store import MemoryPullRequestStore
+
+
+PR_URL = "https://api.github.com/repos/thoth-station/adviser/pulls/1"
+
+
+class FakeGitHubAPI:
+    """A GitHub API client counting the requests."""
+
+    def __init__(self, pull_request: dict):
+        """Initialize the client, each GET returns the Pull Request."""
+        self.pull_request = pull_request
+        self.requests = []
+
+    async def getitem(self, url, **kwargs):
+        """Record the request."""
+        self.requests.append(url)
+        return dict(self.pull_request)
+
+
+def start_delivery(payload: dict) -> FakeGitHubAPI:
+    """Put a new webhook delivery and a fake GitHub API client into the runtime context."""
+    github_api = FakeGitHubAPI(
+        {
+            "url": PR_URL,
+            "number": 1,
+            "state": "open",
+            "mergeable": True,
+            "labels": [{"name": "do-not-merge/hold"}],
+            "head": {"sha": "abc", "ref": "feature", "repo": {"full_name": "thoth-station/adviser"}},
+            "base": {"sha": "def", "ref": "master", "repo": {"full_name": "thoth-station/adviser"}},
+        },
+    )
+
+    RUNTIME_CONTEXT.github_event = GitHubWebhookEvent(name="issue_comment", payload=payload, delivery_id=uuid.uuid4())
+    RUNTIME_CONTEXT.app_installation_client = github_api
+
+    return github_api
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch):
+    """Use an empty Pull Request store for each test."""
+    store = MemoryPullRequestStore()
+    monkeypatch.setattr("aicoe.sesheta.actions.snapshot.get_pull_request_store", lambda: store)
+
+    return store
+
+
+class TestPullRequestSnapshot:
+    """Class to test sharing the Pull Request between actions."""
+
+    @pytest.mark.asyncio
+    async def test_fetched_once_per_delivery(self):
+        """Test that all actions of a delivery share one GET of the Pull Request."""
+        github_api = start_delivery({"action": "created"})
+
+        assert await get_pull_request_snapshot(PR_URL)
+        assert await do_not_merge(PR_URL)
+        assert github_api.requests == [PR_URL]
+
+    @pytest.mark.asyncio
+    async def test_store_is_used(self, store):
+        """Test that a later delivery gets the Pull Request from the store, unless a required field is missing."""
+        start_delivery({"action": "created"})
+        await get_pull_request_snapshot(PR_URL)
+
+        github_api = start_delivery({"action": "created"})
+        assert await do_not_merge(PR_URL)
+        assert github_api.requests == []
+
+        await store.apply_event(
+            "push",
+            {"ref": "refs/heads/master", "after": "123", "repository": {"full_name": "thoth-station/adviser"}},
+        )
+        github_api = start_delivery({"action": "created"})
+        assert (await get_pull_request_snapshot(PR_URL))["mergeable"] is None
+        assert (await get_pull_request_snapshot(PR_URL, require=("mergeable",)))["mergeable"]
+        assert github_api.requests == [PR_URL]
+
+    @pytest.mark.asyncio
+    async def test_payload_is_used(self):
+        """Test that the Pull Request of the payload is used if it has the required fields."""
+        github_api = start_delivery({"pull_request": {"url": PR_URL, "mergeable": None, "labels": []}})
+
+        assert (await get_pull_request_snapshot(PR_URL))["labels"] == []
+        assert github_api.requests == []
+
+        assert (await get_pull_request_snapshot(PR_URL, require=("mergeable",)))["mergeable"]
+        assert github_api.requests == [PR_URL]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's commit status index Tests."""
+
+
+from aicoe.sesheta.status_index import CommitStatusIndex
+
+
+REPOSITORY = {"full_name": "thoth-station/adviser"}
+
+
+class TestCommitStatusIndex:
+    """Class to test the commit status index."""
+
+    def test_status_events(self):
+        """Test that the latest state wins, even if the webhooks arrive out of order."""
+        index = CommitStatusIndex()
+
+        for state, updated_at in [("success", "2026-01-01T10:05:00Z"), ("pending", "2026-01-01T10:00:00Z")]:
+            index.update_from_status_event(
+                {
+                    "repository": REPOSITORY,
+                    "sha": "abc",
+                    "context": "local/check",
+                    "state": state,
+                    "updated_at": updated_at,
+                },
+            )
+
+        assert index.get("Thoth-Station/adviser", "abc", "local/check") == "success"
+        assert index.get("thoth-station/adviser", "abc", "ci/other") is None
+        assert index.get("thoth-station/adviser", "def", "local/check") is None
+
+    def test_check_run_events(self):
+        """Test that check runs are indexed by name, with their conclusion mapped to a state."""
+        index = CommitStatusIndex()
+        check_run = {"name": "local/check", "head_sha": "abc", "status": "in_progress", "started_at": "2026-01-01"}
+
+        index.update_from_check_run_event({"repository": REPOSITORY, "check_run": check_run})
+        assert index.get("thoth-station/adviser", "abc", "local/check") == "pending"
+
+        check_run.update({"status": "completed", "conclusion": "timed_out", "completed_at": "2026-01-02"})
+        index.update_from_check_run_event({"repository": REPOSITORY, "check_run": check_run})
+        assert index.get("thoth-station/adviser", "abc", "local/check") == "failure"
+
+    def test_lru(self):
+        """Test that the least recently used commit is evicted."""
+        index = CommitStatusIndex(max_commits=2)
+
+        index.update("thoth-station/adviser", "a", "local/check", "success")
+        index.update("thoth-station/adviser", "b", "local/check", "success")
+        assert index.get("thoth-station/adviser", "a", "local/check") == "success"
+        index.update("thoth-station/adviser", "c", "local/check", "success")
+
+        assert len(index) == 2
+        assert index.get("thoth-station/adviser", "b", "local/check") is None
+        assert index.get("thoth-station/adviser", "a", "local/check") == "success"
+
+    def test_timestamps_with_timezones(self):
+        """Test that timestamps are compared as points in time, not as strings."""
+        index = CommitStatusIndex()
+
+        index.update("thoth-station/adviser", "abc", "local/check", "success", "2026-01-01T10:30:00+02:00")
+        index.update("thoth-station/adviser", "abc", "local/check", "failure", "2026-01-01T09:00:00Z")
+        assert index.get("thoth-station/adviser", "abc", "local/check") == "failure"
+
+        index.update("thoth-station/adviser", "abc", "local/check", "pending", "2026-01-01T08:45:00Z")
+        assert index.get("thoth-station/adviser", "abc", "local/check") == "failure"
+
+    def test_polled_pending_not_recorded(self):
+        """Test that only final states polled from the API are recorded."""
+        index = CommitStatusIndex()
+
+        index.update_from_combined_status(
+            "thoth-station/adviser",
+            {
+                "sha": "abc",
+                "statuses": [
+                    {"context": "local/check", "state": "pending", "updated_at": "2026-01-01T10:00:00Z"},
+                    {"context": "ci/other", "state": "success", "updated_at": "2026-01-01T10:00:00Z"},
+                ],
+            },
+        )
+        index.update_from_status_contexts(
+            "thoth-station/adviser", "def", [{"context": "local/check", "state": "PENDING", "createdAt": None}],
+        )
+
+        assert index.get("thoth-station/adviser", "abc", "local/check") is None
+        assert index.get("thoth-station/adviser", "abc", "ci/other") == "success"
+        assert index.get("thoth-station/adviser", "def", "local/check") is None
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# sesheta-actions
+# Copyright(C) 2026 The Authors of Project Thoth
+#
+# This program is free software: you can redistribute it and / or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sesheta's title classification Tests."""
+
+
+import json
+import os
+
+import pytest
+
+from aicoe.sesheta.title_rules import TitleClassifier, TitleRule, classify_title
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+
+
+class TestTitleClassifier:
+    """Class to test classifying titles using the rule table."""
+
+    @pytest.mark.parametrize(
+        "title,categories",
+        [
+            (
+                "Automatic update of dependency thoth-common from 0.10.0 to 0.10.1",
+                {"automatic", "automatic_update", "automatic_dependency_update"},
+            ),
+            ("Automatic dependency re-locking", {"automatic", "dependency_relock"}),
+            ("Release of version 0.6.0", {"release", "release_version"}),
+            ("Bump version of adviser in STAGE", {"version_bump_stage"}),
+            ("Bump version of adviser in PROD", set()),
+            ("bounce DNM", {"work_in_progress"}),
+            ("Failed to update dependencies to their latest version", {"failed_dependency_update"}),
+        ],
+    )
+    def test_classify_title(self, title, categories):
+        """Test that a title gets the categories of all matching rules."""
+        assert classify_title(title) == categories
+
+    def test_fixtures(self):
+        """Test the titles of the Pull Request fixtures."""
+        for fixture, work_in_progress in [("pull_request_2.json", True), ("pull_request_150.json", False)]:
+            with open(os.path.join(FIXTURES, fixture)) as f:
+                title = json.load(f)["title"]
+
+            assert ("work_in_progress" in classify_title(title)) == work_in_progress
+
+    def test_rule_table(self):
+        """Test that rules of the same prefix, suffix and markers are combined."""
+        classifier = TitleClassifier(
+            [
+                TitleRule("hotfix", prefix="Hotfix"),
+                TitleRule("hotfix_stage", prefix="hotfix", suffix="stage", ignore_case=True),
+                TitleRule("urgent", markers=("urgent", "asap")),
+            ],
+        )
+
+        assert classifier.classify("Hotfix for the stage") == {"hotfix", "hotfix_stage"}
+        assert classifier.classify("HOTFIX ASAP") == {"urgent"}